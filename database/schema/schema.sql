@@ -2,7 +2,7 @@
 
 -- Drop tables if they exist to ensure a clean slate
 -- CASCADE é usado para remover automaticamente objetos que dependem das tabelas que estão sendo descartadas (por exemplo, chaves estrangeiras)
-DROP TABLE IF EXISTS pokemon_types, pokemon_abilities, pokemon_egg_groups, pokemon_weaknesses, evolution_chains, pokemons, species, stats, abilities, generations, regions, types, egg_groups CASCADE;
+DROP TABLE IF EXISTS pokemon_cards, evolution_edges, pokemon_types, pokemon_abilities, pokemon_egg_groups, pokemon_weaknesses, type_effectiveness, evolution_chains, pokemons, species, stats, abilities, generations, regions, types, egg_groups CASCADE;
 
 -- Table: regions
 CREATE TABLE regions (
@@ -17,6 +17,16 @@ CREATE TABLE types (
     color VARCHAR(7)
 );
 
+-- Table: type_effectiveness (multiplicador de dano do tipo atacante contra o defensor; ausente = 1)
+CREATE TABLE type_effectiveness (
+    attacking_type_id BIGINT,
+    defending_type_id BIGINT,
+    multiplier NUMERIC(3, 2) NOT NULL, -- 0 (imune), 0.5 ou 2
+    PRIMARY KEY (attacking_type_id, defending_type_id),
+    FOREIGN KEY (attacking_type_id) REFERENCES types(id),
+    FOREIGN KEY (defending_type_id) REFERENCES types(id)
+);
+
 -- Table: egg_groups
 CREATE TABLE egg_groups (
     id BIGINT PRIMARY KEY,
@@ -124,7 +134,60 @@ CREATE TABLE pokemon_egg_groups (
 CREATE TABLE pokemon_weaknesses (
     pokemon_id BIGINT,
     type_id BIGINT,
+    multiplier NUMERIC(3, 2), -- Dano recebido do tipo (2 ou 4), calculado pela type_effectiveness
     PRIMARY KEY (pokemon_id, type_id),
     FOREIGN KEY (pokemon_id) REFERENCES pokemons(id),
     FOREIGN KEY (type_id) REFERENCES types(id)
 );
+
+-- Table: evolution_edges (cadeias de evolution_chains achatadas em arestas pelo gerador de seeds)
+CREATE TABLE evolution_edges (
+    evolution_chain_id BIGINT NOT NULL,
+    from_pokemon_id BIGINT NOT NULL,
+    to_pokemon_id BIGINT NOT NULL,
+    condition_type VARCHAR(50),
+    condition_value VARCHAR(255),
+    condition_description VARCHAR(255),
+    depth INT NOT NULL, -- Profundidade de to_pokemon_id na cadeia (1 = primeira evolução)
+    PRIMARY KEY (from_pokemon_id, to_pokemon_id), -- Também atende "em que X evolui"
+    FOREIGN KEY (evolution_chain_id) REFERENCES evolution_chains(id),
+    FOREIGN KEY (from_pokemon_id) REFERENCES pokemons(id),
+    FOREIGN KEY (to_pokemon_id) REFERENCES pokemons(id)
+);
+
+-- "De quem X evolui"
+CREATE INDEX idx_evolution_edges_to_pokemon ON evolution_edges (to_pokemon_id);
+
+-- "Linha evolutiva completa de X": todas as arestas da cadeia, por profundidade
+CREATE INDEX idx_evolution_edges_chain ON evolution_edges (evolution_chain_id, depth);
+
+-- Table: pokemon_cards (modelo de leitura desnormalizado, montado pelo gerador de seeds: uma linha
+-- por pokémon com tipos, habilidades, grupos de ovos, stats, espécie e sprites, lida sem joins)
+CREATE TABLE pokemon_cards (
+    pokemon_id BIGINT PRIMARY KEY,
+    number VARCHAR(10),
+    name VARCHAR(255) NOT NULL,
+    description TEXT,
+    height NUMERIC(5, 2),
+    weight NUMERIC(6, 2),
+    generation_id BIGINT,
+    region_id BIGINT,
+    species_en VARCHAR(255),
+    species_pt VARCHAR(255),
+    image_url TEXT, -- Arte oficial (ou sprite frontal padrão) usada no card
+    sprites JSONB,
+    types JSONB NOT NULL, -- [{"id", "name", "color"}] na ordem de type_ids
+    abilities JSONB NOT NULL, -- [{"id", "name", "description", "is_hidden"}]
+    egg_groups JSONB NOT NULL, -- [{"id", "name"}]
+    total INT,
+    hp INT,
+    attack INT,
+    defense INT,
+    sp_atk INT,
+    sp_def INT,
+    speed INT,
+    FOREIGN KEY (pokemon_id) REFERENCES pokemons(id)
+);
+
+-- Listagem na ordem da Pokédex
+CREATE INDEX idx_pokemon_cards_number ON pokemon_cards (number);
@@ -1,6 +1,6 @@
 -- init-data.sql
 -- Arquivo gerado automaticamente a partir dos JSONs de dados
--- Gerado em: 2026-01-17T14:36:59.409832
+-- Gerado em: 2026-10-17T13:09:36.559835
 
 -- Início da carga de dados
 
@@ -36,6 +36,128 @@ INSERT INTO types (id, name, color) VALUES (16, 'Sombrio', '#705746');
 INSERT INTO types (id, name, color) VALUES (17, 'Aço', '#B7B7CE');
 INSERT INTO types (id, name, color) VALUES (18, 'Fada', '#D685AD');
 
+-- Dados da tabela: type_effectiveness (origem: 11_type_effectiveness.json)
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (1, 13, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (1, 14, 0.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (1, 17, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (2, 2, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (2, 3, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (2, 5, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (2, 6, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (2, 12, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (2, 13, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (2, 15, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (2, 17, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (3, 2, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (3, 3, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (3, 5, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (3, 9, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (3, 13, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (3, 15, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (4, 3, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (4, 4, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (4, 5, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (4, 9, 0.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (4, 10, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (4, 15, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (5, 2, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (5, 3, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (5, 5, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (5, 8, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (5, 9, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (5, 10, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (5, 12, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (5, 13, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (5, 15, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (5, 17, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (6, 2, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (6, 3, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (6, 5, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (6, 6, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (6, 9, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (6, 10, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (6, 15, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (6, 17, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (7, 1, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (7, 6, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (7, 8, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (7, 10, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (7, 11, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (7, 12, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (7, 13, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (7, 14, 0.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (7, 16, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (7, 17, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (7, 18, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (8, 5, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (8, 8, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (8, 9, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (8, 13, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (8, 14, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (8, 17, 0.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (8, 18, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (9, 2, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (9, 4, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (9, 5, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (9, 8, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (9, 10, 0.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (9, 12, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (9, 13, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (9, 17, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (10, 4, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (10, 5, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (10, 7, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (10, 12, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (10, 13, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (10, 17, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (11, 7, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (11, 8, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (11, 11, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (11, 16, 0.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (11, 17, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (12, 2, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (12, 5, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (12, 7, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (12, 8, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (12, 10, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (12, 11, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (12, 14, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (12, 16, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (12, 17, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (12, 18, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (13, 2, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (13, 6, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (13, 7, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (13, 9, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (13, 10, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (13, 12, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (13, 17, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (14, 1, 0.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (14, 11, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (14, 14, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (14, 16, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (15, 15, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (15, 17, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (15, 18, 0.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (16, 7, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (16, 11, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (16, 14, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (16, 16, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (16, 18, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (17, 2, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (17, 3, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (17, 4, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (17, 6, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (17, 13, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (17, 17, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (17, 18, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (18, 2, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (18, 7, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (18, 8, 0.5);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (18, 15, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (18, 16, 2.0);
+INSERT INTO type_effectiveness (attacking_type_id, defending_type_id, multiplier) VALUES (18, 17, 0.5);
+
 -- Dados da tabela: egg_groups (origem: 03_egg_group.json)
 INSERT INTO egg_groups (id, name) VALUES (1, 'Amorfo');
 INSERT INTO egg_groups (id, name) VALUES (2, 'Inseto');
@@ -1033,219 +1155,277 @@ INSERT INTO evolution_chains (id, chain_data) VALUES (10, '{"pokemon": {"id": 17
 
 -- Dados da tabela: pokemons (origem: 09_pokemon.json)
 INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (1, '0001', 'Bulbasaur', 0.7, 6.9, 'Por um tempo após seu nascimento, ele usa os nutrientes armazenados na semente em suas costas para crescer.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/1.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/1.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/1.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/1.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/1.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/1.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/1.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/1.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/1.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/1.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/1.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/1.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 1, 1, 1, 1, 1);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (2, '0002', 'Ivysaur', 1.0, 13.0, 'Quando o bulbo nas suas costas fica grande, parece que ele perde a capacidade de ficar de pé sobre duas pernas.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/2.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/2.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/2.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/2.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/2.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/2.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/2.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/2.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/2.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/2.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/2.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/2.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/2.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 2, 1, 2, 1, 1);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (3, '0003', 'Venusaur', 2.0, 100.0, 'A flor nas suas costas floresce quando absorve a luz solar. A floração libera um aroma que acalma as emoções das pessoas.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/3.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/3.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/3.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/3.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/3.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/3.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/3.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/3.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/3.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/3.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/3.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/3.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/3.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 3, 1, 3, 1, 1);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (4, '0003', 'Mega Venusaur', 2.4, 155.5, 'A flor nas suas costas floresce quando absorve a luz solar. A floração libera um aroma que acalma as emoções das pessoas.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/3-mega.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/3-mega.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/3-mega.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/3-mega.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/3.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/3.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/3.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/3.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/3.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/3.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/3.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/3.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/3.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 4, 6, 3, 1, 1);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (5, '0004', 'Charmander', 0.6, 8.5, 'A chama na ponta da sua cauda indica a sua força vital. Se estiver saudável, a chama arde vigorosamente.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/4.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/4.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/4.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/4.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/4.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/4.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/4.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/4.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/4.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/4.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/4.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/4.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/4.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 5, 1, 4, 1, 2);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (6, '0005', 'Charmeleon', 1.1, 19.0, 'Ele ataca implacavelmente usando suas garras afiadas. Seus inimigos recuam diante do brilho de suas garras.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/5.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/5.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/5.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/5.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/5.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/5.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/5.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/5.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/5.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/5.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/5.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/5.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/5.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 6, 1, 5, 1, 2);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (7, '0006', 'Charizard', 1.7, 90.5, 'Charizard voa pelo céu em busca de oponentes fortes. Ele cospe fogo tão quente que derrete qualquer coisa.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/6.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/6.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/6.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/6.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/6.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/6.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/6.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/6.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/6.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/6.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/6.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/6.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/6.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 7, 1, 6, 1, 2);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (8, '0006', 'Mega Charizard X', 1.7, 110.5, 'Charizard voa pelo céu em busca de oponentes fortes. Ele cospe fogo tão quente que derrete qualquer coisa.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/6-mega-x.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/6-mega-x.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/6-mega-x.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/6-mega-x.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/6.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/6.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/6.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/6.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/6.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/6.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/6.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/6.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/6.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 8, 6, 6, 1, 2);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (9, '0006', 'Mega Charizard Y', 1.7, 100.5, 'Charizard voa pelo céu em busca de oponentes fortes. Ele cospe fogo tão quente que derrete qualquer coisa.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/6-mega-y.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/6-mega-y.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/6-mega-y.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/6-mega-y.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/6.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/6.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/6.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/6.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/6.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/6.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/6.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/6.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/6.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 9, 6, 6, 1, 2);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (10, '0007', 'Squirtle', 0.5, 9.0, 'Quando retrai seu longo pescoço para dentro de sua concha, ele jorra água com força prodigiosa.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/7.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/7.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/7.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/7.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/7.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/7.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/7.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/7.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/7.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/7.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/7.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/7.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/7.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 10, 1, 7, 1, 3);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (11, '0008', 'Wartortle', 1.0, 22.5, 'Sua cauda grande e peluda é um símbolo de longevidade, tornando-o popular entre as pessoas idosas.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/8.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/8.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/8.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/8.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/8.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/8.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/8.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/8.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/8.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/8.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/8.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/8.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/8.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 11, 1, 8, 1, 3);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (12, '0009', 'Blastoise', 1.6, 85.5, 'Seus jatos de água que se projetam de sua concha possuem um poder de impacto que pode perfurar até mesmo o aço mais grosso.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/9.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/9.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/9.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/9.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/9.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/9.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/9.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/9.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/9.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/9.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/9.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/9.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/9.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 12, 1, 9, 1, 3);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (13, '0009', 'Mega Blastoise', 1.6, 101.1, 'Seus jatos de água que se projetam de sua concha possuem um poder de impacto que pode perfurar até mesmo o aço mais grosso.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/9-mega.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/9-mega.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/9-mega.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/9-mega.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/9.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/9.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/9.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/9.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/9.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/9.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/9.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/9.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/9.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 13, 6, 9, 1, 3);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (14, '0010', 'Caterpie', 0.3, 2.9, 'Para se proteger, ele libera um cheiro horrível de suas antenas. Tem um apetite voraz.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/10.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/10.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/10.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/10.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/10.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/10.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/10.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/10.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/10.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/10.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/10.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/10.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/10.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 14, 1, 10, 1, 4);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (15, '0011', 'Metapod', 0.7, 9.9, 'Seu corpo é envolto em uma casca dura como aço. Ele se prepara para sua evolução dentro da casca.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/11.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/11.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/11.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/11.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/11.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/11.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/11.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/11.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/11.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/11.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/11.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/11.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/11.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 15, 1, 11, 1, 4);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (16, '0012', 'Butterfree', 1.1, 32.0, 'Adora o néctar das flores. Ele pode localizar flores que possuem até mesmo a menor quantidade de pólen.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/12.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/12.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/12.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/12.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/12.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/12.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/12.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/12.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/12.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/12.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/12.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/12.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/12.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 16, 1, 12, 1, 4);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (17, '0013', 'Weedle', 0.3, 3.2, 'Seu sentido de olfato é incrivelmente aguçado. Ele consegue identificar seus tipos favoritos de folhas em milhas de distância.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/13.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/13.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/13.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/13.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/13.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/13.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/13.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/13.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/13.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/13.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/13.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/13.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/13.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 17, 1, 13, 1, 5);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (18, '0014', 'Kakuna', 0.6, 10.0, 'Ele fica quase imóvel enquanto se agarra a uma árvore, aguardando sua evolução. A temperatura do corpo fica alta.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/14.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/14.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/14.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/14.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/14.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/14.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/14.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/14.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/14.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/14.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/14.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/14.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/14.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 18, 1, 14, 1, 5);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (19, '0015', 'Beedrill', 1.0, 29.5, 'Tem três grandes ferrões venenosos, um em cada braço e um na cauda. Eles são usados para atacar seus inimigos sem parar.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/15.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/15.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/15.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/15.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/15.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/15.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/15.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/15.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/15.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/15.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/15.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/15.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/15.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 19, 1, 15, 1, 5);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (20, '0015', 'Mega Beedrill', 1.4, 40.5, 'Tem três grandes ferrões venenosos, um em cada braço e um na cauda. Eles são usados para atacar seus inimigos sem parar.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/15-mega.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/15-mega.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/15-mega.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/15-mega.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/15.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/15.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/15.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/15.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/15.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/15.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/15.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/15.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/15.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 20, 6, 15, 1, 5);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (21, '0016', 'Pidgey', 0.3, 1.8, 'É dócil e prefere evitar brigas. No entanto, se for provocado, ele revida vigorosamente.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/16.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/16.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/16.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/16.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/16.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/16.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/16.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/16.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/16.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/16.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/16.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/16.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/16.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 21, 1, 16, 1, 6);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (22, '0017', 'Pidgeotto', 1.1, 30.0, 'Este Pokémon é um protetor feroz de seu vasto território. Ele bica impiedosamente qualquer intruso.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/17.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/17.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/17.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/17.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/17.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/17.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/17.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/17.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/17.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/17.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/17.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/17.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/17.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 22, 1, 17, 1, 6);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (23, '0018', 'Pidgeot', 1.5, 39.5, 'Com suas asas magníficas, ele pode voar a velocidades Mach 2. É temido por todos os inimigos.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/18.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/18.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/18.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/18.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/18.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/18.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/18.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/18.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/18.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/18.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/18.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/18.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/18.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 23, 1, 18, 1, 6);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (24, '0026', 'Raichu', 0.8, 30.0, 'Se sua bolsa elétrica for sobrecarregada, ele libera eletricidade. Pode até eletrocutar a si mesmo, então é bom ter cuidado.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/26.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/26.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/26.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/26.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/26.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/26.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/26.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/26.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/26.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/26.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/26.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/26.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/26.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 10, 24, 1, 26, 1, 10);
+INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (25, '0025', 'Pikachu', 0.4, 6.0, 'Este Pokémon tem bolsas elétricas nas bochechas. Elas parecem carregar eletricidade durante a noite enquanto ele dorme.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/25.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/25.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/25.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/25.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/25.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/25.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/25.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/25.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/25.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/25.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/25.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/25.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/25.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 10, 25, 1, 25, 1, 10);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (1, 5);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (1, 8);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (1, 65, False);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (1, 66, True);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (1, 7);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (1, 10);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (2, '0002', 'Ivysaur', 1.0, 13.0, 'Quando o bulbo nas suas costas fica grande, parece que ele perde a capacidade de ficar de pé sobre duas pernas.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/2.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/2.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/2.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/2.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/2.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/2.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/2.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/2.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/2.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/2.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/2.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/2.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/2.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 2, 1, 2, 1, 1);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (2, 5);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (2, 8);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (2, 65, False);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (2, 66, True);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (2, 7);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (2, 10);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (3, '0003', 'Venusaur', 2.0, 100.0, 'A flor nas suas costas floresce quando absorve a luz solar. A floração libera um aroma que acalma as emoções das pessoas.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/3.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/3.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/3.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/3.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/3.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/3.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/3.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/3.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/3.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/3.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/3.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/3.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/3.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 3, 1, 3, 1, 1);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (3, 5);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (3, 8);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (3, 65, False);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (3, 66, True);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (3, 7);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (3, 10);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (4, '0003', 'Mega Venusaur', 2.4, 155.5, 'A flor nas suas costas floresce quando absorve a luz solar. A floração libera um aroma que acalma as emoções das pessoas.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/3-mega.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/3-mega.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/3-mega.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/3-mega.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/3.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/3.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/3.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/3.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/3.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/3.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/3.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/3.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/3.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 4, 6, 3, 1, 1);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (4, 5);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (4, 8);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (4, 169, False);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (4, 7);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (4, 10);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (5, '0004', 'Charmander', 0.6, 8.5, 'A chama na ponta da sua cauda indica a sua força vital. Se estiver saudável, a chama arde vigorosamente.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/4.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/4.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/4.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/4.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/4.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/4.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/4.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/4.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/4.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/4.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/4.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/4.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/4.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 5, 1, 4, 1, 2);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (5, 2);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (5, 66, True);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (5, 189, False);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (5, 3);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (5, 5);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (6, '0005', 'Charmeleon', 1.1, 19.0, 'Ele ataca implacavelmente usando suas garras afiadas. Seus inimigos recuam diante do brilho de suas garras.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/5.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/5.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/5.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/5.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/5.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/5.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/5.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/5.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/5.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/5.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/5.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/5.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/5.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 6, 1, 5, 1, 2);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (6, 2);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (6, 66, True);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (6, 189, False);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (6, 3);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (6, 5);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (7, '0006', 'Charizard', 1.7, 90.5, 'Charizard voa pelo céu em busca de oponentes fortes. Ele cospe fogo tão quente que derrete qualquer coisa.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/6.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/6.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/6.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/6.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/6.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/6.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/6.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/6.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/6.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/6.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/6.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/6.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/6.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 7, 1, 6, 1, 2);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (7, 2);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (7, 10);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (7, 66, True);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (7, 189, False);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (7, 3);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (7, 5);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (8, '0006', 'Mega Charizard X', 1.7, 110.5, 'Charizard voa pelo céu em busca de oponentes fortes. Ele cospe fogo tão quente que derrete qualquer coisa.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/6-mega-x.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/6-mega-x.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/6-mega-x.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/6-mega-x.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/6.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/6.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/6.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/6.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/6.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/6.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/6.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/6.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/6.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 8, 6, 6, 1, 2);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (8, 2);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (8, 16);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (8, 154, False);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (8, 3);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (8, 5);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (9, '0006', 'Mega Charizard Y', 1.7, 100.5, 'Charizard voa pelo céu em busca de oponentes fortes. Ele cospe fogo tão quente que derrete qualquer coisa.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/6-mega-y.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/6-mega-y.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/6-mega-y.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/6-mega-y.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/6.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/6.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/6.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/6.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/6.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/6.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/6.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/6.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/6.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 9, 6, 6, 1, 2);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (9, 2);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (9, 10);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (9, 174, False);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (9, 3);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (9, 5);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (10, '0007', 'Squirtle', 0.5, 9.0, 'Quando retrai seu longo pescoço para dentro de sua concha, ele jorra água com força prodigiosa.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/7.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/7.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/7.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/7.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/7.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/7.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/7.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/7.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/7.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/7.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/7.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/7.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/7.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 10, 1, 7, 1, 3);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (10, 3);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (10, 67, True);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (10, 189, False);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (10, 11);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (10, 13);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (11, '0008', 'Wartortle', 1.0, 22.5, 'Sua cauda grande e peluda é um símbolo de longevidade, tornando-o popular entre as pessoas idosas.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/8.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/8.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/8.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/8.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/8.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/8.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/8.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/8.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/8.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/8.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/8.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/8.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/8.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 11, 1, 8, 1, 3);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (11, 3);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (11, 67, True);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (11, 189, False);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (11, 11);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (11, 13);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (12, '0009', 'Blastoise', 1.6, 85.5, 'Seus jatos de água que se projetam de sua concha possuem um poder de impacto que pode perfurar até mesmo o aço mais grosso.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/9.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/9.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/9.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/9.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/9.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/9.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/9.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/9.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/9.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/9.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/9.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/9.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/9.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 12, 1, 9, 1, 3);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (12, 3);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (12, 67, True);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (12, 189, False);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (12, 11);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (12, 13);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (13, '0009', 'Mega Blastoise', 1.6, 101.1, 'Seus jatos de água que se projetam de sua concha possuem um poder de impacto que pode perfurar até mesmo o aço mais grosso.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/9-mega.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/9-mega.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/9-mega.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/9-mega.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/9.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/9.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/9.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/9.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/9.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/9.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/9.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/9.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/9.gif", "front_shiny_female": null}}}', 87.5, 12.5, 1, 20, 13, 6, 9, 1, 3);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (13, 3);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (13, 186, False);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (13, 11);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (13, 13);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (14, '0010', 'Caterpie', 0.3, 2.9, 'Para se proteger, ele libera um cheiro horrível de suas antenas. Tem um apetite voraz.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/10.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/10.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/10.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/10.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/10.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/10.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/10.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/10.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/10.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/10.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/10.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/10.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/10.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 14, 1, 10, 1, 4);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (14, 7);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (14, 50, False);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (14, 51, True);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (14, 2);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (15, '0011', 'Metapod', 0.7, 9.9, 'Seu corpo é envolto em uma casca dura como aço. Ele se prepara para sua evolução dentro da casca.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/11.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/11.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/11.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/11.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/11.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/11.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/11.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/11.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/11.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/11.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/11.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/11.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/11.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 15, 1, 11, 1, 4);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (15, 7);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (15, 64, False);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (15, 2);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (16, '0012', 'Butterfree', 1.1, 32.0, 'Adora o néctar das flores. Ele pode localizar flores que possuem até mesmo a menor quantidade de pólen.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/12.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/12.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/12.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/12.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/12.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/12.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/12.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/12.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/12.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/12.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/12.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/12.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/12.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 16, 1, 12, 1, 4);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (16, 7);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (16, 10);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (16, 46, False);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (16, 47, True);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (16, 2);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (17, '0013', 'Weedle', 0.3, 3.2, 'Seu sentido de olfato é incrivelmente aguçado. Ele consegue identificar seus tipos favoritos de folhas em milhas de distância.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/13.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/13.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/13.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/13.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/13.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/13.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/13.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/13.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/13.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/13.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/13.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/13.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/13.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 17, 1, 13, 1, 5);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (17, 2);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (17, 8);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (17, 50, False);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (17, 51, True);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (17, 2);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (18, '0014', 'Kakuna', 0.6, 10.0, 'Ele fica quase imóvel enquanto se agarra a uma árvore, aguardando sua evolução. A temperatura do corpo fica alta.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/14.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/14.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/14.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/14.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/14.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/14.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/14.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/14.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/14.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/14.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/14.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/14.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/14.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 18, 1, 14, 1, 5);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (18, 7);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (18, 8);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (18, 61, False);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (18, 2);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (19, '0015', 'Beedrill', 1.0, 29.5, 'Tem três grandes ferrões venenosos, um em cada braço e um na cauda. Eles são usados para atacar seus inimigos sem parar.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/15.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/15.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/15.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/15.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/15.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/15.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/15.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/15.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/15.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/15.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/15.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/15.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/15.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 19, 1, 15, 1, 5);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (19, 2);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (19, 8);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (19, 61, False);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (19, 62, True);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (19, 2);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (20, '0015', 'Mega Beedrill', 1.4, 40.5, 'Tem três grandes ferrões venenosos, um em cada braço e um na cauda. Eles são usados para atacar seus inimigos sem parar.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/15-mega.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/15-mega.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/15-mega.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/15-mega.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/15.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/15.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/15.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/15.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/15.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/15.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/15.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/15.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/15.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 20, 6, 15, 1, 5);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (20, 2);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (20, 8);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (20, 1, False);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (20, 2);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (21, '0016', 'Pidgey', 0.3, 1.8, 'É dócil e prefere evitar brigas. No entanto, se for provocado, ele revida vigorosamente.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/16.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/16.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/16.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/16.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/16.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/16.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/16.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/16.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/16.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/16.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/16.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/16.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/16.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 21, 1, 16, 1, 6);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (21, 1);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (21, 10);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (21, 190, False);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (21, 43, True);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (21, 6);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (21, 1);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (22, '0017', 'Pidgeotto', 1.1, 30.0, 'Este Pokémon é um protetor feroz de seu vasto território. Ele bica impiedosamente qualquer intruso.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/17.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/17.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/17.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/17.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/17.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/17.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/17.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/17.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/17.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/17.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/17.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/17.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/17.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 22, 1, 17, 1, 6);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (22, 1);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (22, 10);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (22, 190, False);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (22, 43, True);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (22, 6);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (22, 1);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (23, '0018', 'Pidgeot', 1.5, 39.5, 'Com suas asas magníficas, ele pode voar a velocidades Mach 2. É temido por todos os inimigos.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/18.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/18.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/18.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/18.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/18.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/18.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/18.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/18.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/18.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/18.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/18.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/18.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/18.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 15, 23, 1, 18, 1, 6);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (23, 1);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (23, 10);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (23, 190, False);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (23, 43, True);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (23, 6);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (23, 1);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (24, '0026', 'Raichu', 0.8, 30.0, 'Se sua bolsa elétrica for sobrecarregada, ele libera eletricidade. Pode até eletrocutar a si mesmo, então é bom ter cuidado.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/26.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/26.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/26.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/26.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/26.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/26.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/26.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/26.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/26.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/26.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/26.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/26.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/26.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 10, 24, 1, 26, 1, 10);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (24, 4);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (24, 18, False);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (24, 19, True);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (24, 5);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (24, 4);
-INSERT INTO pokemons (id, number, name, height, weight, description, sprites, gender_male, gender_female, gender_rate_value, egg_cycles, stats_id, generation_id, species_id, region_id, evolution_chain_id) VALUES (25, '0025', 'Pikachu', 0.4, 6.0, 'Este Pokémon tem bolsas elétricas nas bochechas. Elas parecem carregar eletricidade durante a noite enquanto ele dorme.', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/25.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/25.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/25.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/25.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/25.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/25.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/25.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/25.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/25.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/25.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/25.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/25.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/25.gif", "front_shiny_female": null}}}', 50.0, 50.0, 1, 10, 25, 1, 25, 1, 10);
 INSERT INTO pokemon_types (pokemon_id, type_id) VALUES (25, 4);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (25, 18, False);
-INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (25, 19, True);
-INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (25, 5);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (1, 65, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (1, 66, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (2, 65, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (2, 66, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (3, 65, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (3, 66, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (4, 169, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (5, 66, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (5, 189, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (6, 66, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (6, 189, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (7, 66, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (7, 189, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (8, 154, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (9, 174, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (10, 67, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (10, 189, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (11, 67, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (11, 189, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (12, 67, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (12, 189, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (13, 186, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (14, 50, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (14, 51, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (15, 64, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (16, 46, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (16, 47, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (17, 50, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (17, 51, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (18, 61, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (19, 61, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (19, 62, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (20, 1, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (21, 43, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (21, 190, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (22, 43, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (22, 190, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (23, 43, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (23, 190, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (24, 18, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (24, 19, TRUE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (25, 18, FALSE);
+INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES (25, 19, TRUE);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (1, 7);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (1, 10);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (2, 7);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (2, 10);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (3, 7);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (3, 10);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (4, 7);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (4, 10);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (5, 3);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (5, 5);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (6, 3);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (6, 5);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (7, 3);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (7, 5);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (8, 3);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (8, 5);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (9, 3);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (9, 5);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (10, 11);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (10, 13);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (11, 11);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (11, 13);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (12, 11);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (12, 13);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (13, 11);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (13, 13);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (14, 2);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (15, 2);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (16, 2);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (17, 2);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (18, 2);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (19, 2);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (20, 2);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (21, 1);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (21, 6);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (22, 1);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (22, 6);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (23, 1);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (23, 6);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (24, 4);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (24, 5);
 INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (25, 4);
+INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES (25, 5);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (1, 1, 2, 'level_up', '16', 'Nível 16', 1);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (1, 2, 3, 'level_up', '32', 'Nível 32', 2);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (1, 3, 4, 'mega_evolution', NULL, 'Mega Evolução', 3);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (2, 5, 6, 'level_up', '16', 'Nível 16', 1);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (2, 6, 7, 'level_up', '36', 'Nível 36', 2);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (2, 7, 8, 'mega_evolution', NULL, 'Mega Evolução', 3);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (2, 7, 9, 'mega_evolution', NULL, 'Mega Evolução', 3);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (3, 10, 11, 'level_up', '16', 'Nível 16', 1);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (3, 11, 12, 'level_up', '36', 'Nível 36', 2);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (3, 12, 13, 'mega_evolution', NULL, 'Mega Evolução', 3);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (4, 14, 15, 'level_up', '7', 'Nível 7', 1);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (4, 15, 16, 'level_up', '10', 'Nível 10', 2);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (5, 17, 18, 'level_up', '7', 'Nível 7', 1);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (5, 18, 19, 'level_up', '10', 'Nível 10', 2);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (5, 19, 20, 'mega_evolution', NULL, 'Mega Evolução', 3);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (6, 21, 22, 'level_up', '18', 'Nível 18', 1);
+INSERT INTO evolution_edges (evolution_chain_id, from_pokemon_id, to_pokemon_id, condition_type, condition_value, condition_description, depth) VALUES (6, 22, 23, 'level_up', '36', 'Nível 36', 2);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (1, '0001', 'Bulbasaur', 'Por um tempo após seu nascimento, ele usa os nutrientes armazenados na semente em suas costas para crescer.', 0.7, 6.9, 1, 1, 'Seed Pokémon', 'Pokémon Semente', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/1.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/1.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/1.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/1.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/1.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/1.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/1.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/1.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/1.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/1.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/1.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/1.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/1.gif", "front_shiny_female": null}}}', '[{"id": 5, "name": "Grama", "color": "#7AC74C"}, {"id": 8, "name": "Venenoso", "color": "#A33EA1"}]', '[{"id": 65, "name": "Aura Feérica", "description": "Aumenta o poder de movimentos do tipo Fada para todos os Pokémon em batalha.", "is_hidden": false}, {"id": 66, "name": "Filtro", "description": "Reduz o dano de ataques super eficazes.", "is_hidden": true}]', '[{"id": 7, "name": "Grama"}, {"id": 10, "name": "Monstro"}]', 318, 45, 49, 49, 65, 65, 45);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (2, '0002', 'Ivysaur', 'Quando o bulbo nas suas costas fica grande, parece que ele perde a capacidade de ficar de pé sobre duas pernas.', 1.0, 13.0, 1, 1, 'Seed Pokémon', 'Pokémon Semente', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/2.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/2.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/2.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/2.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/2.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/2.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/2.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/2.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/2.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/2.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/2.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/2.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/2.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/2.gif", "front_shiny_female": null}}}', '[{"id": 5, "name": "Grama", "color": "#7AC74C"}, {"id": 8, "name": "Venenoso", "color": "#A33EA1"}]', '[{"id": 65, "name": "Aura Feérica", "description": "Aumenta o poder de movimentos do tipo Fada para todos os Pokémon em batalha.", "is_hidden": false}, {"id": 66, "name": "Filtro", "description": "Reduz o dano de ataques super eficazes.", "is_hidden": true}]', '[{"id": 7, "name": "Grama"}, {"id": 10, "name": "Monstro"}]', 405, 60, 62, 63, 80, 80, 60);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (3, '0003', 'Venusaur', 'A flor nas suas costas floresce quando absorve a luz solar. A floração libera um aroma que acalma as emoções das pessoas.', 2.0, 100.0, 1, 1, 'Seed Pokémon', 'Pokémon Semente', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/3.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/3.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/3.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/3.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/3.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/3.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/3.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/3.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/3.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/3.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/3.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/3.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/3.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/3.gif", "front_shiny_female": null}}}', '[{"id": 5, "name": "Grama", "color": "#7AC74C"}, {"id": 8, "name": "Venenoso", "color": "#A33EA1"}]', '[{"id": 65, "name": "Aura Feérica", "description": "Aumenta o poder de movimentos do tipo Fada para todos os Pokémon em batalha.", "is_hidden": false}, {"id": 66, "name": "Filtro", "description": "Reduz o dano de ataques super eficazes.", "is_hidden": true}]', '[{"id": 7, "name": "Grama"}, {"id": 10, "name": "Monstro"}]', 525, 80, 82, 83, 100, 100, 80);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (4, '0003', 'Mega Venusaur', 'A flor nas suas costas floresce quando absorve a luz solar. A floração libera um aroma que acalma as emoções das pessoas.', 2.4, 155.5, 6, 1, 'Seed Pokémon', 'Pokémon Semente', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/3.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/3-mega.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/3-mega.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/3-mega.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/3-mega.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/3.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/3.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/3.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/3.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/3.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/3.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/3.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/3.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/3.gif", "front_shiny_female": null}}}', '[{"id": 5, "name": "Grama", "color": "#7AC74C"}, {"id": 8, "name": "Venenoso", "color": "#A33EA1"}]', '[{"id": 169, "name": "Mais", "description": "Aumenta o At. Esp. se outro Pokémon tiver Mais ou Menos.", "is_hidden": false}]', '[{"id": 7, "name": "Grama"}, {"id": 10, "name": "Monstro"}]', 625, 80, 100, 123, 122, 120, 80);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (5, '0004', 'Charmander', 'A chama na ponta da sua cauda indica a sua força vital. Se estiver saudável, a chama arde vigorosamente.', 0.6, 8.5, 1, 1, 'Lizard Pokémon', 'Pokémon Lagarto', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/4.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/4.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/4.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/4.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/4.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/4.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/4.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/4.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/4.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/4.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/4.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/4.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/4.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/4.gif", "front_shiny_female": null}}}', '[{"id": 2, "name": "Fogo", "color": "#EE8130"}]', '[{"id": 66, "name": "Filtro", "description": "Reduz o dano de ataques super eficazes.", "is_hidden": true}, {"id": 189, "name": "Majestade Real", "description": "Impede o uso de movimentos de prioridade.", "is_hidden": false}]', '[{"id": 3, "name": "Dragão"}, {"id": 5, "name": "Campo"}]', 309, 39, 52, 43, 60, 50, 65);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (6, '0005', 'Charmeleon', 'Ele ataca implacavelmente usando suas garras afiadas. Seus inimigos recuam diante do brilho de suas garras.', 1.1, 19.0, 1, 1, 'Flame Pokémon', 'Pokémon Chama', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/5.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/5.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/5.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/5.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/5.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/5.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/5.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/5.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/5.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/5.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/5.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/5.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/5.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/5.gif", "front_shiny_female": null}}}', '[{"id": 2, "name": "Fogo", "color": "#EE8130"}]', '[{"id": 66, "name": "Filtro", "description": "Reduz o dano de ataques super eficazes.", "is_hidden": true}, {"id": 189, "name": "Majestade Real", "description": "Impede o uso de movimentos de prioridade.", "is_hidden": false}]', '[{"id": 3, "name": "Dragão"}, {"id": 5, "name": "Campo"}]', 405, 58, 64, 58, 80, 65, 80);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (7, '0006', 'Charizard', 'Charizard voa pelo céu em busca de oponentes fortes. Ele cospe fogo tão quente que derrete qualquer coisa.', 1.7, 90.5, 1, 1, 'Flame Pokémon', 'Pokémon Chama', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/6.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/6.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/6.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/6.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/6.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/6.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/6.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/6.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/6.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/6.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/6.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/6.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/6.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/6.gif", "front_shiny_female": null}}}', '[{"id": 2, "name": "Fogo", "color": "#EE8130"}, {"id": 10, "name": "Voador", "color": "#A98FF3"}]', '[{"id": 66, "name": "Filtro", "description": "Reduz o dano de ataques super eficazes.", "is_hidden": true}, {"id": 189, "name": "Majestade Real", "description": "Impede o uso de movimentos de prioridade.", "is_hidden": false}]', '[{"id": 3, "name": "Dragão"}, {"id": 5, "name": "Campo"}]', 534, 78, 84, 78, 109, 85, 100);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (8, '0006', 'Mega Charizard X', 'Charizard voa pelo céu em busca de oponentes fortes. Ele cospe fogo tão quente que derrete qualquer coisa.', 1.7, 110.5, 6, 1, 'Flame Pokémon', 'Pokémon Chama', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/6.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/6-mega-x.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/6-mega-x.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/6-mega-x.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/6-mega-x.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/6.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/6.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/6.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/6.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/6.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/6.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/6.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/6.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/6.gif", "front_shiny_female": null}}}', '[{"id": 2, "name": "Fogo", "color": "#EE8130"}, {"id": 16, "name": "Sombrio", "color": "#705746"}]', '[{"id": 154, "name": "Gás Neutralizante", "description": "Neutraliza as habilidades de todos os Pokémon em batalha.", "is_hidden": false}]', '[{"id": 3, "name": "Dragão"}, {"id": 5, "name": "Campo"}]', 634, 78, 130, 111, 130, 85, 100);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (9, '0006', 'Mega Charizard Y', 'Charizard voa pelo céu em busca de oponentes fortes. Ele cospe fogo tão quente que derrete qualquer coisa.', 1.7, 100.5, 6, 1, 'Flame Pokémon', 'Pokémon Chama', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/6.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/6-mega-y.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/6-mega-y.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/6-mega-y.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/6-mega-y.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/6.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/6.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/6.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/6.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/6.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/6.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/6.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/6.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/6.gif", "front_shiny_female": null}}}', '[{"id": 2, "name": "Fogo", "color": "#EE8130"}, {"id": 10, "name": "Voador", "color": "#A98FF3"}]', '[{"id": 174, "name": "Construção de Poder", "description": "Muda de forma quando o HP cai abaixo da metade.", "is_hidden": false}]', '[{"id": 3, "name": "Dragão"}, {"id": 5, "name": "Campo"}]', 634, 78, 104, 78, 159, 115, 100);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (10, '0007', 'Squirtle', 'Quando retrai seu longo pescoço para dentro de sua concha, ele jorra água com força prodigiosa.', 0.5, 9.0, 1, 1, 'Tiny Turtle Pokémon', 'Pokémon Jovem Tartaruga', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/7.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/7.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/7.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/7.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/7.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/7.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/7.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/7.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/7.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/7.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/7.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/7.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/7.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/7.gif", "front_shiny_female": null}}}', '[{"id": 3, "name": "Água", "color": "#6390F0"}]', '[{"id": 67, "name": "Corpo Flamejante", "description": "Contato com o Pokémon pode queimar o atacante.", "is_hidden": true}, {"id": 189, "name": "Majestade Real", "description": "Impede o uso de movimentos de prioridade.", "is_hidden": false}]', '[{"id": 11, "name": "Água 1"}, {"id": 13, "name": "Água 3"}]', 314, 44, 48, 65, 50, 64, 43);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (11, '0008', 'Wartortle', 'Sua cauda grande e peluda é um símbolo de longevidade, tornando-o popular entre as pessoas idosas.', 1.0, 22.5, 1, 1, 'Turtle Pokémon', 'Pokémon Tartaruga', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/8.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/8.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/8.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/8.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/8.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/8.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/8.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/8.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/8.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/8.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/8.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/8.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/8.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/8.gif", "front_shiny_female": null}}}', '[{"id": 3, "name": "Água", "color": "#6390F0"}]', '[{"id": 67, "name": "Corpo Flamejante", "description": "Contato com o Pokémon pode queimar o atacante.", "is_hidden": true}, {"id": 189, "name": "Majestade Real", "description": "Impede o uso de movimentos de prioridade.", "is_hidden": false}]', '[{"id": 11, "name": "Água 1"}, {"id": 13, "name": "Água 3"}]', 405, 59, 63, 80, 65, 80, 58);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (12, '0009', 'Blastoise', 'Seus jatos de água que se projetam de sua concha possuem um poder de impacto que pode perfurar até mesmo o aço mais grosso.', 1.6, 85.5, 1, 1, 'Shellfish Pokémon', 'Pokémon Concha', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/9.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/9.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/9.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/9.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/9.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/9.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/9.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/9.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/9.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/9.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/9.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/9.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/9.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/9.gif", "front_shiny_female": null}}}', '[{"id": 3, "name": "Água", "color": "#6390F0"}]', '[{"id": 67, "name": "Corpo Flamejante", "description": "Contato com o Pokémon pode queimar o atacante.", "is_hidden": true}, {"id": 189, "name": "Majestade Real", "description": "Impede o uso de movimentos de prioridade.", "is_hidden": false}]', '[{"id": 11, "name": "Água 1"}, {"id": 13, "name": "Água 3"}]', 530, 79, 83, 100, 85, 105, 78);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (13, '0009', 'Mega Blastoise', 'Seus jatos de água que se projetam de sua concha possuem um poder de impacto que pode perfurar até mesmo o aço mais grosso.', 1.6, 101.1, 6, 1, 'Shellfish Pokémon', 'Pokémon Concha', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/9.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/9-mega.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/9-mega.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/9-mega.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/9-mega.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/9.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/9.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/9.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/9.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/9.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/9.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/9.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/9.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/9.gif", "front_shiny_female": null}}}', '[{"id": 3, "name": "Água", "color": "#6390F0"}]', '[{"id": 186, "name": "Poder Puro", "description": "Aumenta o Ataque do Pokémon.", "is_hidden": false}]', '[{"id": 11, "name": "Água 1"}, {"id": 13, "name": "Água 3"}]', 630, 79, 103, 120, 135, 115, 78);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (14, '0010', 'Caterpie', 'Para se proteger, ele libera um cheiro horrível de suas antenas. Tem um apetite voraz.', 0.3, 2.9, 1, 1, 'Worm Pokémon', 'Pokémon Lagarta', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/10.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/10.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/10.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/10.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/10.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/10.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/10.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/10.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/10.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/10.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/10.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/10.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/10.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/10.gif", "front_shiny_female": null}}}', '[{"id": 7, "name": "Lutador", "color": "#C22E28"}]', '[{"id": 50, "name": "Corrente Delta", "description": "Cria ventos fortes quando a habilidade é ativada.", "is_hidden": false}, {"id": 51, "name": "Terra Desolada", "description": "Torna a luz solar extremamente forte quando a habilidade é ativada.", "is_hidden": true}]', '[{"id": 2, "name": "Inseto"}]', 195, 45, 30, 35, 20, 20, 45);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (15, '0011', 'Metapod', 'Seu corpo é envolto em uma casca dura como aço. Ele se prepara para sua evolução dentro da casca.', 0.7, 9.9, 1, 1, 'Cocoon Pokémon', 'Pokémon Crisálida', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/11.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/11.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/11.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/11.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/11.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/11.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/11.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/11.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/11.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/11.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/11.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/11.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/11.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/11.gif", "front_shiny_female": null}}}', '[{"id": 7, "name": "Lutador", "color": "#C22E28"}]', '[{"id": 64, "name": "Saída de Emergência", "description": "Troca quando o HP cai abaixo de 50%.", "is_hidden": false}]', '[{"id": 2, "name": "Inseto"}]', 205, 50, 20, 55, 25, 25, 30);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (16, '0012', 'Butterfree', 'Adora o néctar das flores. Ele pode localizar flores que possuem até mesmo a menor quantidade de pólen.', 1.1, 32.0, 1, 1, 'Butterfly Pokémon', 'Pokémon Borboleta', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/12.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/12.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/12.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/12.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/12.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/12.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/12.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/12.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/12.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/12.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/12.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/12.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/12.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/12.gif", "front_shiny_female": null}}}', '[{"id": 7, "name": "Lutador", "color": "#C22E28"}, {"id": 10, "name": "Voador", "color": "#A98FF3"}]', '[{"id": 46, "name": "Escudo Intrépido", "description": "Aumenta a Defesa em batalha.", "is_hidden": false}, {"id": 47, "name": "Ofuscante", "description": "Protege o Pokémon de movimentos de alta prioridade.", "is_hidden": true}]', '[{"id": 2, "name": "Inseto"}]', 395, 60, 45, 50, 90, 80, 70);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (17, '0013', 'Weedle', 'Seu sentido de olfato é incrivelmente aguçado. Ele consegue identificar seus tipos favoritos de folhas em milhas de distância.', 0.3, 3.2, 1, 1, 'Hairy Bug Pokémon', 'Pokémon Lagarta Peluda', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/13.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/13.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/13.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/13.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/13.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/13.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/13.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/13.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/13.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/13.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/13.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/13.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/13.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/13.gif", "front_shiny_female": null}}}', '[{"id": 2, "name": "Fogo", "color": "#EE8130"}, {"id": 8, "name": "Venenoso", "color": "#A33EA1"}]', '[{"id": 50, "name": "Corrente Delta", "description": "Cria ventos fortes quando a habilidade é ativada.", "is_hidden": false}, {"id": 51, "name": "Terra Desolada", "description": "Torna a luz solar extremamente forte quando a habilidade é ativada.", "is_hidden": true}]', '[{"id": 2, "name": "Inseto"}]', 195, 40, 35, 30, 20, 20, 50);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (18, '0014', 'Kakuna', 'Ele fica quase imóvel enquanto se agarra a uma árvore, aguardando sua evolução. A temperatura do corpo fica alta.', 0.6, 10.0, 1, 1, 'Cocoon Pokémon', 'Pokémon Crisálida', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/14.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/14.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/14.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/14.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/14.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/14.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/14.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/14.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/14.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/14.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/14.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/14.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/14.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/14.gif", "front_shiny_female": null}}}', '[{"id": 7, "name": "Lutador", "color": "#C22E28"}, {"id": 8, "name": "Venenoso", "color": "#A33EA1"}]', '[{"id": 61, "name": "Surto Elétrico", "description": "O Pokémon cria um Terreno Elétrico quando entra em uma batalha.", "is_hidden": false}]', '[{"id": 2, "name": "Inseto"}]', 205, 45, 25, 50, 25, 25, 35);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (19, '0015', 'Beedrill', 'Tem três grandes ferrões venenosos, um em cada braço e um na cauda. Eles são usados para atacar seus inimigos sem parar.', 1.0, 29.5, 1, 1, 'Poison Bee Pokémon', 'Pokémon Abelha Venenosa', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/15.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/15.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/15.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/15.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/15.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/15.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/15.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/15.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/15.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/15.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/15.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/15.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/15.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/15.gif", "front_shiny_female": null}}}', '[{"id": 2, "name": "Fogo", "color": "#EE8130"}, {"id": 8, "name": "Venenoso", "color": "#A33EA1"}]', '[{"id": 61, "name": "Surto Elétrico", "description": "O Pokémon cria um Terreno Elétrico quando entra em uma batalha.", "is_hidden": false}, {"id": 62, "name": "Eletromorfose", "description": "Dobra o poder do próximo movimento do tipo Elétrico quando atingido por um ataque.", "is_hidden": true}]', '[{"id": 2, "name": "Inseto"}]', 395, 65, 90, 40, 45, 80, 75);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (20, '0015', 'Mega Beedrill', 'Tem três grandes ferrões venenosos, um em cada braço e um na cauda. Eles são usados para atacar seus inimigos sem parar.', 1.4, 40.5, 6, 1, 'Poison Bee Pokémon', 'Pokémon Abelha Venenosa', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/15.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/15-mega.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/15-mega.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/15-mega.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/15-mega.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/15.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/15.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/15.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/15.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/15.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/15.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/15.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/15.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/15.gif", "front_shiny_female": null}}}', '[{"id": 2, "name": "Fogo", "color": "#EE8130"}, {"id": 8, "name": "Venenoso", "color": "#A33EA1"}]', '[{"id": 1, "name": "Adaptabilidade", "description": "Aumenta o poder de movimentos do mesmo tipo do Pokémon.", "is_hidden": false}]', '[{"id": 2, "name": "Inseto"}]', 495, 65, 150, 40, 15, 80, 145);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (21, '0016', 'Pidgey', 'É dócil e prefere evitar brigas. No entanto, se for provocado, ele revida vigorosamente.', 0.3, 1.8, 1, 1, 'Tiny Bird Pokémon', 'Pokémon Pequeno Pássaro', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/16.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/16.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/16.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/16.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/16.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/16.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/16.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/16.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/16.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/16.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/16.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/16.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/16.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/16.gif", "front_shiny_female": null}}}', '[{"id": 1, "name": "Normal", "color": "#A8A77A"}, {"id": 10, "name": "Voador", "color": "#A98FF3"}]', '[{"id": 190, "name": "Saque Rápido", "description": "O Pokémon pode atacar primeiro ocasionalmente.", "is_hidden": false}, {"id": 43, "name": "Umidade", "description": "Impede o uso de movimentos autodestrutivos.", "is_hidden": true}]', '[{"id": 6, "name": "Voador"}, {"id": 1, "name": "Amorfo"}]', 525, 80, 82, 83, 100, 100, 80);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (22, '0017', 'Pidgeotto', 'Este Pokémon é um protetor feroz de seu vasto território. Ele bica impiedosamente qualquer intruso.', 1.1, 30.0, 1, 1, 'Bird Pokémon', 'Pokémon Pássaro', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/17.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/17.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/17.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/17.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/17.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/17.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/17.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/17.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/17.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/17.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/17.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/17.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/17.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/17.gif", "front_shiny_female": null}}}', '[{"id": 1, "name": "Normal", "color": "#A8A77A"}, {"id": 10, "name": "Voador", "color": "#A98FF3"}]', '[{"id": 190, "name": "Saque Rápido", "description": "O Pokémon pode atacar primeiro ocasionalmente.", "is_hidden": false}, {"id": 43, "name": "Umidade", "description": "Impede o uso de movimentos autodestrutivos.", "is_hidden": true}]', '[{"id": 6, "name": "Voador"}, {"id": 1, "name": "Amorfo"}]', 534, 78, 84, 78, 109, 85, 100);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (23, '0018', 'Pidgeot', 'Com suas asas magníficas, ele pode voar a velocidades Mach 2. É temido por todos os inimigos.', 1.5, 39.5, 1, 1, 'Bird Pokémon', 'Pokémon Pássaro', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/18.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/18.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/18.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/18.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/18.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/18.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/18.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/18.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/18.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/18.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/18.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/18.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/18.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/18.gif", "front_shiny_female": null}}}', '[{"id": 1, "name": "Normal", "color": "#A8A77A"}, {"id": 10, "name": "Voador", "color": "#A98FF3"}]', '[{"id": 190, "name": "Saque Rápido", "description": "O Pokémon pode atacar primeiro ocasionalmente.", "is_hidden": false}, {"id": 43, "name": "Umidade", "description": "Impede o uso de movimentos autodestrutivos.", "is_hidden": true}]', '[{"id": 6, "name": "Voador"}, {"id": 1, "name": "Amorfo"}]', 530, 79, 83, 100, 85, 105, 78);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (24, '0026', 'Raichu', 'Se sua bolsa elétrica for sobrecarregada, ele libera eletricidade. Pode até eletrocutar a si mesmo, então é bom ter cuidado.', 0.8, 30.0, 1, 1, 'Mouse Pokémon', 'Pokémon Rato', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/26.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/26.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/26.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/26.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/26.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/26.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/26.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/26.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/26.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/26.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/26.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/26.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/26.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/26.gif", "front_shiny_female": null}}}', '[{"id": 4, "name": "Elétrico", "color": "#F7D02C"}]', '[{"id": 18, "name": "Laço de Batalha", "description": "Transforma-se em Ash-Greninja após nocautear um oponente.", "is_hidden": false}, {"id": 19, "name": "Contas da Ruína", "description": "Reduz a Defesa Especial de todos os Pokémon, exceto o próprio.", "is_hidden": true}]', '[{"id": 5, "name": "Campo"}, {"id": 4, "name": "Fada"}]', 485, 90, 85, 50, 95, 85, 110);
+INSERT INTO pokemon_cards (pokemon_id, number, name, description, height, weight, generation_id, region_id, species_en, species_pt, image_url, sprites, types, abilities, egg_groups, total, hp, attack, defense, sp_atk, sp_def, speed) VALUES (25, '0025', 'Pikachu', 'Este Pokémon tem bolsas elétricas nas bochechas. Elas parecem carregar eletricidade durante a noite enquanto ele dorme.', 0.4, 6.0, 1, 1, 'Mouse Pokémon', 'Pokémon Rato', 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/25.png', '{"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/25.png", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/back/shiny/25.png", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/25.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/shiny/25.png", "front_shiny_female": null, "other": {"dream_world": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/dream-world/25.svg", "front_female": null}, "home": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/25.png", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home/shiny/25.png", "front_shiny_female": null}, "official-artwork": {"front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/25.png", "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/shiny/25.png"}, "showdown": {"back_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/25.gif", "back_female": null, "back_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/back/shiny/25.gif", "back_shiny_female": null, "front_default": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/25.gif", "front_female": null, "front_shiny": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/showdown/shiny/25.gif", "front_shiny_female": null}}}', '[{"id": 4, "name": "Elétrico", "color": "#F7D02C"}]', '[{"id": 18, "name": "Laço de Batalha", "description": "Transforma-se em Ash-Greninja após nocautear um oponente.", "is_hidden": false}, {"id": 19, "name": "Contas da Ruína", "description": "Reduz a Defesa Especial de todos os Pokémon, exceto o próprio.", "is_hidden": true}]', '[{"id": 5, "name": "Campo"}, {"id": 4, "name": "Fada"}]', 320, 35, 55, 40, 50, 50, 90);
 
 -- Dados da tabela: pokemon_weaknesses (origem: 10_weaknesses.json)
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (1, 2);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (1, 6);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (1, 11);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (1, 10);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (2, 2);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (2, 6);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (2, 10);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (3, 2);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (3, 6);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (3, 11);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (3, 10);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (4, 2);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (4, 6);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (4, 11);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (4, 10);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (5, 3);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (5, 13);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (5, 9);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (6, 3);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (6, 13);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (6, 9);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (7, 3);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (7, 4);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (7, 13);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (8, 15);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (8, 13);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (8, 9);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (9, 3);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (9, 4);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (9, 13);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (10, 4);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (11, 4);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (12, 4);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (13, 4);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (14, 2);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (14, 13);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (14, 10);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (15, 2);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (15, 13);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (15, 10);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (16, 4);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (16, 2);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (16, 6);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (16, 13);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (16, 10);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (17, 2);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (17, 13);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (17, 11);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (17, 10);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (18, 2);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (18, 13);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (18, 11);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (18, 10);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (13, 2);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (13, 13);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (13, 11);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (13, 10);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (20, 2);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (20, 13);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (20, 11);
-INSERT INTO pokemon_weaknesses (pokemon_id, type_id) VALUES (20, 10);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (1, 2, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (1, 6, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (1, 10, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (1, 11, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (2, 2, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (2, 6, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (2, 10, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (2, 11, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (3, 2, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (3, 6, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (3, 10, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (3, 11, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (4, 2, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (4, 6, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (4, 10, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (4, 11, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (5, 3, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (5, 9, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (5, 13, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (6, 3, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (6, 9, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (6, 13, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (7, 3, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (7, 4, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (7, 13, 4.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (8, 3, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (8, 7, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (8, 9, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (8, 13, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (9, 3, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (9, 4, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (9, 13, 4.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (10, 4, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (10, 5, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (11, 4, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (11, 5, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (12, 4, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (12, 5, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (13, 4, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (13, 5, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (14, 10, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (14, 11, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (14, 18, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (15, 10, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (15, 11, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (15, 18, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (16, 4, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (16, 6, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (16, 10, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (16, 11, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (16, 18, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (17, 3, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (17, 9, 4.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (17, 11, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (17, 13, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (18, 9, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (18, 10, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (18, 11, 4.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (19, 3, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (19, 9, 4.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (19, 11, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (19, 13, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (20, 3, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (20, 9, 4.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (20, 11, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (20, 13, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (21, 4, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (21, 6, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (21, 13, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (22, 4, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (22, 6, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (22, 13, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (23, 4, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (23, 6, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (23, 13, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (24, 9, 2.0);
+INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES (25, 9, 2.0);
 
 -- Fim da carga de dados
--- Resumo: 10 arquivos processados com sucesso, 0 com erro
\ No newline at end of file
+-- Resumo: 11 arquivos processados com sucesso, 0 com erro
\ No newline at end of file
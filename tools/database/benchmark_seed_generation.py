@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+"""
+Benchmarks do gerador de seeds (generate_sql_from_json.py).
+- encoders: compara o caminho legado por registro (filter_valid_fields + flatten_object +
+  escape_sql_value) com os codificadores de linha compilados por tabela.
+- engines: compara o motor por linha com o motor colunar (seed_columnar) em tamanhos
+  crescentes, indicando a partir de quantas linhas o colunar passa a ser mais rápido.
+- scaling: gera datasets sintéticos (1x, 10x, 100x, 1000x o data/json) com o mesmo formato
+  dos reais e mede cada etapa da geração, gravando os resultados em JSON para comparação.
+"""
+
+import argparse
+import io
+import json
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from generate_sql_from_json import (
+    FILE_TO_TABLE_MAPPING,
+    RELATED_FILES,
+    SqlFileWriter,
+    compile_row_encoder,
+    escape_sql_value,
+    filter_valid_fields,
+    flatten_object,
+    generate_insert_sql,
+    load_json_file,
+    ordered_data_files,
+    process_special_tables,
+    render_table_sql,
+)
+from seed_columnar import numpy
+
+# Tabelas medidas no micro-benchmark de codificação (as maiores do dataset)
+ENCODER_BENCHMARK_TABLES = ["abilities", "species", "stats", "pokemons"]
+
+# Tabelas e tamanhos (linhas) do benchmark de motores row vs. columnar
+ENGINE_BENCHMARK_TABLES = ["species", "pokemons"]
+DEFAULT_ENGINE_SIZES = [100, 1000, 10000, 100000]
+
+# Escalas padrão do benchmark de escalabilidade (múltiplos do data/json)
+DEFAULT_SCALES = [1, 10, 100, 1000]
+
+# Tabelas de referência (domínio fixo: 18 tipos, 10 regiões...) não são multiplicadas
+REFERENCE_FILES = {"01_region.json", "02_type.json", "03_egg_group.json", "04_generation.json",
+                   "11_type_effectiveness.json"}
+
+# Tabelas renderizadas por process_special_tables (as demais usam generate_insert_sql)
+SPECIAL_TABLES = ["evolution_chains", "pokemon_weaknesses", "pokemons"]
+
+def legacy_insert_sql(table_name: str, records: List[Dict[str, Any]]) -> Iterator[str]:
+    """Caminho anterior aos codificadores: filtra, achata e escapa cada registro."""
+    for record in records:
+        filtered_record = filter_valid_fields(record, table_name)
+        if table_name == "pokemons" and isinstance(record.get('gender'), dict):
+            filtered_record['gender_male'] = record['gender'].get('male')
+            filtered_record['gender_female'] = record['gender'].get('female')
+            filtered_record = filter_valid_fields(filtered_record, table_name)
+        flattened_record = flatten_object(filtered_record)
+        columns = list(flattened_record.keys())
+        values = [escape_sql_value(flattened_record[col]) for col in columns]
+        yield f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(values)});"
+
+def encoder_insert_sql(table_name: str, records: List[Dict[str, Any]]) -> Iterator[str]:
+    """Caminho atual: codificador compilado uma vez, aplicado a cada registro."""
+    return map(compile_row_encoder(table_name, records).insert_sql, records)
+
+def measure_rows_per_second(render: Callable[[str, List[Dict[str, Any]]], Iterator[str]],
+                            table_name: str, records: List[Dict[str, Any]], repeat: int) -> float:
+    """
+    Melhor taxa (linhas/s) entre `repeat` execuções completas. Os avisos dos builders
+    (iguais a cada execução) são descartados em vez de repetidos no terminal.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for _ in render(table_name, records):
+                pass
+            best = min(best, time.perf_counter() - start)
+    return len(records) / best if best > 0 else float("inf")
+
+def run_encoder_benchmark(data_dir: Path, min_rows: int, repeat: int) -> bool:
+    """Mede linhas/s do caminho legado vs. codificadores compilados."""
+    table_to_file = {table: file_name for file_name, table in FILE_TO_TABLE_MAPPING.items()}
+    datasets = load_dataset(data_dir)
+    
+    print("⏱️  MICRO-BENCHMARK: codificação de linhas INSERT")
+    print(f"   Mínimo de {min_rows} linhas por tabela, melhor de {repeat} execuções")
+    print("-" * 72)
+    print(f"{'Tabela':<12} | {'Linhas':>8} | {'Legado (linhas/s)':>18} | {'Compilado (linhas/s)':>20} | {'Ganho':>6}")
+    print("-" * 72)
+    
+    for table_name in ENCODER_BENCHMARK_TABLES:
+        file_name = table_to_file[table_name]
+        if not datasets[file_name]:
+            print(f"❌ ERRO: Nenhum registro para {table_name}")
+            return False
+        
+        # Cópias com IDs deslocados (replicate_record) até atingir o volume mínimo
+        copies = max(1, -(-min_rows // len(datasets[file_name])))
+        records = replicate_dataset(datasets, copies, [file_name])[file_name]
+        
+        legacy_rate = measure_rows_per_second(legacy_insert_sql, table_name, records, repeat)
+        encoder_rate = measure_rows_per_second(encoder_insert_sql, table_name, records, repeat)
+        print(f"{table_name:<12} | {len(records):>8} | {legacy_rate:>18,.0f} | {encoder_rate:>20,.0f} | "
+              f"{encoder_rate / legacy_rate:>5.1f}x")
+    
+    print("-" * 72)
+    return True
+
+def run_engine_benchmark(data_dir: Path, sizes: List[int], output_format: str, batch_size: int,
+                         repeat: int) -> bool:
+    """Mede linhas/s dos motores row e columnar por tamanho e aponta o ponto de cruzamento."""
+    table_to_file = {table: file_name for file_name, table in FILE_TO_TABLE_MAPPING.items()}
+    datasets = load_dataset(data_dir)
+    
+    def engine_renderer(engine: str,
+                        related: Dict[str, List[Dict[str, Any]]]) -> Callable[[str, List[Dict[str, Any]]], Iterator[str]]:
+        return lambda table_name, records: render_table_sql(table_name, records, output_format, batch_size,
+                                                            engine=engine, related=related)
+    
+    print("⏱️  BENCHMARK: motor por linha vs. motor colunar")
+    print(f"   Formato {output_format}" + (f" (lotes de {batch_size})" if batch_size > 1 else "") +
+          f", melhor de {repeat} execuções, NumPy: {numpy.__version__ if numpy else 'não instalado'}")
+    print("-" * 72)
+    print(f"{'Tabela':<12} | {'Linhas':>8} | {'Row (linhas/s)':>16} | {'Columnar (linhas/s)':>20} | {'Ganho':>6}")
+    print("-" * 72)
+    
+    winners: Dict[str, List[Tuple[int, str]]] = {}
+    for table_name in ENGINE_BENCHMARK_TABLES:
+        file_name = table_to_file[table_name]
+        if not datasets[file_name]:
+            print(f"❌ ERRO: Nenhum registro para {table_name}")
+            return False
+        
+        for size in sorted(sizes):
+            # Cópias consistentes do arquivo e dos relacionados (como no gerador, via RELATED_FILES)
+            related_files = RELATED_FILES.get(file_name, [])
+            copies = max(1, -(-size // len(datasets[file_name])))
+            replicas = replicate_dataset(datasets, copies, [file_name] + related_files)
+            records = replicas[file_name][:size]
+            related = {name: replicas[name] for name in related_files}
+            row_rate = measure_rows_per_second(engine_renderer("row", related), table_name, records, repeat)
+            columnar_rate = measure_rows_per_second(engine_renderer("columnar", related), table_name, records,
+                                                    repeat)
+            winners.setdefault(table_name, []).append((size, "columnar" if columnar_rate >= row_rate else "row"))
+            print(f"{table_name:<12} | {size:>8} | {row_rate:>16,.0f} | {columnar_rate:>20,.0f} | "
+                  f"{columnar_rate / row_rate:>5.2f}x")
+    
+    print("-" * 72)
+    for table_name, results in winners.items():
+        # Pontos de cruzamento: tamanhos em que o motor mais rápido muda
+        segments = [f"{results[0][1]} a partir de {results[0][0]}"]
+        for (_, previous), (size, winner) in zip(results, results[1:]):
+            if winner != previous:
+                segments.append(f"{winner} a partir de {size}")
+        print(f"   ↳ {table_name}: mais rápido = " + "; ".join(segments) + " linhas")
+    return True
+
+def shift_chain(node: Dict[str, Any], pokemon_offset: int, suffix: str) -> Dict[str, Any]:
+    """Copia um nó de evolution_chains deslocando os IDs de pokémon."""
+    shifted = dict(node)
+    if isinstance(node.get('pokemon'), dict):
+        pokemon = node['pokemon']
+        shifted['pokemon'] = {**pokemon, 'id': pokemon.get('id', 0) + pokemon_offset,
+                              'name': f"{pokemon.get('name')}{suffix}"}
+    shifted['evolutions_to'] = [
+        shift_chain(child, pokemon_offset, suffix) for child in node.get('evolutions_to') or []
+    ]
+    return shifted
+
+def replicate_record(file_name: str, record: Dict[str, Any], copy_index: int,
+                     max_ids: Dict[str, int]) -> Dict[str, Any]:
+    """
+    Cria a cópia copy_index de um registro, deslocando IDs e referências
+    para que a cópia continue consistente (e com nomes únicos).
+    """
+    if copy_index == 0:
+        return record
+    
+    def offset(source_file: str) -> int:
+        return max_ids[source_file] * copy_index
+    
+    suffix = f" #{copy_index}"
+    
+    if file_name == "09_pokemon.json":
+        return {
+            **record,
+            'id': record['id'] + offset("09_pokemon.json"),
+            'name': f"{record.get('name')}{suffix}",
+            'stats_id': record['stats_id'] + offset("07_stats.json") if record.get('stats_id') else None,
+            'species_id': record['species_id'] + offset("06_species.json") if record.get('species_id') else None,
+            'evolution_chain_id': (record['evolution_chain_id'] + offset("08_evolution_chains.json")
+                                   if record.get('evolution_chain_id') else None),
+            'abilities': [
+                {**ability, 'ability_id': ability['ability_id'] + offset("05_ability.json")}
+                for ability in record.get('abilities') or []
+            ],
+        }
+    if file_name == "08_evolution_chains.json":
+        return {
+            **record,
+            'id': record['id'] + offset(file_name),
+            'chain': shift_chain(record.get('chain') or {}, offset("09_pokemon.json"), suffix),
+        }
+    if file_name == "10_weaknesses.json":
+        return {
+            **record,
+            'id': record['id'] + offset(file_name),
+            'pokemon_id': record['pokemon_id'] + offset("09_pokemon.json"),
+            'pokemon_name': f"{record.get('pokemon_name')}{suffix}",
+        }
+    
+    replica = {**record, 'id': record['id'] + offset(file_name)}
+    for name_field in ('name', 'pokemon_name'):
+        if name_field in record:
+            replica[name_field] = f"{record[name_field]}{suffix}"
+    return replica
+
+def load_dataset(data_dir: Path) -> Dict[str, List[Dict[str, Any]]]:
+    return {file_name: load_json_file(data_dir / file_name) for file_name in FILE_TO_TABLE_MAPPING}
+
+def replicate_dataset(datasets: Dict[str, List[Dict[str, Any]]], scale: int,
+                      files: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    `scale` cópias dos arquivos (todos, ou só os de files), com IDs e referências deslocados
+    por replicate_record. Tabelas de referência não são multiplicadas.
+    """
+    max_ids = {
+        file_name: max((record.get('id') or 0 for record in records), default=0)
+        for file_name, records in datasets.items()
+    }
+    replicas = {}
+    for file_name in files or list(datasets):
+        records = datasets[file_name]
+        if file_name not in REFERENCE_FILES:
+            records = [
+                replicate_record(file_name, record, copy_index, max_ids)
+                for copy_index in range(scale)
+                for record in records
+            ]
+        replicas[file_name] = records
+    return replicas
+
+def synthesize_dataset(data_dir: Path, target_dir: Path, scale: int) -> Dict[str, int]:
+    """Gera um data/json sintético `scale` vezes maior; retorna registros por arquivo."""
+    target_dir.mkdir(parents=True, exist_ok=True)
+    
+    counts = {}
+    for file_name, records in replicate_dataset(load_dataset(data_dir), scale).items():
+        with open(target_dir / file_name, 'w', encoding='utf-8') as f:
+            json.dump(records, f, ensure_ascii=False)
+        counts[file_name] = len(records)
+    return counts
+
+def peak_rss_bytes() -> int:
+    """Pico de memória residente do processo atual."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta em KiB; macOS em bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def measure_generation(data_dir: Path, output_file: Path) -> Dict[str, Any]:
+    """
+    Executa a geração INSERT completa medindo cada etapa separadamente:
+    load_json_file, process_special_tables / generate_insert_sql e escrita do arquivo.
+    As seções recebem os arquivos relacionados (RELATED_FILES), como no gerador.
+    """
+    tables = []
+    loaded: Dict[str, List[Dict[str, Any]]] = {}
+    stage_seconds = {"load_json_file": 0.0, "process_special_tables": 0.0,
+                     "generate_insert_sql": 0.0, "write": 0.0}
+    total_start = time.perf_counter()
+    
+    writer = SqlFileWriter(output_file)
+    with writer:
+        for file_name in ordered_data_files():
+            table_name = FILE_TO_TABLE_MAPPING[file_name]
+            
+            start = time.perf_counter()
+            records = load_json_file(data_dir / file_name)
+            load_seconds = time.perf_counter() - start
+            loaded[file_name] = records
+            related = {name: loaded[name] for name in RELATED_FILES.get(file_name, []) if name in loaded}
+            
+            render_stage = "process_special_tables" if table_name in SPECIAL_TABLES else "generate_insert_sql"
+            start = time.perf_counter()
+            if render_stage == "process_special_tables":
+                statements = list(process_special_tables(table_name, records, related=related))
+            else:
+                statements = list(generate_insert_sql(table_name, records))
+            render_seconds = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            writer.write_lines(statements)
+            write_seconds = time.perf_counter() - start
+            
+            stage_seconds["load_json_file"] += load_seconds
+            stage_seconds[render_stage] += render_seconds
+            stage_seconds["write"] += write_seconds
+            tables.append({
+                "file": file_name,
+                "table": table_name,
+                "records": len(records),
+                "statements": len(statements),
+                "load_seconds": load_seconds,
+                "render_stage": render_stage,
+                "render_seconds": render_seconds,
+                "write_seconds": write_seconds,
+            })
+        
+        # O flush final do buffer conta como escrita
+        flush_start = time.perf_counter()
+    stage_seconds["write"] += time.perf_counter() - flush_start
+    
+    total_seconds = time.perf_counter() - total_start
+    records = sum(table["records"] for table in tables)
+    return {
+        "records": records,
+        "statements": sum(table["statements"] for table in tables),
+        "stage_seconds": stage_seconds,
+        "total_seconds": total_seconds,
+        "rows_per_second": records / total_seconds if total_seconds > 0 else 0.0,
+        "peak_rss_bytes": peak_rss_bytes(),
+        "output_bytes": output_file.stat().st_size,
+        "tables": tables,
+    }
+
+def run_measure_subprocess(data_dir: Path, output_file: Path, result_file: Path) -> Optional[Dict[str, Any]]:
+    """Mede uma escala em um processo separado, para que o pico de memória seja dela."""
+    command = [sys.executable, str(Path(__file__).resolve()), "--data-dir", str(data_dir),
+               "measure", "--output", str(output_file), "--result-file", str(result_file)]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    if completed.returncode != 0:
+        print(f"❌ ERRO: Medição falhou para {data_dir}:\n{completed.stdout}{completed.stderr}")
+        return None
+    with open(result_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def git_commit() -> Optional[str]:
+    """Commit atual do repositório, para identificar os resultados."""
+    try:
+        completed = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                   text=True, timeout=10, cwd=Path(__file__).parent)
+        return completed.stdout.strip() or None
+    except Exception:
+        return None
+
+def print_scaling_table(results: List[Dict[str, Any]]) -> None:
+    """Imprime o resumo por escala."""
+    print("-" * 118)
+    print(f"{'Escala':>6} | {'Registros':>9} | {'Comandos':>9} | {'load (s)':>8} | {'special (s)':>11} | "
+          f"{'insert (s)':>10} | {'write (s)':>9} | {'total (s)':>9} | {'linhas/s':>9} | {'RSS (MB)':>8} | {'Saída (MB)':>10}")
+    print("-" * 118)
+    for result in results:
+        stages = result["stage_seconds"]
+        print(f"{result['scale']:>5}x | {result['records']:>9} | {result['statements']:>9} | "
+              f"{stages['load_json_file']:>8.3f} | {stages['process_special_tables']:>11.3f} | "
+              f"{stages['generate_insert_sql']:>10.3f} | {stages['write']:>9.3f} | {result['total_seconds']:>9.3f} | "
+              f"{result['rows_per_second']:>9,.0f} | {result['peak_rss_bytes'] / 2**20:>8.1f} | "
+              f"{result['output_bytes'] / 2**20:>10.2f}")
+    print("-" * 118)
+
+def print_comparison(results: List[Dict[str, Any]], baseline_file: Path) -> None:
+    """Compara com um arquivo de resultados anterior (mesmas escalas)."""
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    previous = {result["scale"]: result for result in baseline.get("results", [])}
+    
+    print(f"\n📈 COMPARAÇÃO com {baseline_file} (commit {baseline.get('git_commit')}):")
+    for result in results:
+        old = previous.get(result["scale"])
+        if not old:
+            print(f"   {result['scale']:>5}x: sem resultado anterior")
+            continue
+        time_ratio = result["total_seconds"] / old["total_seconds"] if old["total_seconds"] else 0.0
+        rss_ratio = result["peak_rss_bytes"] / old["peak_rss_bytes"] if old["peak_rss_bytes"] else 0.0
+        status = "⚠️ " if time_ratio > 1.10 else "✅"
+        print(f"   {status} {result['scale']:>5}x: tempo {time_ratio:.2f}x, memória {rss_ratio:.2f}x do anterior")
+
+def run_scaling_benchmark(data_dir: Path, scales: List[int], results_file: Path,
+                          work_dir: Optional[Path], compare: Optional[Path]) -> bool:
+    """Gera os datasets sintéticos, mede cada escala e grava os resultados."""
+    temporary = work_dir is None
+    work_dir = Path(tempfile.mkdtemp(prefix="seed-benchmark-")) if temporary else work_dir
+    results = []
+    
+    print("⏱️  BENCHMARK DE ESCALABILIDADE: geração do init-data.sql")
+    print(f"   Escalas: {', '.join(f'{scale}x' for scale in scales)}")
+    print(f"   Diretório de trabalho: {work_dir}")
+    
+    try:
+        for scale in scales:
+            scale_dir = work_dir / f"scale_{scale}x"
+            print(f"\n📊 Gerando dataset sintético {scale}x...")
+            counts = synthesize_dataset(data_dir, scale_dir / "json", scale)
+            print(f"   {sum(counts.values())} registros em {len(counts)} arquivos")
+            
+            print(f"⏱️  Medindo geração {scale}x...")
+            result = run_measure_subprocess(scale_dir / "json", scale_dir / "init-data.sql",
+                                            scale_dir / "result.json")
+            if result is None:
+                return False
+            result["scale"] = scale
+            results.append(result)
+            print(f"✅ {result['records']} registros em {result['total_seconds']:.3f}s "
+                  f"({result['rows_per_second']:,.0f} linhas/s)")
+            
+            # Libera o disco antes da próxima escala
+            if temporary:
+                shutil.rmtree(scale_dir, ignore_errors=True)
+    finally:
+        if temporary:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    
+    print()
+    print_scaling_table(results)
+    
+    results_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(results_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            "benchmark": "seed_generation_scaling",
+            "created_at": datetime.now().isoformat(),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"💾 Resultados salvos em: {results_file}")
+    
+    if compare:
+        print_comparison(results, compare)
+    return True
+
+def parse_args() -> argparse.Namespace:
+    """Lê os argumentos de linha de comando."""
+    project_root = Path(__file__).parent.parent.parent  # Sobe para raiz do projeto
+    
+    parser = argparse.ArgumentParser(description="Benchmarks do gerador de seeds da Pokédex.")
+    parser.add_argument("--data-dir", type=Path, default=project_root / "data" / "json",
+                        help="Diretório com os arquivos JSON (padrão: data/json)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    encoders = subparsers.add_parser("encoders", help="Legado vs. codificadores compilados (linhas/s)")
+    encoders.add_argument("--min-rows", type=int, default=20000,
+                          help="Linhas mínimas por tabela (registros são repetidos)")
+    encoders.add_argument("--repeat", type=int, default=3, help="Execuções por medição")
+    
+    engines = subparsers.add_parser("engines", help="Motor por linha vs. colunar por tamanho (linhas/s)")
+    engines.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_ENGINE_SIZES,
+                         help="Linhas por medição (padrão: 100 1000 10000 100000)")
+    engines.add_argument("--format", dest="output_format", choices=["insert", "copy"], default="copy",
+                         help="Formato de saída medido (padrão: copy)")
+    engines.add_argument("--batch-size", type=int, default=1, help="Registros por INSERT no formato insert")
+    engines.add_argument("--repeat", type=int, default=3, help="Execuções por medição")
+    
+    scaling = subparsers.add_parser("scaling", help="Datasets sintéticos em várias escalas, etapa por etapa")
+    scaling.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES,
+                         help="Multiplicadores do dataset (padrão: 1 10 100 1000)")
+    scaling.add_argument("--results", type=Path,
+                         default=project_root / "build" / "benchmarks" / "seed_generation.json",
+                         help="Arquivo JSON de resultados (padrão: build/benchmarks/seed_generation.json)")
+    scaling.add_argument("--work-dir", type=Path,
+                         help="Mantém os datasets sintéticos neste diretório (padrão: temporário)")
+    scaling.add_argument("--compare", type=Path, help="Resultados anteriores para comparação")
+    
+    synthesize = subparsers.add_parser("synthesize", help="Apenas gera um dataset sintético")
+    synthesize.add_argument("--scale", type=int, required=True, help="Multiplicador do dataset")
+    synthesize.add_argument("--output-dir", type=Path, required=True, help="Diretório de saída dos JSONs")
+    
+    # Uso interno: medição de uma escala em processo isolado
+    measure = subparsers.add_parser("measure", help=argparse.SUPPRESS)
+    measure.add_argument("--output", type=Path, required=True)
+    measure.add_argument("--result-file", type=Path, required=True)
+    return parser.parse_args()
+
+def main():
+    """Função principal."""
+    args = parse_args()
+    
+    if args.command == "encoders":
+        success = run_encoder_benchmark(args.data_dir, args.min_rows, args.repeat)
+    elif args.command == "engines":
+        success = run_engine_benchmark(args.data_dir, args.sizes, args.output_format, args.batch_size, args.repeat)
+    elif args.command == "scaling":
+        success = run_scaling_benchmark(args.data_dir, args.scales, args.results, args.work_dir, args.compare)
+    elif args.command == "synthesize":
+        counts = synthesize_dataset(args.data_dir, args.output_dir, args.scale)
+        print(f"✅ Dataset {args.scale}x gerado em {args.output_dir}: {sum(counts.values())} registros")
+        success = True
+    else:
+        result = measure_generation(args.data_dir, args.output)
+        with open(args.result_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        success = True
+    
+    sys.exit(0 if success else 1)
+
+if __name__ == "__main__":
+    main()
@@ -4,24 +4,60 @@ Script para verificar dependências necessárias para o ambiente de desenvolvime
 Verifica se todas as ferramentas necessárias estão instaladas e configuradas.
 """
 
+import argparse
 import sys
 import subprocess
 import platform
-from typing import Tuple, Dict
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple, Dict
+
+# Prazo único para todas as verificações (segundos), em vez de um timeout por comando
+DEFAULT_TIMEOUT = 20.0
+TIMEOUT_MESSAGE = "tempo esgotado"
+
+_deadline: Optional[float] = None
+
+def set_deadline(seconds: float) -> None:
+    """Define o prazo global, contado a partir de agora."""
+    global _deadline
+    _deadline = time.monotonic() + seconds
+
+def remaining_time() -> float:
+    if _deadline is None:
+        return DEFAULT_TIMEOUT
+    return max(0.0, _deadline - time.monotonic())
 
 def run_command(command: str) -> Tuple[bool, str]:
-    """Executa um comando e retorna status e output."""
+    """Executa um comando (limitado ao que resta do prazo) e retorna status e output."""
+    timeout = remaining_time()
+    if timeout <= 0:
+        return False, TIMEOUT_MESSAGE
     try:
         result = subprocess.run(
             command.split(),
             capture_output=True,
             text=True,
-            timeout=10
+            timeout=timeout
         )
         return result.returncode == 0, result.stdout.strip()
+    except subprocess.TimeoutExpired:
+        return False, TIMEOUT_MESSAGE
     except Exception as e:
         return False, str(e)
 
+def run_commands(commands: List[str]) -> List[Tuple[bool, str]]:
+    """Executa os comandos em paralelo; os resultados seguem a ordem da lista."""
+    with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        return list(executor.map(run_command, commands))
+
+def first_success(commands: List[str]) -> Optional[Tuple[int, str]]:
+    """Índice e output do primeiro comando (na ordem da lista) bem sucedido, todos testados em paralelo."""
+    for index, (success, output) in enumerate(run_commands(commands)):
+        if success:
+            return index, output
+    return None
+
 def check_python() -> Tuple[bool, str]:
     """Verifica se Python 3.7+ está disponível."""
     version = sys.version_info
@@ -39,27 +75,17 @@ def check_docker() -> Tuple[bool, str]:
         "/usr/bin/docker"  # Linux
     ]
     
-    docker_cmd = None
-    version_output = None
-    
-    # Procura Docker em diferentes locais
-    for path in docker_paths:
-        if path == "docker":
-            success, output = run_command("docker --version")
-        else:
-            success, output = run_command(f"{path} --version")
-        
-        if success:
-            docker_cmd = path
-            version_output = output
-            break
+    # Procura Docker em todos os locais ao mesmo tempo; vale o primeiro da lista encontrado
+    found = first_success([f"{path} --version" for path in docker_paths])
+    docker_cmd, version_output = (docker_paths[found[0]], found[1]) if found else (None, None)
     
     if not docker_cmd:
         return False, "Docker não encontrado. Instale o Docker Desktop ou adicione Docker ao PATH"
     
     # Verifica se Docker daemon está rodando
-    info_cmd = f"{docker_cmd} info" if docker_cmd != "docker" else "docker info"
-    success_ping, _ = run_command(info_cmd)
+    success_ping, ping_output = run_command(f"{docker_cmd} info")
+    if ping_output == TIMEOUT_MESSAGE:
+        return False, f"{version_output} (Docker não respondeu a 'docker info' dentro do prazo)"
     if not success_ping:
         return False, f"{version_output} (Docker Desktop não está rodando - abra o Docker Desktop e aguarde inicializar)"
     
@@ -75,17 +101,7 @@ def check_docker_compose() -> Tuple[bool, str]:
         "/usr/bin/docker"  # Linux
     ]
     
-    # Primeiro tenta docker compose (versão nova)
-    for docker_path in docker_paths:
-        if docker_path == "docker":
-            success, output = run_command("docker compose version")
-        else:
-            success, output = run_command(f"{docker_path} compose version")
-        
-        if success:
-            return True, output
-    
-    # Fallback para docker-compose (versão legacy)
+    # docker-compose (versão legacy)
     docker_compose_paths = [
         "docker-compose",  # No PATH
         "/usr/local/bin/docker-compose",  # Instalação padrão
@@ -93,10 +109,11 @@ def check_docker_compose() -> Tuple[bool, str]:
         "/usr/bin/docker-compose"  # Linux
     ]
     
-    for path in docker_compose_paths:
-        success, output = run_command(f"{path} --version")
-        if success:
-            return True, output
+    # Todos os candidatos em paralelo; docker compose (versão nova) tem prioridade sobre o legacy
+    found = first_success([f"{path} compose version" for path in docker_paths] +
+                          [f"{path} --version" for path in docker_compose_paths])
+    if found:
+        return True, found[1]
     
     return False, "Docker Compose não encontrado"
 
@@ -147,58 +164,63 @@ def get_installation_instructions() -> Dict[str, Dict[str, str]]:
     
     return instructions
 
-def run_essential_checks():
-    """Executa verificações de dependências essenciais."""
-    essential_checks = [
-        ("Docker", check_docker),
-        ("Make", check_make),
-        ("Python3", check_python)
-    ]
-    
+ESSENTIAL_CHECKS = [
+    ("Docker", check_docker),
+    ("Make", check_make),
+    ("Python3", check_python)
+]
+
+OPTIONAL_CHECKS = [
+    ("psycopg2 (Python)", check_psycopg2)
+]
+
+Probe = Tuple[str, "Future[Tuple[bool, str, float]]"]
+
+def timed_check(check_func: Callable[[], Tuple[bool, str]]) -> Tuple[bool, str, float]:
+    """Executa uma verificação e mede quanto ela levou."""
+    start = time.perf_counter()
+    try:
+        success, message = check_func()
+    except Exception as e:
+        success, message = False, f"Erro na verificação: {str(e)}"
+    return success, message, time.perf_counter() - start
+
+def start_checks(executor: ThreadPoolExecutor, checks) -> List[Probe]:
+    """Dispara as verificações no pool; os resultados são lidos depois, na ordem da lista."""
+    return [(name, executor.submit(timed_check, check_func)) for name, check_func in checks]
+
+def run_essential_checks(probes: List[Probe]):
+    """Reporta as verificações de dependências essenciais (já em execução)."""
     results = []
     all_ok = True
     
     print("\n🛠️  DEPENDÊNCIAS ESSENCIAIS:")
     print("-" * 40)
     
-    for name, check_func in essential_checks:
-        try:
-            success, message = check_func()
-            results.append((name, success, message))
-            status = "✅" if success else "❌"
-            print(f"{status} {name}: {message}")
-            if not success:
-                all_ok = False
-        except Exception as e:
-            results.append((name, False, f"Erro na verificação: {str(e)}"))
-            print(f"❌ {name}: Erro na verificação: {str(e)}")
+    for name, future in probes:
+        success, message, seconds = future.result()
+        results.append((name, success, message))
+        status = "✅" if success else "❌"
+        print(f"{status} {name}: {message} ({seconds:.2f}s)")
+        if not success:
             all_ok = False
     
     return results, all_ok
 
 
-def run_optional_checks():
-    """Executa verificações de dependências opcionais."""
-    optional_checks = [
-        ("psycopg2 (Python)", check_psycopg2)
-    ]
-    
+def run_optional_checks(probes: List[Probe]):
+    """Reporta as verificações de dependências opcionais (já em execução)."""
     results = []
     
     print("\n🔧 DEPENDÊNCIAS OPCIONAIS:")
     print("-" * 40)
     
-    for name, check_func in optional_checks:
-        try:
-            success, message = check_func()
-            results.append((name, success, message))
-            status = "✅" if success else "⚠️"
-            print(f"{status} {name}: {message}")
-            if not success:
-                print("   💡 Esta dependência é opcional para comandos básicos")
-        except Exception as e:
-            results.append((name, False, f"Erro na verificação: {str(e)}"))
-            print(f"⚠️ {name}: Erro na verificação: {str(e)}")
+    for name, future in probes:
+        success, message, seconds = future.result()
+        results.append((name, success, message))
+        status = "✅" if success else "⚠️"
+        print(f"{status} {name}: {message} ({seconds:.2f}s)")
+        if not success:
             print("   💡 Esta dependência é opcional para comandos básicos")
     
     return results
@@ -224,14 +246,26 @@ def print_installation_instructions(results, system):
 
 def main():
     """Executa todas as verificações de dependências."""
+    parser = argparse.ArgumentParser(description='Verifica as dependências do ambiente de desenvolvimento')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f'Prazo total das verificações, em segundos (padrão: {DEFAULT_TIMEOUT:g})')
+    args = parser.parse_args()
+    
     print("🔍 VERIFICANDO DEPENDÊNCIAS DO PROJETO...")
     print("=" * 60)
     
     system = platform.system()
     
-    # Executar verificações
-    essential_results, all_ok = run_essential_checks()
-    optional_results = run_optional_checks()
+    # Executar verificações: todas em paralelo, sob um único prazo; o relatório segue a ordem das listas
+    start = time.perf_counter()
+    set_deadline(args.timeout)
+    with ThreadPoolExecutor(max_workers=len(ESSENTIAL_CHECKS) + len(OPTIONAL_CHECKS)) as executor:
+        essential_probes = start_checks(executor, ESSENTIAL_CHECKS)
+        optional_probes = start_checks(executor, OPTIONAL_CHECKS)
+        essential_results, all_ok = run_essential_checks(essential_probes)
+        optional_results = run_optional_checks(optional_probes)
+    
+    print(f"\n⏱️  Verificações concluídas em {time.perf_counter() - start:.2f}s (prazo: {args.timeout:g}s)")
     
     # Combinar resultados
     all_results = essential_results + optional_results
@@ -1,11 +1,49 @@
 #!/usr/bin/env python3
 """
 Script auxiliar para detectar comandos Docker corretos para uso no Makefile.
+
+O resultado fica em cache (build/cache/docker-commands.json), indexado pelo PATH e pelo
+mtime dos binários candidatos: enquanto nada mudar, a detecção não executa nenhum
+subprocesso. O modo 'all' resolve os dois comandos em uma única chamada.
 """
 
+import argparse
+import json
+import os
+import shutil
 import subprocess
 import sys
-from typing import Optional
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CACHE_FILE = PROJECT_ROOT / "build" / "cache" / "docker-commands.json"
+CACHE_VERSION = 1
+
+DOCKER_PATHS = [
+    "docker",  # No PATH
+    "/usr/local/bin/docker",  # Instalação padrão
+    "/Applications/Docker.app/Contents/Resources/bin/docker",  # Docker Desktop no macOS
+    "/usr/bin/docker"  # Linux
+]
+
+DOCKER_COMPOSE_PATHS = [
+    "docker-compose",  # No PATH
+    "/usr/local/bin/docker-compose",  # Instalação padrão
+    "/Applications/Docker.app/Contents/Resources/bin/docker-compose",  # Docker Desktop no macOS
+    "/usr/bin/docker-compose"  # Linux
+]
+
+# Plugin do 'docker compose' (instalá-lo não muda o binário do docker)
+COMPOSE_PLUGIN_PATHS = [
+    "~/.docker/cli-plugins/docker-compose",
+    "/usr/local/lib/docker/cli-plugins/docker-compose",
+    "/usr/libexec/docker/cli-plugins/docker-compose",
+    "/usr/lib/docker/cli-plugins/docker-compose"
+]
+
+# Valores usados pelo Makefile quando um comando não é encontrado
+DEFAULT_COMMANDS = {"docker": "docker", "docker-compose": "docker compose"}
 
 def run_command(command: str) -> bool:
     """Executa um comando e retorna True se bem sucedido."""
@@ -22,64 +60,107 @@ def run_command(command: str) -> bool:
 
 def find_docker_command() -> Optional[str]:
     """Encontra o comando Docker correto."""
-    docker_paths = [
-        "docker",  # No PATH
-        "/usr/local/bin/docker",  # Instalação padrão
-        "/Applications/Docker.app/Contents/Resources/bin/docker",  # Docker Desktop no macOS
-        "/usr/bin/docker"  # Linux
-    ]
-    
-    for path in docker_paths:
+    for path in DOCKER_PATHS:
         if run_command(f"{path} --version"):
             return path
     
     return None
 
-def find_docker_compose_command() -> Optional[str]:
-    """Encontra o comando Docker Compose correto."""
+def find_docker_compose_command(docker_cmd: Optional[str] = None) -> Optional[str]:
+    """
+    Encontra o comando Docker Compose correto.
+    docker_cmd evita repetir a busca do docker quando ele já foi resolvido ("" se não encontrado).
+    """
     # Primeiro tenta docker compose (versão nova)
-    docker_cmd = find_docker_command()
+    if docker_cmd is None:
+        docker_cmd = find_docker_command()
     if docker_cmd:
         if run_command(f"{docker_cmd} compose version"):
             return f"{docker_cmd} compose"
     
     # Fallback para docker-compose (versão legacy)
-    docker_compose_paths = [
-        "docker-compose",  # No PATH
-        "/usr/local/bin/docker-compose",  # Instalação padrão
-        "/Applications/Docker.app/Contents/Resources/bin/docker-compose",  # Docker Desktop no macOS
-        "/usr/bin/docker-compose"  # Linux
-    ]
-    
-    for path in docker_compose_paths:
+    for path in DOCKER_COMPOSE_PATHS:
         if run_command(f"{path} --version"):
             return path
     
     return None
 
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Uso: python3 detect_docker_commands.py [docker|docker-compose]")
-        sys.exit(1)
+def cache_key() -> Dict[str, Any]:
+    """PATH e mtime de cada candidato (None se ausente); qualquer instalação ou atualização muda a chave."""
+    binaries = {}
+    for candidate in DOCKER_PATHS + DOCKER_COMPOSE_PATHS + COMPOSE_PLUGIN_PATHS:
+        resolved = shutil.which(os.path.expanduser(candidate))
+        try:
+            binaries[candidate] = [resolved, os.stat(resolved).st_mtime_ns] if resolved else None
+        except OSError:
+            binaries[candidate] = None
+    return {"version": CACHE_VERSION, "path": os.environ.get("PATH", ""), "binaries": binaries}
+
+def load_cached_commands(key: Dict[str, Any], cache_file: Path = CACHE_FILE) -> Optional[Dict[str, Optional[str]]]:
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    return cached.get("commands")
+
+def save_cached_commands(key: Dict[str, Any], commands: Dict[str, Optional[str]],
+                         cache_file: Path = CACHE_FILE) -> None:
+    """Grava o cache de forma atômica; falhas de escrita (ex.: diretório sem permissão) são ignoradas."""
+    temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({"key": key, "commands": commands}, f, indent=2)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+    finally:
+        temp_file.unlink(missing_ok=True)
+
+def detect_commands(use_cache: bool = True) -> Dict[str, Optional[str]]:
+    """Resolve docker e docker-compose juntos (o docker encontrado é reaproveitado pelo compose)."""
+    key = cache_key()
+    if use_cache:
+        cached = load_cached_commands(key)
+        if cached is not None:
+            return cached
     
-    command_type = sys.argv[1]
+    docker_cmd = find_docker_command()
+    # "" (e não None): docker já procurado e não encontrado, não repete a busca
+    commands = {"docker": docker_cmd, "docker-compose": find_docker_compose_command(docker_cmd or "")}
+    save_cached_commands(key, commands)
+    return commands
+
+def main():
+    parser = argparse.ArgumentParser(description='Detecta os comandos Docker para o Makefile')
+    parser.add_argument('command_type', choices=['docker', 'docker-compose', 'all'],
+                        help="Comando a detectar; 'all' imprime '<docker>|<docker compose>', "
+                             "com os padrões do Makefile para os não encontrados")
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignora o cache e refaz a detecção')
     
-    if command_type == "docker":
-        docker_cmd = find_docker_command()
-        if docker_cmd:
-            print(docker_cmd)
+    args = parser.parse_args()
+    commands = detect_commands(use_cache=not args.no_cache)
+    
+    if args.command_type == "all":
+        print("|".join(commands[name] or default for name, default in DEFAULT_COMMANDS.items()))
+    
+    elif args.command_type == "docker":
+        if commands["docker"]:
+            print(commands["docker"])
         else:
             print("DOCKER_NOT_FOUND")
             sys.exit(1)
     
-    elif command_type == "docker-compose":
-        docker_compose_cmd = find_docker_compose_command()
-        if docker_compose_cmd:
-            print(docker_compose_cmd)
+    else:
+        if commands["docker-compose"]:
+            print(commands["docker-compose"])
         else:
             print("DOCKER_COMPOSE_NOT_FOUND")
             sys.exit(1)
-    
-    else:
-        print("Tipo de comando inválido. Use 'docker' ou 'docker-compose'")
-        sys.exit(1)
\ No newline at end of file
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Gera um SQL incremental (delta) entre duas versões do dataset, para migrar um banco
+já carregado sem o DROP TABLE + recarga completa do init-data.sql.
+Cada versão é um diretório de JSONs ou um arquivo de snapshot (ver seed_snapshot).
+As linhas vêm dos mesmos codificadores do generate_sql_from_json.py e são comparadas
+pela chave primária de cada tabela no schema.sql:
+- linhas novas: INSERT ... ON CONFLICT (chave) DO UPDATE (reaplicar o delta é seguro)
+- linhas alteradas: UPDATE apenas das colunas que mudaram
+- linhas removidas: DELETE
+Tabelas sem a chave primária entre as colunas geradas (ex.: pokemon_abilities, cujo id
+é serial) são comparadas como conjuntos de linhas. Tudo roda em uma única transação:
+inserções e atualizações na ordem de carga, remoções na ordem inversa.
+"""
+
+import argparse
+import json
+import shutil
+import sys
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from generate_sql_from_json import (
+    FILE_TO_TABLE_MAPPING,
+    RowEncoder,
+    SqlFileWriter,
+    RELATED_FILES,
+    collect_table_rows,
+    generated_at,
+    join_table_encoder,
+    ordered_data_files,
+    positive_int,
+)
+from seed_json import JSON_BACKENDS, load_json_records
+from seed_schema import DEFAULT_SCHEMA_FILE, SchemaModel, load_schema_model
+from seed_snapshot import DatasetSnapshot, build_snapshot, open_snapshot
+
+# Linhas por INSERT e por DELETE ... IN (...)
+DEFAULT_BATCH_SIZE = 500
+
+Row = Tuple[Any, ...]
+
+class DatasetVersion:
+    """Uma versão do dataset: diretório de JSONs ou arquivo de snapshot."""
+    
+    def __init__(self, source: Path, json_backend: str = "auto", use_snapshot: bool = False):
+        self.source = source
+        self.json_backend = json_backend
+        self.snapshot: Optional[DatasetSnapshot] = None
+        self._records: Dict[str, List[Dict[str, Any]]] = {}
+        if source.is_file():
+            self.snapshot = DatasetSnapshot(source)
+            if not self.snapshot.is_compatible():
+                self.snapshot.close()
+                raise ValueError(f"{source} foi gerado por outra versão do formato ou do Python "
+                                 f"({self.snapshot.header.get('python')})")
+        elif use_snapshot:
+            try:
+                self.snapshot = open_snapshot(source, json_backend=json_backend)
+            except Exception as e:
+                print(f"⚠️  AVISO: Snapshot indisponível ({e}); lendo os JSONs diretamente")
+    
+    def records(self, file_name: str) -> List[Dict[str, Any]]:
+        """Registros de um arquivo. Arquivo ausente ou inválido é erro: geraria DELETEs de tudo."""
+        if self.snapshot is not None:
+            records = self.snapshot.records(file_name)
+            if records is None:
+                raise RuntimeError(f"{file_name} não existe no snapshot {self.source}")
+            return records
+        if file_name not in self._records:  # Arquivos relacionados são lidos por mais de uma tabela
+            file_path = self.source / file_name
+            if not file_path.exists():
+                raise RuntimeError(f"Arquivo {file_name} não encontrado em {self.source}")
+            try:
+                self._records[file_name] = load_json_records(file_path, self.json_backend)
+            except ValueError as e:
+                raise RuntimeError(f"Falha ao parsear JSON em {file_path}: {e}")
+        return self._records[file_name]
+    
+    def close(self) -> None:
+        if self.snapshot is not None:
+            self.snapshot.close()
+
+@dataclass
+class TableDelta:
+    """Diferenças de um bloco de linhas (tabela principal ou de relacionamento) entre as versões."""
+    table_name: str
+    key_columns: List[str]
+    upserts: List[str] = field(default_factory=list)
+    updates: List[str] = field(default_factory=list)
+    deletes: List[str] = field(default_factory=list)
+    inserted: int = 0
+    changed: int = 0
+    removed: int = 0
+    
+    @property
+    def empty(self) -> bool:
+        return not (self.inserted or self.changed or self.removed)
+
+def batches(rows: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """Agrupa os itens em listas de até batch_size elementos."""
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def aligned_rows(encoder: RowEncoder, rows: Iterable[Row], columns: List[str]) -> List[Row]:
+    """Linhas reordenadas para as colunas informadas (colunas ausentes no codificador viram None)."""
+    positions = [encoder.columns.index(column) if column in encoder.columns else None for column in columns]
+    return [tuple(row[position] if position is not None else None for position in positions) for row in rows]
+
+def hashable_row(row: Row) -> Row:
+    """Chave de comparação de uma linha inteira (valores JSON serializados)."""
+    return tuple(json.dumps(value, sort_keys=True) if isinstance(value, (dict, list)) else value for value in row)
+
+def sql_condition(column: str, value: Any, escape) -> str:
+    return f"{column} IS NULL" if value is None else f"{column} = {escape(value)}"
+
+def row_conditions(encoder: RowEncoder, row: Row) -> str:
+    """Condição que identifica uma linha pelos valores de todas as colunas."""
+    return " AND ".join(sql_condition(column, value, escape)
+                        for column, value, escape in zip(encoder.columns, row, encoder.sql_escapers))
+
+def insert_statements(encoder: RowEncoder, rows: List[Row], batch_size: int, conflict: str = "") -> Iterator[str]:
+    """INSERTs com até batch_size linhas, no mesmo formato do gerador; conflict é a cláusula ON CONFLICT."""
+    for batch in batches(rows, batch_size):
+        if len(batch) == 1:
+            yield f"{encoder.insert_prefix}{encoder.sql_values(batch[0])}){conflict};"
+        else:
+            values_str = ",\n".join(["(" + encoder.sql_values(row) + ")" for row in batch])
+            yield f"INSERT INTO {encoder.table_name} ({encoder.columns_sql}) VALUES\n{values_str}{conflict};"
+
+def diff_rows(encoder: RowEncoder, key_columns: List[str], old_rows: List[Row], new_rows: List[Row],
+              batch_size: int) -> TableDelta:
+    """
+    Compara as linhas das duas versões (já alinhadas às colunas do codificador).
+    Com key_columns, as linhas são indexadas pela chave; sem elas, comparadas como conjuntos.
+    """
+    table_name = encoder.table_name
+    escapers = dict(zip(encoder.columns, encoder.sql_escapers))
+    delta = TableDelta(table_name, key_columns)
+    
+    if not key_columns:
+        old_set = {hashable_row(row): row for row in old_rows}
+        new_set = {hashable_row(row): row for row in new_rows}
+        inserted = [row for key, row in new_set.items() if key not in old_set]
+        removed = [row for key, row in old_set.items() if key not in new_set]
+        delta.inserted, delta.removed = len(inserted), len(removed)
+        for row in inserted:
+            # Sem chave para o ON CONFLICT: NOT EXISTS mantém o delta reaplicável
+            delta.upserts.append(f"INSERT INTO {table_name} ({encoder.columns_sql}) SELECT {encoder.sql_values(row)} "
+                                 f"WHERE NOT EXISTS (SELECT 1 FROM {table_name} WHERE {row_conditions(encoder, row)});")
+        for row in removed:
+            delta.deletes.append(f"DELETE FROM {table_name} WHERE {row_conditions(encoder, row)};")
+        return delta
+    
+    key_positions = [encoder.columns.index(column) for column in key_columns]
+    old_index = {tuple(row[position] for position in key_positions): row for row in old_rows}
+    new_index = {tuple(row[position] for position in key_positions): row for row in new_rows}
+    
+    inserted = []
+    for key, row in new_index.items():
+        if key not in old_index:
+            inserted.append(row)
+            continue
+        previous = old_index[key]
+        if previous == row:
+            continue
+        delta.changed += 1
+        assignments = ", ".join(f"{column} = {escapers[column](value)}"
+                                for column, old_value, value in zip(encoder.columns, previous, row)
+                                if old_value != value)
+        conditions = " AND ".join(sql_condition(column, value, escapers[column])
+                                  for column, value in zip(key_columns, key))
+        delta.updates.append(f"UPDATE {table_name} SET {assignments} WHERE {conditions};")
+    
+    value_columns = [column for column in encoder.columns if column not in key_columns]
+    conflict = f" ON CONFLICT ({', '.join(key_columns)}) DO " + (
+        "UPDATE SET " + ", ".join(f"{column} = EXCLUDED.{column}" for column in value_columns)
+        if value_columns else "NOTHING")
+    delta.inserted = len(inserted)
+    delta.upserts.extend(insert_statements(encoder, inserted, batch_size, conflict))
+    
+    removed = [key for key in old_index if key not in new_index]
+    delta.removed = len(removed)
+    for batch in batches(removed, batch_size):
+        if len(key_columns) == 1:
+            escape = escapers[key_columns[0]]
+            keys_sql = ", ".join(escape(key[0]) for key in batch)
+            delta.deletes.append(f"DELETE FROM {table_name} WHERE {key_columns[0]} IN ({keys_sql});")
+        else:
+            keys_sql = ", ".join("(" + ", ".join(escapers[column](value) for column, value in zip(key_columns, key)) + ")"
+                                 for key in batch)
+            delta.deletes.append(f"DELETE FROM {table_name} WHERE ({', '.join(key_columns)}) IN ({keys_sql});")
+    return delta
+
+def diff_file(file_name: str, old: DatasetVersion, new: DatasetVersion, schema: SchemaModel,
+              batch_size: int) -> List[TableDelta]:
+    """Diferenças de um arquivo JSON: tabela principal e tabelas de relacionamento geradas a partir dele."""
+    table_name = FILE_TO_TABLE_MAPPING[file_name]
+    related_files = RELATED_FILES.get(file_name, [])
+    old_blocks = collect_table_rows(table_name, old.records(file_name), schema,
+                                    {name: old.records(name) for name in related_files})
+    new_blocks = collect_table_rows(table_name, new.records(file_name), schema,
+                                    {name: new.records(name) for name in related_files})
+    
+    deltas = []
+    for (old_encoder, old_rows), (new_encoder, new_rows) in zip(old_blocks, new_blocks):
+        # Colunas da versão nova, mais as que só existiam na anterior (passam a NULL)
+        columns = new_encoder.columns + [column for column in old_encoder.columns
+                                         if column not in new_encoder.columns]
+        kinds = new_encoder.kinds + [kind for column, kind in zip(old_encoder.columns, old_encoder.kinds)
+                                     if column not in new_encoder.columns]
+        encoder = join_table_encoder(new_encoder.table_name, columns, kinds)
+        
+        table = schema.tables.get(encoder.table_name)
+        primary_key = table.primary_key if table else []
+        key_columns = primary_key if primary_key and all(column in columns for column in primary_key) else []
+        
+        deltas.append(diff_rows(encoder, key_columns, aligned_rows(old_encoder, old_rows, columns),
+                                aligned_rows(new_encoder, new_rows, columns), batch_size))
+    return deltas
+
+def generate_seed_diff(old: DatasetVersion, new: DatasetVersion, output_file: Path,
+                       schema_file: Path = DEFAULT_SCHEMA_FILE,
+                       batch_size: int = DEFAULT_BATCH_SIZE) -> bool:
+    """
+    Compara as versões e grava o SQL incremental em output_file.
+    Inserções/atualizações seguem a ordem de carga (pais antes dos dependentes);
+    remoções seguem a ordem inversa, depois das atualizações que deixam de referenciar as linhas.
+    """
+    print("🚀 Iniciando geração do SQL incremental...")
+    print(f"📁 Versão anterior: {old.source}" + (" (snapshot)" if old.snapshot else ""))
+    print(f"📁 Versão nova: {new.source}" + (" (snapshot)" if new.snapshot else ""))
+    print(f"📄 Arquivo de saída: {output_file}")
+    print(f"📐 Schema: {schema_file}")
+    print()
+    
+    schema = load_schema_model(schema_file)
+    deltas: List[TableDelta] = []
+    try:
+        for file_name in ordered_data_files(schema):
+            print(f"📊 Comparando {file_name} -> tabela '{FILE_TO_TABLE_MAPPING[file_name]}'...")
+            file_deltas = diff_file(file_name, old, new, schema, batch_size)
+            for delta in file_deltas:
+                if not delta.empty:
+                    key = ", ".join(delta.key_columns) if delta.key_columns else "linha inteira"
+                    print(f"   🔀 {delta.table_name} (chave: {key}): {delta.inserted} novas, "
+                          f"{delta.changed} alteradas, {delta.removed} removidas")
+            deltas.extend(file_deltas)
+    except (RuntimeError, ValueError) as e:
+        print(f"❌ ERRO: {e}")
+        return False
+    
+    statement_count = 0
+    try:
+        with SqlFileWriter(output_file) as writer:
+            writer.write_lines([
+                f"-- {output_file.name}",
+                "-- SQL incremental gerado a partir de duas versões dos JSONs de dados",
+                f"-- Versão anterior: {old.source}",
+                f"-- Versão nova: {new.source}",
+                f"-- Gerado em: {generated_at()}",
+                "",
+                "BEGIN;",
+                "",
+            ])
+            for delta in deltas:
+                if delta.upserts or delta.updates:
+                    writer.write_line(f"-- Inserções/atualizações: {delta.table_name}")
+                    statement_count += writer.write_lines(delta.upserts + delta.updates)
+                    writer.write_line("")
+            for delta in reversed(deltas):
+                if delta.deletes:
+                    writer.write_line(f"-- Remoções: {delta.table_name}")
+                    statement_count += writer.write_lines(delta.deletes)
+                    writer.write_line("")
+            writer.write_line("COMMIT;")
+    except OSError as e:
+        print(f"❌ ERRO CRÍTICO: Falha ao escrever arquivo SQL: {e}")
+        return False
+    
+    print()
+    if statement_count:
+        print("📁 SQL incremental gerado com sucesso!")
+    else:
+        print("✅ Nenhuma diferença entre as versões (o arquivo contém apenas a transação vazia)")
+    print(f"📊 Resumo final:")
+    print(f"   ➕ Linhas novas: {sum(delta.inserted for delta in deltas)}")
+    print(f"   ✏️  Linhas alteradas: {sum(delta.changed for delta in deltas)}")
+    print(f"   ➖ Linhas removidas: {sum(delta.removed for delta in deltas)}")
+    print(f"   📄 Comandos SQL: {statement_count}")
+    print(f"   💾 Arquivo salvo em: {output_file}")
+    return True
+
+def parse_args() -> argparse.Namespace:
+    """Lê os argumentos de linha de comando."""
+    project_root = Path(__file__).parent.parent.parent  # Sobe para raiz do projeto
+    
+    parser = argparse.ArgumentParser(description="Gera o SQL incremental entre duas versões dos JSONs da Pokédex.")
+    parser.add_argument("old", type=Path,
+                        help="Versão anterior: diretório de JSONs ou arquivo de snapshot do dataset")
+    parser.add_argument("new", nargs="?", type=Path, default=project_root / "data" / "json",
+                        help="Versão nova: diretório de JSONs ou arquivo de snapshot (padrão: data/json)")
+    parser.add_argument("--output", type=Path,
+                        default=project_root / "database" / "seeds" / "delta-data.sql",
+                        help="Arquivo SQL de saída (padrão: database/seeds/delta-data.sql)")
+    parser.add_argument("--schema", type=Path, default=DEFAULT_SCHEMA_FILE,
+                        help="Schema com as chaves primárias e a ordem de carga (padrão: database/schema/schema.sql)")
+    parser.add_argument("--batch-size", type=positive_int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Linhas por INSERT e chaves por DELETE (padrão: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--snapshot", action="store_true",
+                        help="Lê as versões em diretório pelo snapshot do dataset (build/cache)")
+    parser.add_argument("--save-snapshot", type=Path, metavar="ARQUIVO",
+                        help="Depois de gerar o delta, grava o snapshot da versão nova neste arquivo "
+                             "(base para o próximo delta)")
+    parser.add_argument("--json-backend", choices=JSON_BACKENDS, default="auto",
+                        help="Parser dos JSONs (ver generate_sql_from_json.py)")
+    return parser.parse_args()
+
+def main():
+    """Função principal."""
+    args = parse_args()
+    
+    for source in (args.old, args.new):
+        if not source.exists():
+            print(f"❌ ERRO: Versão do dataset não encontrada: {source}")
+            sys.exit(1)
+    
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    
+    versions: List[DatasetVersion] = []
+    try:
+        for source in (args.old, args.new):
+            versions.append(DatasetVersion(source, args.json_backend, args.snapshot))
+        success = generate_seed_diff(versions[0], versions[1], args.output, args.schema, args.batch_size)
+    except (OSError, ValueError) as e:
+        print(f"❌ ERRO: Falha ao abrir a versão do dataset: {e}")
+        success = False
+    finally:
+        for version in versions:
+            version.close()
+    
+    if success and args.save_snapshot:
+        if args.new.is_file():
+            shutil.copyfile(args.new, args.save_snapshot)
+        else:
+            args.save_snapshot.parent.mkdir(parents=True, exist_ok=True)
+            build_snapshot(args.new, args.save_snapshot, args.json_backend)
+        print(f"📦 Snapshot da versão nova salvo em: {args.save_snapshot}")
+    
+    sys.exit(0 if success else 1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
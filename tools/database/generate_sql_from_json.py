@@ -4,13 +4,28 @@ Script para gerar comandos INSERT SQL a partir dos arquivos JSON de dados da Pok
 Este script lê os arquivos JSON numerados de 01 a 10 e gera comandos SQL correspondentes.
 """
 
+import argparse
+import hashlib
+import io
 import json
 import os
 import sys
-from datetime import datetime
-from typing import Dict, Any, List
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager, redirect_stdout
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 
+from seed_json import (JSON_BACKENDS, STREAM_THRESHOLD_BYTES, JsonArrayFile,
+                       load_json_data, resolve_backend)
+from seed_profiling import StageTimer, run_with_cprofile
+from seed_schema import DEFAULT_SCHEMA_FILE, SchemaModel, load_schema_model
+from seed_type_chart import TypeChart, build_type_chart, compute_weaknesses, cross_check_weaknesses
+
 # Mapeamento de arquivos JSON para nomes de tabelas
 FILE_TO_TABLE_MAPPING = {
     "01_region.json": "regions",
@@ -23,24 +38,81 @@ FILE_TO_TABLE_MAPPING = {
     "08_evolution_chains.json": "evolution_chains",
     "09_pokemon.json": "pokemons",
     "10_weaknesses.json": "pokemon_weaknesses",
+    "11_type_effectiveness.json": "type_effectiveness",
+}
+
+# Mapeamento de nomes de tipos (em português) para IDs da tabela types
+TYPE_NAME_TO_ID = {
+    'Normal': 1, 'Fogo': 2, 'Água': 3, 'Elétrico': 4, 'Grama': 5, 
+    'Gelo': 6, 'Lutador': 7, 'Venenoso': 8, 'Terrestre': 9, 'Voador': 10,
+    'Psíquico': 11, 'Inseto': 12, 'Pedra': 13, 'Fantasma': 14, 'Dragão': 15,
+    'Escuridão': 16, 'Metálico': 17, 'Fada': 18
+}
+
+# Formatos de saída suportados pelo gerador
+OUTPUT_FORMATS = ["insert", "copy"]
+
+# Motores de transformação: row (RowEncoder, registro a registro) ou columnar (seed_columnar)
+ENGINES = ["row", "columnar"]
+
+# Tamanho do buffer de escrita do arquivo SQL (bytes)
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Versão do gerador, gravada no manifesto (mudanças de formato invalidam a saída anterior)
+TOOL_VERSION = "1.7.0"
+
+# Sufixo do manifesto gravado ao lado do arquivo de saída
+MANIFEST_SUFFIX = ".manifest.json"
+
+# Arquivos lidos também pela seção de outro arquivo: a seção de pokemons gera evolution_edges
+# a partir de 08_evolution_chains.json (as arestas referenciam pokemons) e pokemon_cards com
+# os tipos, grupos de ovos, habilidades, espécies e stats (ver build_pokemon_card_table), e
+# pokemon_weaknesses é calculada dos type_ids de 09_pokemon.json pela tabela de efetividade
+# (02_type.json e 11_type_effectiveness.json), conferida com 10_weaknesses.json (ver build_weakness_table)
+RELATED_FILES = {
+    "09_pokemon.json": ["08_evolution_chains.json", "02_type.json", "03_egg_group.json", "05_ability.json",
+                        "06_species.json", "07_stats.json"],
+    "10_weaknesses.json": ["09_pokemon.json", "02_type.json", "11_type_effectiveness.json"],
 }
 
-# Mapeamento de campos válidos por tabela (para filtrar campos extras dos JSONs)
-TABLE_VALID_FIELDS = {
-    "regions": ["id", "name"],
-    "types": ["id", "name", "color"],
-    "egg_groups": ["id", "name"],
-    "generations": ["id", "name", "region_id"],
-    "abilities": ["id", "name", "description", "introduced_generation_id"],
-    "species": ["id", "pokemon_number", "name", "species_en", "species_pt", "description", "color", "generation_id"],
-    "stats": ["id", "total", "hp", "attack", "defense", "sp_atk", "sp_def", "speed"],
-    "evolution_chains": ["id", "chain_data"],
-    "pokemon_weaknesses": ["pokemon_id", "type_id"],
-    "pokemons": ["id", "number", "name", "height", "weight", "description", "sprites", 
-                 "gender_male", "gender_female", "gender_rate_value", "egg_cycles", 
-                 "stats_id", "generation_id", "species_id", "region_id", "evolution_chain_id"]
+# Colunas das tabelas de relacionamento (conferidas com o schema pelo JoinTableBuilder)
+JOIN_TABLE_COLUMNS = {
+    "pokemon_types": ["pokemon_id", "type_id"],
+    "pokemon_abilities": ["pokemon_id", "ability_id", "is_hidden"],
+    "pokemon_egg_groups": ["pokemon_id", "egg_group_id"],
+    "pokemon_weaknesses": ["pokemon_id", "type_id", "multiplier"],
+    "evolution_edges": ["evolution_chain_id", "from_pokemon_id", "to_pokemon_id", "condition_type",
+                        "condition_value", "condition_description", "depth"],
+    "pokemon_cards": ["pokemon_id", "number", "name", "description", "height", "weight", "generation_id",
+                      "region_id", "species_en", "species_pt", "image_url", "sprites", "types", "abilities",
+                      "egg_groups", "total", "hp", "attack", "defense", "sp_atk", "sp_def", "speed"],
 }
 
+# Colunas de stats copiadas para pokemon_cards
+CARD_STATS_COLUMNS = ["total", "hp", "attack", "defense", "sp_atk", "sp_def", "speed"]
+
+# Tipo auxiliar: (codificador da tabela, linhas) pronto para ser renderizado
+TableRows = Tuple["RowEncoder", Iterable[Tuple[Any, ...]]]
+
+@lru_cache(maxsize=None)
+def default_schema() -> SchemaModel:
+    """
+    Modelo do database/schema/schema.sql (ver seed_schema), com cache em disco,
+    lido uma vez por processo. As colunas válidas de cada tabela, seus tipos e a
+    ordem de carga vêm dele.
+    """
+    return load_schema_model(DEFAULT_SCHEMA_FILE)
+
+def ordered_data_files(schema: Optional[SchemaModel] = None) -> List[str]:
+    """
+    Arquivos JSON na ordem de carga: a ordenação topológica das tabelas pelas FKs do schema.
+    Tabelas fora do schema mantêm a ordem dos arquivos, depois das demais.
+    """
+    plan = (schema or default_schema()).load_plan()
+    position = {table_name: index for index, table_name in enumerate(plan)}
+    return sorted(sorted(FILE_TO_TABLE_MAPPING),
+                  key=lambda file_name: position.get(FILE_TO_TABLE_MAPPING[file_name], len(plan)))
+
 def escape_sql_value(value: Any) -> str:
     """Escapa valores para inserção segura em SQL."""
     if value is None:
@@ -67,12 +139,32 @@ def escape_sql_value(value: Any) -> str:
         escaped = str(value).replace("'", "''")
         return f"'{escaped}'"
 
-def filter_valid_fields(record: Dict[str, Any], table_name: str) -> Dict[str, Any]:
-    """Filtra apenas os campos válidos para a tabela especificada."""
-    if table_name not in TABLE_VALID_FIELDS:
-        return record  # Se não há mapeamento, retorna todos os campos
+def escape_copy_value(value: Any) -> str:
+    """Escapa valores para o formato texto do COPY (campos separados por TAB)."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, (dict, list)):
+        text = json.dumps(value, ensure_ascii=False)
+    else:
+        text = str(value)
+    # Barra invertida primeiro, para não escapar duas vezes os demais caracteres
+    return (text.replace('\\', '\\\\')
+                .replace('\t', '\\t')
+                .replace('\n', '\\n')
+                .replace('\r', '\\r'))
+
+def filter_valid_fields(record: Dict[str, Any], table_name: str,
+                        schema: Optional[SchemaModel] = None) -> Dict[str, Any]:
+    """Filtra apenas os campos que são colunas da tabela no schema."""
+    table = (schema or default_schema()).tables.get(table_name)
+    if table is None:
+        return record  # Se a tabela não está no schema, retorna todos os campos
     
-    valid_fields = TABLE_VALID_FIELDS[table_name]
+    valid_fields = table.column_names
     filtered_record = {}
     
     for field in valid_fields:
@@ -106,137 +198,613 @@ def is_json_field(field_name: str) -> bool:
     ]
     return any(json_field in field_name.lower() for json_field in json_fields)
 
-def process_special_tables(table_name: str, records: List[Dict[str, Any]]) -> List[str]:
-    """Processa tabelas com relacionamentos especiais."""
-    sql_statements = []
+def sql_text(value: Any) -> str:
+    """Escaper SQL pré-escolhido para colunas de texto."""
+    if value.__class__ is str:
+        return "'" + value.replace("'", "''").replace("\n", "\\n") + "'"
+    return escape_sql_value(value)
+
+def sql_number(value: Any) -> str:
+    """Escaper SQL pré-escolhido para colunas numéricas."""
+    if value.__class__ is int or value.__class__ is float:
+        return str(value)
+    return escape_sql_value(value)
+
+def sql_bool(value: Any) -> str:
+    """Escaper SQL pré-escolhido para colunas booleanas."""
+    if value is True:
+        return 'TRUE'
+    if value is False:
+        return 'FALSE'
+    return escape_sql_value(value)
+
+def sql_json(value: Any) -> str:
+    """Escaper SQL pré-escolhido para colunas JSON (dicts e listas)."""
+    if value.__class__ is dict or value.__class__ is list:
+        return "'" + json.dumps(value, ensure_ascii=False).replace("'", "''").replace("\n", "\\n") + "'"
+    return escape_sql_value(value)
+
+def copy_text(value: Any) -> str:
+    """Escaper COPY pré-escolhido para colunas de texto."""
+    if value.__class__ is str:
+        return value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+    return escape_copy_value(value)
+
+def copy_number(value: Any) -> str:
+    """Escaper COPY pré-escolhido para colunas numéricas."""
+    if value.__class__ is int or value.__class__ is float:
+        return str(value)
+    return escape_copy_value(value)
+
+def copy_bool(value: Any) -> str:
+    """Escaper COPY pré-escolhido para colunas booleanas."""
+    if value is True:
+        return 't'
+    if value is False:
+        return 'f'
+    return escape_copy_value(value)
+
+def copy_json(value: Any) -> str:
+    """Escaper COPY pré-escolhido para colunas JSON (dicts e listas)."""
+    if value.__class__ is dict or value.__class__ is list:
+        return copy_text(json.dumps(value, ensure_ascii=False))
+    return escape_copy_value(value)
+
+# Escapers por tipo de coluna: (SQL, COPY). Valores de outro tipo caem no escaper genérico.
+COLUMN_ESCAPERS = {
+    "text": (sql_text, copy_text),
+    "number": (sql_number, copy_number),
+    "bool": (sql_bool, copy_bool),
+    "json": (sql_json, copy_json),
+}
+
+# Colunas de pokemons extraídas do objeto gender aninhado
+GENDER_COLUMNS = {"gender_male": "male", "gender_female": "female"}
+
+class RowEncoder:
+    """
+    Codificador de linhas compilado uma vez por tabela: ordem de colunas fixa,
+    um extrator de valores e um escaper pré-escolhido por coluna.
+    Substitui, por registro, filter_valid_fields + flatten_object + escape_sql_value.
+    """
+    
+    def __init__(self, table_name: str, columns: List[str], kinds: List[str],
+                 extract: Callable[[Any], Tuple[Any, ...]]):
+        self.table_name = table_name
+        self.columns = columns
+        self.kinds = kinds
+        self.extract = extract
+        self.sql_escapers = tuple(COLUMN_ESCAPERS[kind][0] for kind in kinds)
+        self.copy_escapers = tuple(COLUMN_ESCAPERS[kind][1] for kind in kinds)
+        self.columns_sql = ", ".join(columns)
+        self.insert_prefix = f"INSERT INTO {table_name} ({self.columns_sql}) VALUES ("
+    
+    def sql_values(self, row: Tuple[Any, ...]) -> str:
+        """Valores de uma linha já extraída, escapados para SQL e separados por vírgula."""
+        return ", ".join([escape(value) for escape, value in zip(self.sql_escapers, row)])
+    
+    def copy_line(self, row: Tuple[Any, ...]) -> str:
+        """Linha já extraída no formato texto do COPY."""
+        return "\t".join([escape(value) for escape, value in zip(self.copy_escapers, row)])
+    
+    def insert_sql(self, record: Any) -> str:
+        """INSERT completo para um registro."""
+        return self.insert_prefix + self.sql_values(self.extract(record)) + ");"
+
+def column_kind(column: str, sample: Any) -> str:
+    """Escolhe o tipo de escaper de uma coluna a partir das regras de JSON e de um valor de amostra."""
+    if is_json_field(column) or isinstance(sample, (dict, list)):
+        return "json"
+    if isinstance(sample, bool):
+        return "bool"
+    if isinstance(sample, (int, float)):
+        return "number"
+    return "text"
+
+def sample_values(records: List[Dict[str, Any]], columns: List[str]) -> Dict[str, Any]:
+    """Primeiro valor não nulo de cada coluna (para escolher os escapers)."""
+    samples: Dict[str, Any] = {}
+    for record in records:
+        for column in columns:
+            if column not in samples and record.get(column) is not None:
+                samples[column] = record[column]
+        if len(samples) == len(columns):
+            break
+    return samples
+
+def compile_row_encoder(table_name: str, records: List[Dict[str, Any]],
+                        schema: Optional[SchemaModel] = None) -> RowEncoder:
+    """
+    Compila o codificador da tabela principal de um arquivo JSON.
+    As colunas são as colunas da tabela no schema presentes nos dados, na ordem do schema,
+    e o escaper de cada uma é escolhido pelo tipo SQL declarado.
+    """
+    present = set()
+    for record in records:
+        present.update(record)
     
     if table_name == "evolution_chains":
         # Para evolution_chains, mapeia 'chain' para 'chain_data'
-        for record in records:
-            chain_data = record.get('chain', {})
-            evolution_record = {
-                'id': record.get('id'),
-                'chain_data': chain_data if chain_data else None
-            }
-            # Filtra apenas campos válidos para a tabela
-            filtered_record = filter_valid_fields(evolution_record, table_name)
-            
-            # Para evolution_chains, não achatar o chain_data
-            columns = list(filtered_record.keys())
-            values = [escape_sql_value(filtered_record[col]) for col in columns]
-            
-            # Gera o comando SQL
-            columns_str = ", ".join(columns)
-            values_str = ", ".join(values)
-            sql = f"INSERT INTO {table_name} ({columns_str}) VALUES ({values_str});"
-            sql_statements.append(sql)
-    elif table_name == "pokemon_weaknesses":
-        # Para pokemon_weaknesses, processa array de fraquezas em relacionamentos
-        # Primeiro, precisa mapear nomes de tipos para IDs
-        type_name_to_id = {
-            'Normal': 1, 'Fogo': 2, 'Água': 3, 'Elétrico': 4, 'Grama': 5, 
-            'Gelo': 6, 'Lutador': 7, 'Venenoso': 8, 'Terrestre': 9, 'Voador': 10,
-            'Psíquico': 11, 'Inseto': 12, 'Pedra': 13, 'Fantasma': 14, 'Dragão': 15,
-            'Escuridão': 16, 'Metálico': 17, 'Fada': 18
-        }
+        return RowEncoder(table_name, ["id", "chain_data"], ["number", "json"],
+                          lambda record: (record.get('id'), record.get('chain') or None))
+    
+    table = (schema or default_schema()).tables.get(table_name)
+    if table is None:
+        # Fora do schema: todas as colunas, na ordem de primeira aparição, com tipos pela amostra
+        columns = list(dict.fromkeys(key for record in records for key in record))
+        samples = sample_values(records, columns)
+        kinds = [column_kind(column, samples.get(column)) for column in columns]
+        plain_columns = tuple(columns)
+        return RowEncoder(table_name, columns, kinds, lambda record: tuple(map(record.get, plain_columns)))
+    
+    valid_fields = table.column_names
+    columns = [field for field in valid_fields if field in present]
+    
+    if table_name == "pokemons":
+        # Extrai dados do objeto gender aninhado para gender_male/gender_female
+        if "gender" in present:
+            columns = [field for field in valid_fields if field in present or field in GENDER_COLUMNS]
+        plain_columns = tuple(columns)
+        gender_positions = [(columns.index(column), key) for column, key in GENDER_COLUMNS.items()
+                            if column in columns]
         
-        for record in records:
-            pokemon_id = record.get('pokemon_id')
-            weaknesses = record.get('weaknesses', [])
-            
-            for weakness_name in weaknesses:
-                type_id = type_name_to_id.get(weakness_name)
-                if type_id:
-                    sql = f"INSERT INTO {table_name} (pokemon_id, type_id) VALUES ({pokemon_id}, {type_id});"
-                    sql_statements.append(sql)
-    elif table_name == "pokemons":
-        # Para pokémons, também gera as tabelas de relacionamento
-        for record in records:
-            # Filtra campos válidos e remove relacionamentos many-to-many
-            filtered_record = filter_valid_fields(record, table_name)
-            main_record = {k: v for k, v in filtered_record.items() 
-                          if k not in ['type_ids', 'abilities', 'egg_group_ids', 'weaknesses']}
-            
-            # Extrai dados do objeto gender aninhado
-            if 'gender' in record and isinstance(record['gender'], dict):
-                gender_data = record['gender']
-                main_record['gender_male'] = gender_data.get('male')
-                main_record['gender_female'] = gender_data.get('female')
-            
-            sql_statements.append(generate_insert_sql(table_name, [main_record])[0])
-            
-            pokemon_id = record.get('id')
-            
-            # Relacionamentos many-to-many
-            if 'type_ids' in record and record['type_ids']:
-                for type_id in record['type_ids']:
-                    sql_statements.append(
-                        f"INSERT INTO pokemon_types (pokemon_id, type_id) VALUES ({pokemon_id}, {type_id});"
-                    )
-            
-            if 'abilities' in record and record['abilities']:
-                for ability_data in record['abilities']:
-                    if isinstance(ability_data, dict):
-                        ability_id = ability_data.get('ability_id')
-                        is_hidden = ability_data.get('is_hidden', False)
-                        sql_statements.append(
-                            f"INSERT INTO pokemon_abilities (pokemon_id, ability_id, is_hidden) VALUES ({pokemon_id}, {ability_id}, {is_hidden});"
-                        )
-            
-            if 'egg_group_ids' in record and record['egg_group_ids']:
-                for egg_group_id in record['egg_group_ids']:
-                    sql_statements.append(
-                        f"INSERT INTO pokemon_egg_groups (pokemon_id, egg_group_id) VALUES ({pokemon_id}, {egg_group_id});"
-                    )
-            
-            if 'weaknesses' in record and record['weaknesses']:
-                for weakness_data in record['weaknesses']:
-                    if isinstance(weakness_data, dict):
-                        type_id = weakness_data.get('type_id')
-                        multiplier = weakness_data.get('multiplier', 1.0)
-                        sql_statements.append(
-                            f"INSERT INTO pokemon_weaknesses (pokemon_id, type_id, multiplier) VALUES ({pokemon_id}, {type_id}, {multiplier});"
-                        )
-    else:
-        # Para outras tabelas, processamento normal
-        sql_statements.extend(generate_insert_sql(table_name, records))
+        def extract(record: Dict[str, Any]) -> Tuple[Any, ...]:
+            values = list(map(record.get, plain_columns))
+            gender = record.get('gender')
+            if gender.__class__ is dict:
+                for position, key in gender_positions:
+                    values[position] = gender.get(key)
+            return tuple(values)
+        
+        kinds = [table.column(column).kind for column in columns]
+        return RowEncoder(table_name, columns, kinds, extract)
     
-    return sql_statements
+    plain_columns = tuple(columns)
+    kinds = [table.column(column).kind for column in columns]
+    return RowEncoder(table_name, columns, kinds, lambda record: tuple(map(record.get, plain_columns)))
 
-def generate_insert_sql(table_name: str, records: List[Dict[str, Any]]) -> List[str]:
-    """Gera comandos INSERT SQL para uma lista de registros."""
-    if not records:
-        return []
+def join_table_encoder(table_name: str, columns: List[str], kinds: List[str]) -> RowEncoder:
+    """Codificador para tabelas de relacionamento, cujas linhas já são tuplas."""
+    return RowEncoder(table_name, columns, kinds, lambda row: row)
+
+def iter_pokemon_type_rows(records: List[Dict[str, Any]]) -> Iterator[Tuple[Any, ...]]:
+    """Linhas de pokemon_types a partir de type_ids."""
+    for record in records:
+        for type_id in record.get('type_ids') or []:
+            yield (record.get('id'), type_id)
+
+def iter_pokemon_ability_rows(records: List[Dict[str, Any]]) -> Iterator[Tuple[Any, ...]]:
+    """Linhas de pokemon_abilities a partir de abilities."""
+    for record in records:
+        for ability_data in record.get('abilities') or []:
+            if isinstance(ability_data, dict):
+                yield (record.get('id'), ability_data.get('ability_id'), ability_data.get('is_hidden', False))
+
+def iter_pokemon_egg_group_rows(records: List[Dict[str, Any]]) -> Iterator[Tuple[Any, ...]]:
+    """Linhas de pokemon_egg_groups a partir de egg_group_ids."""
+    for record in records:
+        for egg_group_id in record.get('egg_group_ids') or []:
+            yield (record.get('id'), egg_group_id)
+
+def iter_pokemon_weakness_rows(records: List[Dict[str, Any]]) -> Iterator[Tuple[Any, ...]]:
+    """Linhas de pokemon_weaknesses embutidas nos registros de pokémon."""
+    for record in records:
+        for weakness_data in record.get('weaknesses') or []:
+            if isinstance(weakness_data, dict):
+                yield (record.get('id'), weakness_data.get('type_id'), weakness_data.get('multiplier'))
+
+def iter_weakness_file_rows(records: List[Dict[str, Any]]) -> Iterator[Tuple[Any, ...]]:
+    """Linhas de pokemon_weaknesses a partir dos nomes de tipos de 10_weaknesses.json."""
+    for record in records:
+        pokemon_id = record.get('pokemon_id')
+        for weakness_name in record.get('weaknesses', []):
+            type_id = TYPE_NAME_TO_ID.get(weakness_name)
+            if type_id:
+                yield (pokemon_id, type_id, None)
+
+def flatten_evolution_chain(chain_id: Any, chain: Any) -> Tuple[List[Tuple[Any, ...]], int]:
+    """
+    Arestas de uma cadeia evolutiva, percorrida de forma iterativa (pilha, sem recursão):
+    (cadeia, de, para, tipo, valor e descrição da condição, profundidade de 'para').
+    Uma evolução para um pokémon que já está no caminho desde a raiz é um ciclo: a aresta
+    e o que vem depois dela são descartados. Retorna as arestas e o número de ciclos.
+    """
+    rows = []
+    cycles = 0
+    root = chain.get('pokemon') if isinstance(chain, dict) else None
+    if not isinstance(root, dict):
+        return rows, cycles
     
-    sql_statements = []
+    stack = [(chain, root.get('id'), 0, frozenset([root.get('id')]))]
+    while stack:
+        node, from_id, depth, path = stack.pop()
+        for evolution in node.get('evolutions_to') or []:
+            if not isinstance(evolution, dict):
+                continue
+            target = evolution.get('pokemon')
+            to_id = target.get('id') if isinstance(target, dict) else None
+            if to_id in path:
+                cycles += 1
+                continue
+            condition = evolution.get('condition')
+            if not isinstance(condition, dict):
+                condition = {}
+            value = condition.get('value')
+            rows.append((chain_id, from_id, to_id, condition.get('type'), None if value is None else str(value),
+                         condition.get('description'), depth + 1))
+            stack.append((evolution, to_id, depth + 1, path | {to_id}))
+    return rows, cycles
+
+def sprite_image_url(sprites: Any) -> Optional[str]:
+    """Imagem do card: a arte oficial (sprites.other.official-artwork) ou o sprite frontal padrão."""
+    if not isinstance(sprites, dict):
+        return None
+    other = sprites.get('other')
+    artwork = other.get('official-artwork') if isinstance(other, dict) else None
+    if isinstance(artwork, dict) and artwork.get('front_default'):
+        return artwork['front_default']
+    return sprites.get('front_default')
+
+def index_by_id(records: Optional[Iterable[Dict[str, Any]]]) -> Dict[Any, Dict[str, Any]]:
+    return {record.get('id'): record for record in records or [] if isinstance(record, dict)}
+
+def mixed_sort_key(row: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Ordena linhas com valores nulos ou de tipos diferentes na mesma coluna."""
+    return tuple((value is None, value.__class__.__name__, value if value is not None else 0) for value in row)
+
+class JoinTableBuilder:
+    """
+    Monta uma tabela de relacionamento em bloco: as linhas ficam em um dicionário indexado
+    pela chave primária do schema (ou pela linha inteira, quando a chave não vem dos JSONs,
+    como o id serial de pokemon_abilities), sem duplicatas, e saem ordenadas de uma vez.
+    As colunas são conferidas com o schema na criação: coluna desconhecida é erro.
+    Linhas com valor nulo em coluna NOT NULL são descartadas (falhariam na carga).
+    """
     
-    for record in records:
-        # Filtra apenas campos válidos para a tabela
-        filtered_record = filter_valid_fields(record, table_name)
+    def __init__(self, table_name: str, schema: Optional[SchemaModel] = None):
+        table = (schema or default_schema()).tables.get(table_name)
+        if table_name not in JOIN_TABLE_COLUMNS or table is None:
+            raise ValueError(f"{table_name} não é uma tabela de relacionamento do schema")
+        columns = JOIN_TABLE_COLUMNS[table_name]
+        unknown = [column for column in columns if table.column(column) is None]
+        if unknown:
+            raise ValueError(f"Colunas fora do schema em {table_name}: {', '.join(unknown)}")
+        
+        self.encoder = join_table_encoder(table_name, columns, [table.column(column).kind for column in columns])
+        key_columns = table.primary_key if set(table.primary_key) <= set(columns) else columns
+        self.key_columns = list(key_columns)
+        key_positions = [columns.index(column) for column in key_columns]
+        self._key = None if key_positions == list(range(len(columns))) else itemgetter(*key_positions)
+        self._required = [position for position, column in enumerate(columns) if table.column(column).not_null]
+        self._rows: Dict[Any, Tuple[Any, ...]] = {}
+        self.duplicates = 0
+        self.invalid = 0
+        self.dropped: Dict[str, int] = {}
+        self.notices: List[str] = []
+    
+    @property
+    def table_name(self) -> str:
+        return self.encoder.table_name
+    
+    def add_rows(self, rows: Iterable[Tuple[Any, ...]]) -> None:
+        """Adiciona linhas; a primeira ocorrência de cada chave é mantida."""
+        indexed = self._rows
+        required = self._required
+        key = self._key
+        added = 0
+        before = len(indexed)
+        for row in rows:
+            if required and any(row[position] is None for position in required):
+                self.invalid += 1
+                continue
+            indexed.setdefault(row if key is None else key(row), row)
+            added += 1
+        self.duplicates += added - (len(indexed) - before)
+    
+    def drop(self, reason: str, count: int) -> None:
+        """Registra linhas descartadas antes de chegar ao builder (reportadas em warnings)."""
+        if count:
+            self.dropped[reason] = self.dropped.get(reason, 0) + count
+    
+    def rows(self) -> List[Tuple[Any, ...]]:
+        """Linhas sem duplicatas, em ordem crescente."""
+        try:
+            return sorted(self._rows.values())
+        except TypeError:
+            return sorted(self._rows.values(), key=mixed_sort_key)
+    
+    def warnings(self) -> List[str]:
+        """Avisos sobre as linhas descartadas e as observações de quem montou a tabela (notices)."""
+        messages = []
+        if self.duplicates:
+            messages.append(f"⚠️  AVISO: {self.table_name}: {self.duplicates} linha(s) duplicada(s) "
+                            f"(chave {', '.join(self.key_columns)}) descartada(s)")
+        if self.invalid:
+            messages.append(f"⚠️  AVISO: {self.table_name}: {self.invalid} linha(s) com valor nulo "
+                            f"em coluna NOT NULL descartada(s)")
+        for reason, count in self.dropped.items():
+            messages.append(f"⚠️  AVISO: {self.table_name}: {count} linha(s) descartada(s) ({reason})")
+        messages.extend(f"⚠️  AVISO: {self.table_name}: {notice}" for notice in self.notices)
+        return messages
+
+def load_type_chart(related: Optional[Dict[str, List[Dict[str, Any]]]]) -> Optional[TypeChart]:
+    """Matriz de efetividade (ver seed_type_chart), se 02_type.json e 11_type_effectiveness.json estão em related."""
+    related = related or {}
+    type_records = related.get("02_type.json")
+    effectiveness_records = related.get("11_type_effectiveness.json")
+    if not type_records or effectiveness_records is None:
+        return None
+    return build_type_chart(type_records, effectiveness_records)
+
+def build_weakness_table(records: List[Dict[str, Any]], pokemon_records: Optional[List[Dict[str, Any]]] = None,
+                         schema: Optional[SchemaModel] = None,
+                         chart: Optional[TypeChart] = None) -> JoinTableBuilder:
+    """
+    pokemon_weaknesses. Com a matriz de efetividade (chart) e os pokémons, as fraquezas e seus
+    multiplicadores são calculados dos type_ids (seed_type_chart.compute_weaknesses) e os JSONs
+    servem só de conferência: divergências viram aviso. Sem ela, vale a junção das duas fontes:
+    as fraquezas embutidas em 09_pokemon.json (com multiplier) e os nomes de tipos de
+    10_weaknesses.json, sem duplicatas.
+    """
+    builder = JoinTableBuilder("pokemon_weaknesses", schema)
+    if chart is not None and pokemon_records is not None:
+        computed = compute_weaknesses(chart, pokemon_records)
+        builder.add_rows(computed)
+        mismatches, unknown_names = cross_check_weaknesses(chart, computed, records, pokemon_records)
+        if mismatches:
+            examples = ", ".join(str(pokemon_id) for pokemon_id, _, _ in mismatches[:5])
+            builder.notices.append(f"{len(mismatches)} pokémon(s) com fraquezas nos JSONs diferentes das calculadas "
+                                   f"pela tabela de efetividade (ex.: {examples}; detalhes em validate_json_data.py)")
+        if unknown_names:
+            builder.notices.append(f"{len(unknown_names)} nome(s) de tipo desconhecido(s) em 10_weaknesses.json")
+        return builder
+    
+    if pokemon_records:
+        builder.add_rows(iter_pokemon_weakness_rows(pokemon_records))
+    builder.add_rows(iter_weakness_file_rows(records))
+    return builder
+
+def build_evolution_edge_table(chain_records: Optional[List[Dict[str, Any]]],
+                               pokemon_records: Optional[List[Dict[str, Any]]] = None,
+                               schema: Optional[SchemaModel] = None,
+                               pokemon_ids: Optional[Set[Any]] = None) -> Optional[JoinTableBuilder]:
+    """
+    evolution_edges: as cadeias de 08_evolution_chains.json achatadas em arestas, para que
+    "em que X evolui" e "linha evolutiva de X" sejam buscas por índice em vez de percorrer o JSONB.
+    Com pokemon_records (ou os IDs já coletados, pokemon_ids), arestas com pokémons sem registro
+    são descartadas (violariam as FKs).
+    None se o schema não tem a tabela.
+    """
+    if "evolution_edges" not in (schema or default_schema()).tables:
+        return None
+    builder = JoinTableBuilder("evolution_edges", schema)
+    known_ids = pokemon_ids
+    if known_ids is None and pokemon_records is not None:
+        known_ids = {record.get('id') for record in pokemon_records}
+    for record in chain_records or []:
+        rows, cycles = flatten_evolution_chain(record.get('id'), record.get('chain'))
+        builder.drop("ciclo na cadeia evolutiva", cycles)
+        if known_ids is not None:
+            valid = [row for row in rows if row[1] in known_ids and row[2] in known_ids]
+            builder.drop("pokémon sem registro em 09_pokemon.json", len(rows) - len(valid))
+            rows = valid
+        builder.add_rows(rows)
+    return builder
+
+class PokemonCardIndex:
+    """
+    Arquivos usados por pokemon_cards (tipos, grupos de ovos, habilidades, espécies e stats),
+    indexados por id uma vez; row() monta a linha de um pokémon. Referências sem registro ficam
+    de fora das listas (ou nulas) e são contadas em missing.
+    """
+    
+    def __init__(self, related: Optional[Dict[str, List[Dict[str, Any]]]] = None):
+        related = related or {}
+        self.types = index_by_id(related.get("02_type.json"))
+        self.egg_groups = index_by_id(related.get("03_egg_group.json"))
+        self.abilities = index_by_id(related.get("05_ability.json"))
+        self.species = index_by_id(related.get("06_species.json"))
+        self.stats = index_by_id(related.get("07_stats.json"))
+        self.missing = 0
+    
+    def row(self, record: Dict[str, Any]) -> Tuple[Any, ...]:
+        card_types = []
+        for type_id in dict.fromkeys(record.get('type_ids') or []):
+            type_record = self.types.get(type_id)
+            if type_record is None:
+                self.missing += 1
+                continue
+            card_types.append({"id": type_id, "name": type_record.get('name'), "color": type_record.get('color')})
         
-        # Achata objetos aninhados se necessário
-        flattened_record = flatten_object(filtered_record)
+        card_abilities = []
+        for ability_data in record.get('abilities') or []:
+            if not isinstance(ability_data, dict):
+                continue
+            ability = self.abilities.get(ability_data.get('ability_id'))
+            if ability is None:
+                self.missing += 1
+                continue
+            card_abilities.append({"id": ability_data['ability_id'], "name": ability.get('name'),
+                                   "description": ability.get('description'),
+                                   "is_hidden": ability_data.get('is_hidden', False)})
         
-        # Extrai colunas e valores
-        columns = list(flattened_record.keys())
-        values = [escape_sql_value(flattened_record[col]) for col in columns]
+        card_egg_groups = []
+        for egg_group_id in dict.fromkeys(record.get('egg_group_ids') or []):
+            egg_group = self.egg_groups.get(egg_group_id)
+            if egg_group is None:
+                self.missing += 1
+                continue
+            card_egg_groups.append({"id": egg_group_id, "name": egg_group.get('name')})
         
-        # Gera o comando SQL
-        columns_str = ", ".join(columns)
-        values_str = ", ".join(values)
-        sql = f"INSERT INTO {table_name} ({columns_str}) VALUES ({values_str});"
+        species_record = self.species.get(record.get('species_id'))
+        if species_record is None:
+            self.missing += record.get('species_id') is not None
+            species_record = {}
+        stats_record = self.stats.get(record.get('stats_id'))
+        if stats_record is None:
+            self.missing += record.get('stats_id') is not None
+            stats_record = {}
         
-        sql_statements.append(sql)
+        return ((record.get('id'), record.get('number'), record.get('name'), record.get('description'),
+                 record.get('height'), record.get('weight'), record.get('generation_id'), record.get('region_id'),
+                 species_record.get('species_en'), species_record.get('species_pt'),
+                 sprite_image_url(record.get('sprites')), record.get('sprites'),
+                 card_types, card_abilities, card_egg_groups)
+                + tuple(stats_record.get(column) for column in CARD_STATS_COLUMNS))
     
-    return sql_statements
+    def report(self, builder: JoinTableBuilder) -> None:
+        """Avisa sobre as referências sem registro (notices do builder)."""
+        if self.missing:
+            builder.notices.append(f"{self.missing} referência(s) sem registro nos JSONs (tipos, habilidades, "
+                                   f"grupos de ovos, espécies ou stats) omitida(s)")
+
+def build_pokemon_card_table(pokemon_records: Iterable[Dict[str, Any]],
+                             related: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                             schema: Optional[SchemaModel] = None) -> Optional[JoinTableBuilder]:
+    """
+    pokemon_cards: modelo de leitura com uma linha por pokémon e tipos, habilidades, grupos de ovos,
+    stats, espécie e sprites embutidos, para as listagens lerem uma linha sem joins
+    (ver PokemonCardIndex). None se o schema não tem a tabela.
+    """
+    if "pokemon_cards" not in (schema or default_schema()).tables:
+        return None
+    builder = JoinTableBuilder("pokemon_cards", schema)
+    index = PokemonCardIndex(related)
+    builder.add_rows(map(index.row, pokemon_records))
+    index.report(builder)
+    return builder
+
+def build_pokemon_tables(records: Iterable[Dict[str, Any]],
+                         related: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                         schema: Optional[SchemaModel] = None) -> List[JoinTableBuilder]:
+    """
+    Tabelas geradas a partir dos pokémons, em uma única passada pelos registros (com o backend
+    stream, cada passada relê o arquivo): pokemon_types, pokemon_abilities, pokemon_egg_groups e
+    pokemon_cards; evolution_edges é montada depois, com os IDs de pokémon vistos na passada.
+    """
+    extractors = [(JoinTableBuilder(table_name, schema), iter_rows)
+                  for table_name, iter_rows in [("pokemon_types", iter_pokemon_type_rows),
+                                                ("pokemon_abilities", iter_pokemon_ability_rows),
+                                                ("pokemon_egg_groups", iter_pokemon_egg_group_rows)]]
+    builders = [builder for builder, _ in extractors]
+    has_cards = "pokemon_cards" in (schema or default_schema()).tables
+    cards = JoinTableBuilder("pokemon_cards", schema) if has_cards else None
+    card_index = PokemonCardIndex(related)
+    pokemon_ids: Set[Any] = set()
+    
+    for record in records:
+        single = (record,)
+        for builder, iter_rows in extractors:
+            builder.add_rows(iter_rows(single))
+        if cards is not None:
+            cards.add_rows((card_index.row(record),))
+        pokemon_ids.add(record.get('id'))
+    
+    edges = build_evolution_edge_table((related or {}).get("08_evolution_chains.json"), schema=schema,
+                                       pokemon_ids=pokemon_ids)
+    if cards is not None:
+        card_index.report(cards)
+    return builders + [builder for builder in (edges, cards) if builder is not None]
+
+def join_table_rows(builder: JoinTableBuilder) -> TableRows:
+    """Bloco (codificador, linhas) de uma tabela de relacionamento, avisando sobre as linhas descartadas."""
+    for message in builder.warnings():
+        print(message)
+    return builder.encoder, builder.rows()
+
+def collect_table_rows(table_name: str, records: List[Dict[str, Any]],
+                       schema: Optional[SchemaModel] = None,
+                       related: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> List[TableRows]:
+    """
+    Converte os registros de um arquivo JSON em linhas agrupadas por tabela.
+    As tabelas de relacionamento (e evolution_edges e pokemon_cards, na seção de pokemons) ficam em blocos
+    próprios, já deduplicados e ordenados (ver JoinTableBuilder); related traz os registros
+    dos arquivos em RELATED_FILES.
+    O bloco da tabela principal percorre os registros sob demanda, sem materializar as linhas.
+    """
+    if table_name == "pokemon_weaknesses":
+        pokemon_records = (related or {}).get("09_pokemon.json")
+        return [join_table_rows(build_weakness_table(records, pokemon_records, schema, load_type_chart(related)))]
+    
+    encoder = compile_row_encoder(table_name, records, schema)
+    main_rows = (encoder, map(encoder.extract, records))
+    
+    if table_name == "pokemons":
+        builders = build_pokemon_tables(records, related, schema)
+        return [main_rows] + [join_table_rows(builder) for builder in builders]
+    
+    return [main_rows]
+
+def generate_copy_sql(encoder: RowEncoder, rows: Iterable[Tuple[Any, ...]]) -> Iterator[str]:
+    """Gera um bloco COPY ... FROM stdin com as linhas separadas por TAB."""
+    rows = iter(rows)
+    first_row = next(rows, None)
+    if first_row is None:
+        return
+    
+    copy_line = encoder.copy_line
+    yield f"COPY {encoder.table_name} ({encoder.columns_sql}) FROM stdin;"
+    yield copy_line(first_row)
+    for row in rows:
+        yield copy_line(row)
+    yield "\\."
+
+def generate_single_insert_sql(encoder: RowEncoder, rows: Iterable[Tuple[Any, ...]]) -> Iterator[str]:
+    """Gera um INSERT por linha já extraída."""
+    insert_prefix = encoder.insert_prefix
+    sql_values = encoder.sql_values
+    for row in rows:
+        yield insert_prefix + sql_values(row) + ");"
 
-def load_json_file(file_path: Path) -> List[Dict[str, Any]]:
-    """Carrega e valida um arquivo JSON."""
+def generate_batched_insert_sql(encoder: RowEncoder, rows: Iterable[Tuple[Any, ...]],
+                                batch_size: int) -> Iterator[str]:
+    """Gera INSERTs multi-linha com até batch_size registros por comando."""
+    sql_values = encoder.sql_values
+    rows = iter(rows)
+    
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        values_str = ",\n".join(["(" + sql_values(row) + ")" for row in batch])
+        yield f"INSERT INTO {encoder.table_name} ({encoder.columns_sql}) VALUES\n{values_str};"
+
+def process_special_tables(table_name: str, records: List[Dict[str, Any]],
+                           schema: Optional[SchemaModel] = None,
+                           related: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Iterator[str]:
+    """
+    Processa tabelas com relacionamentos especiais: um INSERT por linha, com as
+    tabelas de relacionamento em bloco (sem duplicatas e ordenadas) após a tabela principal.
+    """
+    if table_name in ["pokemon_weaknesses", "pokemons"]:
+        # Para pokémons, também gera as tabelas de relacionamento, evolution_edges e pokemon_cards; pokemon_weaknesses
+        # é calculada pela tabela de efetividade (ou, sem ela, lida de 10_weaknesses.json e 09_pokemon.json)
+        for encoder, rows in collect_table_rows(table_name, records, schema, related):
+            yield from generate_single_insert_sql(encoder, rows)
+    else:
+        # evolution_chains e demais tabelas usam o codificador compilado
+        yield from generate_insert_sql(table_name, records, schema)
+
+def generate_insert_sql(table_name: str, records: List[Dict[str, Any]],
+                        schema: Optional[SchemaModel] = None) -> Iterator[str]:
+    """Gera comandos INSERT SQL, um por registro, com o codificador compilado da tabela."""
+    if not records:
+        return
+    yield from map(compile_row_encoder(table_name, records, schema).insert_sql, records)
+
+def load_json_file(file_path: Path, json_backend: str = "auto") -> List[Dict[str, Any]]:
+    """
+    Carrega e valida um arquivo JSON com o backend escolhido (ver seed_json).
+    Com o backend stream, retorna um JsonArrayFile: os registros são relidos do
+    arquivo a cada iteração, sem manter o array inteiro em memória.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-        if not isinstance(data, list):
+        data = load_json_data(file_path, json_backend)
+        
+        if isinstance(data, JsonArrayFile):
+            if data.wrapped:
+                print(f"⚠️  AVISO: {file_path.name} não contém um array. Tratando o valor como registro único.")
+        elif not isinstance(data, list):
             print(f"⚠️  AVISO: {file_path.name} não contém um array. Envolvendo em array.")
             data = [data]
             
@@ -248,103 +816,555 @@ def load_json_file(file_path: Path) -> List[Dict[str, Any]]:
         print(f"❌ ERRO: Falha ao ler arquivo {file_path.name}: {e}")
         return []
 
-def generate_init_data_sql(data_dir: Path, output_file: Path) -> bool:
-    """Gera o arquivo init-data.sql completo."""
+def load_table_records(data_dir: Path, file_name: str, json_backend: str = "auto",
+                       snapshot: Optional["DatasetSnapshot"] = None) -> List[Dict[str, Any]]:
+    """Registros de um arquivo: do snapshot, quando houver, ou lidos do JSON."""
+    if snapshot is not None:
+        records = snapshot.records(file_name)
+        if records is not None:
+            return records
+    return load_json_file(data_dir / file_name, json_backend)
+
+def related_file_shared(file_name: str) -> bool:
+    """Arquivo usado pelas seções de mais de um arquivo em RELATED_FILES (ex.: 02_type.json)."""
+    return sum(file_name in files for files in RELATED_FILES.values()) > 1
+
+def load_related_records(data_dir: Path, file_name: str, json_backend: str = "auto",
+                         snapshot: Optional["DatasetSnapshot"] = None,
+                         cache: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Registros dos arquivos que a seção de file_name também usa (RELATED_FILES).
+    Arquivos ausentes são ignorados; registros já lidos por uma seção anterior vêm do cache
+    (e saem dele, a menos que outra seção também os use).
+    """
+    related = {}
+    for related_file in RELATED_FILES.get(file_name, []):
+        if cache is not None and related_file in cache:
+            related[related_file] = cache[related_file] if related_file_shared(related_file) else cache.pop(related_file)
+        elif (data_dir / related_file).exists():
+            related[related_file] = load_table_records(data_dir, related_file, json_backend, snapshot)
+    return related
+
+def section_hashes(file_hashes: Dict[str, str]) -> Dict[str, str]:
+    """Hash de cada seção: o do seu JSON, combinado com os dos arquivos relacionados (RELATED_FILES)."""
+    hashes = dict(file_hashes)
+    for file_name, related_files in RELATED_FILES.items():
+        if file_name in hashes:
+            combined = ":".join([file_hashes[file_name]] + [file_hashes.get(name, "-") for name in related_files])
+            hashes[file_name] = hashlib.sha256(combined.encode('utf-8')).hexdigest()
+    return hashes
+
+def render_table_sql(table_name: str, records: List[Dict[str, Any]], output_format: str,
+                     batch_size: int = 1, schema: Optional[SchemaModel] = None,
+                     engine: str = "row",
+                     related: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Iterator[str]:
+    """
+    Renderiza os registros de um arquivo JSON no formato de saída escolhido.
+    related traz os registros dos arquivos em RELATED_FILES (ver collect_table_rows).
+    """
+    if engine == "columnar":
+        from seed_columnar import render_columnar_sql  # seed_columnar importa este módulo
+        yield from render_columnar_sql(table_name, records, output_format, batch_size, schema, related)
+    elif output_format == "copy":
+        for encoder, rows in collect_table_rows(table_name, records, schema, related):
+            yield from generate_copy_sql(encoder, rows)
+    elif batch_size > 1:
+        for encoder, rows in collect_table_rows(table_name, records, schema, related):
+            yield from generate_batched_insert_sql(encoder, rows, batch_size)
+    elif table_name in ["evolution_chains", "pokemon_weaknesses", "pokemons"]:
+        yield from process_special_tables(table_name, records, schema, related)
+    else:
+        yield from generate_insert_sql(table_name, records, schema)
+
+class SqlFileWriter:
+    """
+    Escreve o SQL linha a linha com buffer limitado, em um arquivo temporário
+    que só substitui o arquivo de saída ao final da geração.
+    O conteúdo é idêntico a '\\n'.join(entradas), sem quebra de linha final.
+    entry_count conta as entradas escritas (um INSERT multi-linha é uma entrada);
+    line_count conta linhas físicas, usadas para localizar seções no arquivo.
+    """
+    
+    def __init__(self, output_file: Path, buffer_size: int = WRITE_BUFFER_SIZE):
+        self.output_file = output_file
+        self.temp_file = output_file.with_name(output_file.name + ".tmp")
+        self.buffer_size = buffer_size
+        self.entry_count = 0
+        self.line_count = 0
+        self._file = None
+    
+    def __enter__(self) -> "SqlFileWriter":
+        self._file = open(self.temp_file, 'w', encoding='utf-8', buffering=self.buffer_size)
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._file.close()
+        if exc_type is None:
+            os.replace(self.temp_file, self.output_file)
+        else:
+            self.temp_file.unlink(missing_ok=True)
+    
+    def write_line(self, line: str) -> None:
+        """Escreve uma entrada (separador antes de todas, exceto a primeira)."""
+        if self.line_count:
+            self._file.write("\n")
+        self._file.write(line)
+        self.entry_count += 1
+        self.line_count += line.count("\n") + 1
+    
+    def write_lines(self, lines: Iterable[str]) -> int:
+        """Consome um iterador de entradas e retorna quantas foram escritas."""
+        written = 0
+        for line in lines:
+            self.write_line(line)
+            written += 1
+        return written
+    
+    def copy_lines(self, lines: Iterable[str], entry_count: int) -> None:
+        """Copia linhas físicas de outro arquivo gerado, que correspondem a entry_count entradas."""
+        for line in lines:
+            if self.line_count:
+                self._file.write("\n")
+            self._file.write(line)
+            self.line_count += 1
+        self.entry_count += entry_count
+
+def file_sha256(file_path: Path) -> str:
+    """Calcula o SHA-256 de um arquivo lendo em blocos."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(WRITE_BUFFER_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def tool_fingerprint() -> str:
+    """
+    Identifica a versão do gerador: versão declarada + conteúdo do script e dos módulos seed_*.py
+    ao lado dele (motor colunar, tabela de efetividade, leitura dos JSONs...), que também definem a saída.
+    """
+    script = Path(__file__).resolve()
+    digest = hashlib.sha256()
+    for module in [script] + sorted(script.parent.glob("seed_*.py")):
+        digest.update(f"{module.name}:{file_sha256(module)}\n".encode('utf-8'))
+    return f"{TOOL_VERSION}+{digest.hexdigest()[:12]}"
+
+def manifest_path_for(output_file: Path) -> Path:
+    """Caminho do manifesto associado a um arquivo de saída."""
+    return output_file.with_name(output_file.name + MANIFEST_SUFFIX)
+
+def load_manifest(manifest_file: Path) -> Optional[Dict[str, Any]]:
+    """Lê o manifesto da geração anterior, se existir e for válido."""
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+def find_reusable_sections(manifest: Optional[Dict[str, Any]], output_file: Path,
+                           options: Dict[str, Any], file_hashes: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Retorna as seções da saída anterior que podem ser copiadas sem regenerar:
+    mesma versão do gerador, mesmas opções, saída intacta e mesmo hash do JSON.
+    """
+    if not manifest or not output_file.exists():
+        return {}
+    if manifest.get("tool") != tool_fingerprint() or manifest.get("options") != options:
+        return {}
+    if manifest.get("output_sha256") != file_sha256(output_file):
+        return {}
+    
+    return {
+        file_name: entry
+        for file_name, entry in manifest.get("files", {}).items()
+        if file_hashes.get(file_name) == entry.get("sha256")
+    }
+
+class PreviousOutputReader:
+    """
+    Lê seções de um arquivo escrito pelo SqlFileWriter, sequencialmente, por número de linha.
+    Como não há quebra de linha final, um arquivo terminado em '\\n' tem uma última linha vazia.
+    """
+    
+    def __init__(self, output_file: Path):
+        self._file = open(output_file, 'r', encoding='utf-8', newline='\n')
+        self._position = 0
+        self._pending_empty_line = False
+    
+    def close(self) -> None:
+        self._file.close()
+    
+    def iter_lines(self, start_line: int, line_count: int) -> Iterator[str]:
+        """Produz line_count linhas a partir de start_line (seções em ordem crescente)."""
+        for _ in islice(self._file, start_line - self._position):
+            pass
+        self._position = start_line
+        for line in islice(self._file, line_count):
+            self._position += 1
+            line_count -= 1
+            self._pending_empty_line = line.endswith('\n')
+            yield line[:-1] if self._pending_empty_line else line
+        if line_count and self._pending_empty_line:
+            self._position += 1
+            self._pending_empty_line = False
+            yield ""
+
+def json_backend_description(json_backend: str) -> str:
+    """Descrição do backend de leitura para o cabeçalho da execução."""
+    resolved = resolve_backend(json_backend)
+    if json_backend == "auto":
+        return f"auto ({resolved}; stream acima de {STREAM_THRESHOLD_BYTES // (1024 * 1024)} MB)"
+    if resolved != json_backend:
+        return f"{resolved} ({json_backend} não está instalado)"
+    return resolved
+
+def generated_at() -> str:
+    """
+    Data de geração do cabeçalho. Respeita SOURCE_DATE_EPOCH (builds reprodutíveis),
+    permitindo comparar byte a byte saídas geradas em momentos diferentes.
+    """
+    source_date_epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if source_date_epoch:
+        return datetime.fromtimestamp(int(source_date_epoch), tz=timezone.utc).isoformat()
+    return datetime.now().isoformat()
+
+@contextmanager
+def instrumented(timer: StageTimer) -> Iterator[StageTimer]:
+    """
+    Ativa a medição por etapa enquanto o bloco executa:
+    extract (filtragem + achatamento, fundidos no extrator do RowEncoder, e montagem
+    das tabelas de relacionamento no JoinTableBuilder),
+    escape (escapers por coluna) e write (gravação no arquivo).
+    As etapas parse e assemble são marcadas em write_table_section.
+    No motor colunar, extract e escape são as operações sobre colunas inteiras.
+    """
+    import seed_columnar  # seed_columnar importa este módulo
+    
+    original_init = RowEncoder.__init__
+    
+    def timed_init(self, table_name, columns, kinds, extract):
+        original_init(self, table_name, columns, kinds, timer.wrap("extract", extract))
+    
+    RowEncoder.__init__ = timed_init
+    try:
+        with timer.patched([
+            (RowEncoder, "sql_values", "escape"),
+            (RowEncoder, "copy_line", "escape"),
+            (SqlFileWriter, "write_line", "write"),
+            (SqlFileWriter, "copy_lines", "write"),
+            (JoinTableBuilder, "add_rows", "extract"),
+            (seed_columnar, "extract_columns", "extract"),
+            (seed_columnar, "explode", "extract"),
+            (seed_columnar, "escape_column", "escape"),
+        ]):
+            yield timer
+    finally:
+        RowEncoder.__init__ = original_init
+
+def write_table_section(writer: SqlFileWriter, data_dir: Path, file_name: str,
+                        output_format: str, batch_size: int,
+                        timer: Optional[StageTimer] = None, json_backend: str = "auto",
+                        schema: Optional[SchemaModel] = None, engine: str = "row",
+                        snapshot: Optional["DatasetSnapshot"] = None,
+                        related_cache: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
+    """
+    Carrega um arquivo JSON e escreve a seção da sua tabela.
+    Com um snapshot (ver seed_snapshot), os registros vêm dele em vez do JSON.
+    related_cache guarda os registros usados também por seções seguintes (RELATED_FILES),
+    evitando ler o mesmo arquivo duas vezes na geração serial.
+    Retorna o resumo da seção; 'ok' indica se ela foi gerada com sucesso.
+    """
+    file_path = data_dir / file_name
+    table_name = FILE_TO_TABLE_MAPPING[file_name]
+    if timer:
+        timer.set_table(table_name)
+    start_line = writer.line_count
+    start_entry = writer.entry_count
+    summary = {"ok": False, "table": table_name, "records": 0, "statements": 0,
+               "entry_count": 0, "line_count": 0}
+    
+    print(f"📊 Processando {file_name} -> tabela '{table_name}'...")
+    
+    if not file_path.exists():
+        print(f"❌ ERRO: Arquivo {file_name} não encontrado!")
+        return summary
+    
+    # Carrega dados do JSON (ou do snapshot), com os arquivos relacionados
+    if timer:
+        with timer.stage("parse"):
+            records = load_table_records(data_dir, file_name, json_backend, snapshot)
+            related = load_related_records(data_dir, file_name, json_backend, snapshot, related_cache)
+    else:
+        records = load_table_records(data_dir, file_name, json_backend, snapshot)
+        related = load_related_records(data_dir, file_name, json_backend, snapshot, related_cache)
+    if related_cache is not None and records and any(file_name in files for files in RELATED_FILES.values()):
+        related_cache[file_name] = records
+    
+    if not records:
+        print(f"❌ ERRO: Nenhum registro válido encontrado em {file_name}")
+        return summary
+    
+    # Adiciona comentário de seção no SQL
+    writer.write_line(f"-- Dados da tabela: {table_name} (origem: {file_name})")
+    summary["records"] = len(records)
+    
+    try:
+        # Gera e escreve os comandos SQL sob demanda
+        if timer:
+            with timer.stage("assemble"):
+                statement_count = writer.write_lines(
+                    render_table_sql(table_name, records, output_format, batch_size, schema, engine, related)
+                )
+        else:
+            statement_count = writer.write_lines(
+                render_table_sql(table_name, records, output_format, batch_size, schema, engine, related)
+            )
+        
+        if statement_count:
+            writer.write_line("")  # Linha em branco entre seções
+            print(f"✅ SUCESSO: {len(records)} registros processados, {statement_count} comandos SQL gerados")
+            summary["ok"] = True
+            summary["statements"] = statement_count
+        else:
+            print(f"❌ ERRO: Nenhum comando SQL gerado para {file_name}")
+            
+    except Exception as e:
+        print(f"❌ ERRO: Falha ao processar {file_name}: {e}")
+    
+    summary["entry_count"] = writer.entry_count - start_entry
+    summary["line_count"] = writer.line_count - start_line
+    return summary
+
+def render_section_file(data_dir: Path, file_name: str, section_file: Path,
+                        output_format: str, batch_size: int,
+                        json_backend: str = "auto", schema: Optional[SchemaModel] = None,
+                        engine: str = "row",
+                        snapshot: Optional["DatasetSnapshot"] = None) -> Tuple[Dict[str, Any], str]:
+    """
+    Executado nos processos do pool: gera a seção em um arquivo próprio e
+    devolve o resumo junto com as mensagens capturadas (impressas depois, em ordem).
+    """
+    captured = io.StringIO()
+    with redirect_stdout(captured), SqlFileWriter(section_file) as writer:
+        summary = write_table_section(writer, data_dir, file_name, output_format, batch_size,
+                                      json_backend=json_backend, schema=schema, engine=engine,
+                                      snapshot=snapshot)
+    return summary, captured.getvalue()
+
+def generate_init_data_sql(data_dir: Path, output_file: Path, output_format: str = "insert",
+                           batch_size: int = 1, force: bool = False, jobs: int = 1,
+                           timer: Optional[StageTimer] = None, json_backend: str = "auto",
+                           schema_file: Path = DEFAULT_SCHEMA_FILE, engine: str = "row",
+                           snapshot: Optional["DatasetSnapshot"] = None) -> bool:
+    """
+    Gera o arquivo init-data.sql completo.
+    Cada tabela é carregada, convertida e escrita em sequência (pipeline de geradores),
+    então apenas os registros do arquivo JSON corrente ficam em memória (e os de
+    09_pokemon.json até a seção de pokemon_weaknesses, que também os usa).
+    Com jobs > 1, as seções são geradas em paralelo (pool de processos) em arquivos
+    temporários e concatenadas na ordem de dependência; a saída é idêntica à serial.
+    Com um timer, as métricas de cada etapa são acumuladas nele (geração serial).
+    json_backend escolhe o parser dos JSONs (ver seed_json); a saída não depende dele.
+    schema_file define as colunas de cada tabela e a ordem de carga (ver seed_schema).
+    engine escolhe o motor de transformação (row ou columnar); a saída é a mesma.
+    snapshot (ver seed_snapshot) substitui a leitura dos JSONs e o cálculo dos hashes;
+    precisa estar atualizado em relação a data_dir (open_snapshot garante isso).
+    """
     print("🚀 Iniciando geração do arquivo init-data.sql...")
     print(f"📁 Diretório de dados: {data_dir}")
     print(f"📄 Arquivo de saída: {output_file}")
+    print(f"🧾 Formato de saída: {output_format}" +
+          (f" (lotes de {batch_size} registros)" if output_format == "insert" and batch_size > 1 else ""))
+    print(f"🧩 Leitura dos JSONs: {json_backend_description(json_backend)}")
+    print(f"📐 Schema: {schema_file}")
+    if snapshot is not None:
+        print(f"📦 Snapshot do dataset: {snapshot.snapshot_file}")
+    if engine != "row":
+        print(f"🧮 Motor de transformação: {engine}")
+    if jobs > 1:
+        print(f"⚙️  Processos paralelos: {jobs}")
     print()
     
-    all_sql_statements = []
+    schema = load_schema_model(schema_file)
+    options = {"format": output_format, "batch_size": batch_size, "schema_sha256": schema.source_sha256}
+    manifest_file = manifest_path_for(output_file)
+    if snapshot is not None:
+        # O snapshot já guarda o hash de cada JSON que o originou
+        file_hashes = {file_name: entry["sha256"] for file_name, entry in snapshot.sources.items()}
+    else:
+        file_hashes = {
+            file_name: file_sha256(data_dir / file_name)
+            for file_name in FILE_TO_TABLE_MAPPING
+            if (data_dir / file_name).exists()
+        }
+    hashes = section_hashes(file_hashes)
+    reusable = {} if force else find_reusable_sections(
+        load_manifest(manifest_file), output_file, options, hashes
+    )
+    
+    if len(reusable) == len(FILE_TO_TABLE_MAPPING):
+        print("⏭️  Nenhum JSON alterado desde a última geração (use --force para regenerar).")
+        print(f"💾 Arquivo mantido: {output_file}")
+        return True
+    
+    ordered_files = ordered_data_files(schema)
+    pending_files = [file_name for file_name in ordered_files if file_name not in reusable]
     success_count = 0
     error_count = 0
+    manifest_files: Dict[str, Dict[str, Any]] = {}
+    related_cache: Dict[str, List[Dict[str, Any]]] = {}
+    previous_output = PreviousOutputReader(output_file) if reusable else None
     
-    # Header do arquivo SQL
-    all_sql_statements.append("-- init-data.sql")
-    all_sql_statements.append("-- Arquivo gerado automaticamente a partir dos JSONs de dados")
-    all_sql_statements.append(f"-- Gerado em: {datetime.now().isoformat()}")
-    all_sql_statements.append("")
-    all_sql_statements.append("-- Início da carga de dados")
-    all_sql_statements.append("")
-    
-    # Processa cada arquivo na ordem correta
-    for file_name in sorted(FILE_TO_TABLE_MAPPING.keys()):
-        file_path = data_dir / file_name
-        table_name = FILE_TO_TABLE_MAPPING[file_name]
-        
-        print(f"📊 Processando {file_name} -> tabela '{table_name}'...")
-        
-        if not file_path.exists():
-            print(f"❌ ERRO: Arquivo {file_name} não encontrado!")
-            error_count += 1
-            continue
-        
-        # Carrega dados do JSON
-        records = load_json_file(file_path)
-        
-        if not records:
-            print(f"❌ ERRO: Nenhum registro válido encontrado em {file_name}")
-            error_count += 1
-            continue
-        
-        # Adiciona comentário de seção no SQL
-        all_sql_statements.append(f"-- Dados da tabela: {table_name} (origem: {file_name})")
-        
-        try:
-            # Gera comandos SQL
-            if table_name in ["evolution_chains", "pokemon_weaknesses", "pokemons"]:
-                sql_statements = process_special_tables(table_name, records)
-            else:
-                sql_statements = generate_insert_sql(table_name, records)
+    try:
+        with ExitStack() as stack:
+            writer = stack.enter_context(SqlFileWriter(output_file))
+            futures = {}
+            if jobs > 1 and len(pending_files) > 1:
+                sections_dir = Path(stack.enter_context(
+                    tempfile.TemporaryDirectory(prefix=".sections-", dir=output_file.parent)
+                ))
+                pool = stack.enter_context(ProcessPoolExecutor(max_workers=min(jobs, len(pending_files))))
+                futures = {
+                    file_name: pool.submit(render_section_file, data_dir, file_name,
+                                           sections_dir / f"{file_name}.sql", output_format, batch_size,
+                                           json_backend, schema, engine, snapshot)
+                    for file_name in pending_files
+                }
             
-            if sql_statements:
-                all_sql_statements.extend(sql_statements)
-                all_sql_statements.append("")  # Linha em branco entre seções
-                print(f"✅ SUCESSO: {len(records)} registros processados, {len(sql_statements)} comandos SQL gerados")
-                success_count += 1
-            else:
-                print(f"❌ ERRO: Nenhum comando SQL gerado para {file_name}")
-                error_count += 1
+            # Header do arquivo SQL
+            writer.write_lines([
+                "-- init-data.sql",
+                "-- Arquivo gerado automaticamente a partir dos JSONs de dados",
+                f"-- Gerado em: {generated_at()}",
+                "",
+                "-- Início da carga de dados",
+                "",
+            ])
+            
+            # Escreve cada seção na ordem correta
+            for file_name in ordered_files:
+                start_line = writer.line_count
                 
-        except Exception as e:
-            print(f"❌ ERRO: Falha ao processar {file_name}: {e}")
-            error_count += 1
-    
-    # Footer do arquivo SQL
-    all_sql_statements.append("-- Fim da carga de dados")
-    all_sql_statements.append(f"-- Resumo: {success_count} arquivos processados com sucesso, {error_count} com erro")
+                if timer:
+                    timer.set_table(FILE_TO_TABLE_MAPPING[file_name])
+                
+                if file_name in reusable:
+                    # Reaproveita a seção anterior quando o JSON não mudou
+                    print(f"📊 Processando {file_name} -> tabela '{FILE_TO_TABLE_MAPPING[file_name]}'...")
+                    summary = dict(reusable[file_name], ok=True)
+                    writer.copy_lines(previous_output.iter_lines(summary["start_line"], summary["line_count"]),
+                                      summary["entry_count"])
+                    print(f"♻️  SEM ALTERAÇÕES: {summary['records']} registros, {summary['statements']} comandos SQL reaproveitados")
+                elif file_name in futures:
+                    summary, messages = futures[file_name].result()
+                    print(messages, end="")
+                    section_reader = PreviousOutputReader(sections_dir / f"{file_name}.sql")
+                    try:
+                        writer.copy_lines(section_reader.iter_lines(0, summary["line_count"]),
+                                          summary["entry_count"])
+                    finally:
+                        section_reader.close()
+                else:
+                    summary = write_table_section(writer, data_dir, file_name, output_format, batch_size,
+                                                  timer, json_backend, schema, engine, snapshot,
+                                                  related_cache)
+                
+                if summary.pop("ok"):
+                    success_count += 1
+                    summary["sha256"] = hashes[file_name]
+                    summary["start_line"] = start_line
+                    manifest_files[file_name] = summary
+                else:
+                    error_count += 1
+            
+            # Footer do arquivo SQL
+            if timer:
+                timer.set_table("-")
+            writer.write_line("-- Fim da carga de dados")
+            writer.write_line(f"-- Resumo: {success_count} arquivos processados com sucesso, {error_count} com erro")
     
-    # Escreve o arquivo final
-    try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(all_sql_statements))
-        
-        print()
-        print("📁 Arquivo init-data.sql gerado com sucesso!")
-        print(f"📊 Resumo final:")
-        print(f"   ✅ Arquivos processados com sucesso: {success_count}")
-        print(f"   ❌ Arquivos com erro: {error_count}")
-        print(f"   📄 Total de linhas SQL geradas: {len(all_sql_statements)}")
-        print(f"   💾 Arquivo salvo em: {output_file}")
-        
-        return error_count == 0
-        
-    except Exception as e:
+    except OSError as e:
         print(f"❌ ERRO CRÍTICO: Falha ao escrever arquivo SQL: {e}")
         return False
+    finally:
+        if previous_output:
+            previous_output.close()
+    
+    # Só grava o manifesto quando todas as seções foram geradas corretamente
+    if error_count == 0:
+        manifest = {
+            "tool": tool_fingerprint(),
+            "options": options,
+            "output_sha256": file_sha256(output_file),
+            "files": manifest_files,
+        }
+        with open(manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+    else:
+        manifest_file.unlink(missing_ok=True)
+    
+    print()
+    print("📁 Arquivo init-data.sql gerado com sucesso!")
+    print(f"📊 Resumo final:")
+    print(f"   ✅ Arquivos processados com sucesso: {success_count}")
+    print(f"   ❌ Arquivos com erro: {error_count}")
+    print(f"   📄 Total de linhas SQL geradas: {writer.entry_count}")
+    print(f"   💾 Arquivo salvo em: {output_file}")
+    
+    return error_count == 0
+
+def positive_int(value: str) -> int:
+    """Valida argumentos inteiros maiores que zero."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"valor deve ser >= 1: {value}")
+    return number
+
+def parse_args() -> argparse.Namespace:
+    """Lê os argumentos de linha de comando."""
+    project_root = Path(__file__).parent.parent.parent  # Sobe para raiz do projeto
+    
+    parser = argparse.ArgumentParser(description="Gera o init-data.sql a partir dos JSONs da Pokédex.")
+    parser.add_argument("data_dir", nargs="?", type=Path, default=project_root / "data" / "json",
+                        help="Diretório com os arquivos JSON (padrão: data/json)")
+    parser.add_argument("--output", type=Path,
+                        default=project_root / "database" / "seeds" / "init-data.sql",
+                        help="Arquivo SQL de saída (padrão: database/seeds/init-data.sql)")
+    parser.add_argument("--schema", type=Path, default=DEFAULT_SCHEMA_FILE,
+                        help="Schema que define as colunas, os tipos e a ordem de carga das tabelas "
+                             "(padrão: database/schema/schema.sql)")
+    parser.add_argument("--format", dest="output_format", choices=OUTPUT_FORMATS, default="insert",
+                        help="insert: um INSERT por registro; copy: blocos COPY ... FROM stdin por tabela")
+    parser.add_argument("--batch-size", type=positive_int, default=1,
+                        help="Registros por INSERT no formato insert (padrão: 1, um INSERT por registro)")
+    parser.add_argument("--jobs", type=positive_int, default=1,
+                        help="Processos paralelos para gerar as tabelas (padrão: 1, serial)")
+    parser.add_argument("--force", action="store_true",
+                        help="Regenera todas as tabelas, ignorando o manifesto da geração anterior")
+    parser.add_argument("--engine", choices=ENGINES, default="row",
+                        help="Motor de transformação: row (registro a registro, padrão) ou columnar "
+                             "(colunas inteiras por vez; usa NumPy se instalado)")
+    parser.add_argument("--snapshot", action="store_true",
+                        help="Lê os dados do snapshot binário do dataset (build/cache), reconstruído "
+                             "automaticamente quando algum JSON muda")
+    parser.add_argument("--json-backend", choices=JSON_BACKENDS, default="auto",
+                        help="Parser dos JSONs: auto (orjson se instalado, senão json; stream para arquivos grandes), "
+                             "orjson, json ou stream (registros lidos um a um, sem carregar o arquivo; cada "
+                             "passada relê o arquivo, então é várias vezes mais lento)")
+    parser.add_argument("--timings", action="store_true",
+                        help="Mede tempo de parede e de CPU por tabela e etapa (parse, extract, escape, assemble, write)")
+    parser.add_argument("--track-allocations", action="store_true",
+                        help="Com --timings, mede também o pico de alocações por etapa (tracemalloc; mais lento)")
+    parser.add_argument("--timings-json", type=Path, metavar="ARQUIVO",
+                        help="Com --timings, grava as métricas em JSON neste arquivo")
+    parser.add_argument("--profile", type=Path, metavar="ARQUIVO",
+                        help="Executa sob cProfile e grava o perfil (formato pstats) neste arquivo")
+    return parser.parse_args()
 
 def main():
     """Função principal."""
-    if len(sys.argv) > 1:
-        # Permite especificar diretório como argumento
-        data_dir = Path(sys.argv[1])
-    else:
-        # Usa diretório padrão do projeto
-        script_dir = Path(__file__).parent.parent.parent  # Sobe para raiz do projeto
-        data_dir = script_dir / "data" / "json"
-    
-    # Arquivo de saída
-    output_file = Path(__file__).parent.parent.parent / "database" / "seeds" / "init-data.sql"
+    args = parse_args()
+    data_dir = args.data_dir
+    output_file = args.output
     
     # Valida diretório de entrada
     if not data_dir.exists():
@@ -354,8 +1374,44 @@ def main():
     # Cria diretório de saída se não existir
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
+    timings = args.timings or args.track_allocations or args.timings_json is not None
+    jobs = args.jobs
+    if (timings or args.profile) and jobs > 1:
+        # As medições só enxergam o processo principal
+        print("⚠️  Medição de desempenho ativa: gerando em série (--jobs ignorado)")
+        jobs = 1
+    timer = StageTimer(track_allocations=args.track_allocations) if timings else None
+    
+    snapshot = None
+    if args.snapshot:
+        from seed_snapshot import open_snapshot  # seed_snapshot importa este módulo
+        try:
+            snapshot = open_snapshot(data_dir, json_backend=args.json_backend)
+        except Exception as e:
+            print(f"⚠️  AVISO: Snapshot indisponível ({e}); lendo os JSONs diretamente")
+    
+    def run() -> bool:
+        if not timer:
+            return generate_init_data_sql(data_dir, output_file, args.output_format, args.batch_size,
+                                          args.force, jobs, json_backend=args.json_backend,
+                                          schema_file=args.schema, engine=args.engine, snapshot=snapshot)
+        with instrumented(timer):
+            return generate_init_data_sql(data_dir, output_file, args.output_format, args.batch_size,
+                                          args.force, jobs, timer, args.json_backend, args.schema,
+                                          args.engine, snapshot)
+    
     # Executa geração
-    success = generate_init_data_sql(data_dir, output_file)
+    try:
+        success = run_with_cprofile(run, args.profile) if args.profile else run()
+    finally:
+        if snapshot is not None:
+            snapshot.close()
+    
+    if timer:
+        timer.print_report()
+        if args.timings_json:
+            timer.dump_json(args.timings_json)
+            print(f"💾 Métricas salvas em: {args.timings_json}")
     
     sys.exit(0 if success else 1)
 
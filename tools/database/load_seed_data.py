@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Carrega os JSONs da Pokédex diretamente em um banco, sem passar pelo init-data.sql.
+As linhas vêm dos mesmos codificadores do generate_sql_from_json.py e são gravadas
+tabela a tabela, na ordem de dependência (chaves estrangeiras), em uma única transação.
+Destinos:
+- postgres: COPY ... FROM STDIN (ou INSERTs em lote com execute_values), via psycopg2
+- sqlite: executemany em lotes; útil como banco local de teste (sem servidor)
+"""
+
+import argparse
+import io
+import json
+import re
+import sqlite3
+import sys
+import time
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from generate_sql_from_json import (
+    FILE_TO_TABLE_MAPPING,
+    RELATED_FILES,
+    RowEncoder,
+    collect_table_rows,
+    load_json_file,
+    ordered_data_files,
+    positive_int,
+    related_file_shared,
+)
+from seed_json import JSON_BACKENDS
+from seed_schema import DEFAULT_SCHEMA_FILE, load_schema_model
+
+LOAD_TARGETS = ["postgres", "sqlite"]
+LOAD_METHODS = ["copy", "insert"]
+
+# Linhas por lote no método insert
+DEFAULT_BATCH_SIZE = 1000
+
+class CopyLineStream(io.TextIOBase):
+    """Arquivo somente leitura que entrega linhas do COPY geradas sob demanda."""
+    
+    def __init__(self, lines: Iterable[str]):
+        self._lines = iter(lines)
+        self._buffer = ""
+    
+    def readable(self) -> bool:
+        return True
+    
+    def read(self, size: int = -1) -> str:
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        while size < 0 or length < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            chunks.append(line + "\n")
+            length += len(line) + 1
+        data = "".join(chunks)
+        if size < 0 or len(data) <= size:
+            self._buffer = ""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+    
+    def readline(self, size: int = -1) -> str:
+        if self._buffer:
+            line, separator, rest = self._buffer.partition("\n")
+            self._buffer = rest
+            return line + separator
+        line = next(self._lines, None)
+        return "" if line is None else line + "\n"
+
+def parameter_adapter(encoder: RowEncoder) -> Callable[[Tuple[Any, ...]], Tuple[Any, ...]]:
+    """Converte as colunas JSON de uma linha extraída em texto, para uso como parâmetro."""
+    json_positions = [index for index, kind in enumerate(encoder.kinds) if kind == "json"]
+    if not json_positions:
+        return lambda row: row
+    
+    def adapt(row: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        values = list(row)
+        for index in json_positions:
+            if values[index] is not None:
+                values[index] = json.dumps(values[index], ensure_ascii=False)
+        return tuple(values)
+    return adapt
+
+def batches(rows: Iterable[Tuple[Any, ...]], batch_size: int) -> Iterator[List[Tuple[Any, ...]]]:
+    """Agrupa as linhas em listas de até batch_size elementos."""
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def sqlite_schema_script(schema_sql: str) -> str:
+    """Adapta o schema.sql do PostgreSQL ao SQLite (DROP TABLE de várias tabelas com CASCADE)."""
+    def split_drop(match: "re.Match[str]") -> str:
+        tables = [table.strip() for table in match.group(1).split(",")]
+        return "\n".join(f"DROP TABLE IF EXISTS {table};" for table in tables)
+    return re.sub(r"DROP TABLE IF EXISTS ([^;]+?)(?:\s+CASCADE)?;", split_drop, schema_sql, flags=re.IGNORECASE)
+
+class PostgresTarget:
+    """Carga em PostgreSQL via psycopg2."""
+    
+    name = "postgres"
+    
+    def __init__(self, host: str, port: int, database: str, user: str, password: str):
+        self.connection_params = {
+            'host': host,
+            'port': port,
+            'database': database,
+            'user': user,
+            'password': password
+        }
+        self.conn = None
+        self.cursor = None
+        self._dropped_constraints: List[Tuple[str, str, str]] = []
+        self._dropped_indexes: List[Tuple[str, str]] = []
+    
+    def describe(self) -> str:
+        params = self.connection_params
+        return f"postgres://{params['user']}@{params['host']}:{params['port']}/{params['database']}"
+    
+    def connect(self) -> None:
+        try:
+            import psycopg2
+            import psycopg2.extras
+        except ImportError:
+            raise RuntimeError("psycopg2 não está instalado (pip install psycopg2-binary)")
+        self._execute_values = psycopg2.extras.execute_values
+        self.conn = psycopg2.connect(**self.connection_params)
+        self.conn.autocommit = False
+        self.cursor = self.conn.cursor()
+    
+    def apply_schema(self, schema_sql: str) -> None:
+        self.cursor.execute(schema_sql)
+    
+    def truncate(self, tables: List[str]) -> None:
+        self.cursor.execute(f"TRUNCATE {', '.join(tables)} RESTART IDENTITY CASCADE")
+    
+    def defer_constraints(self, tables: List[str]) -> int:
+        """Remove as FKs das tabelas; restore_constraints as recria (e valida) ao final da carga."""
+        self.cursor.execute("""
+            SELECT conrelid::regclass::text, conname, pg_get_constraintdef(oid)
+            FROM pg_constraint
+            WHERE contype = 'f' AND conrelid::regclass::text = ANY(%s)
+        """, (tables,))
+        self._dropped_constraints = self.cursor.fetchall()
+        for table, constraint, _ in self._dropped_constraints:
+            self.cursor.execute(f'ALTER TABLE {table} DROP CONSTRAINT "{constraint}"')
+        return len(self._dropped_constraints)
+    
+    def restore_constraints(self) -> None:
+        for table, constraint, definition in self._dropped_constraints:
+            self.cursor.execute(f'ALTER TABLE {table} ADD CONSTRAINT "{constraint}" {definition}')
+        self._dropped_constraints = []
+    
+    def drop_indexes(self, tables: List[str]) -> int:
+        """Remove os índices secundários (que não sustentam PK/UNIQUE) das tabelas."""
+        self.cursor.execute("""
+            SELECT i.indexrelid::regclass::text, pg_get_indexdef(i.indexrelid)
+            FROM pg_index i
+            WHERE i.indrelid::regclass::text = ANY(%s)
+              AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+        """, (tables,))
+        self._dropped_indexes = self.cursor.fetchall()
+        for index, _ in self._dropped_indexes:
+            self.cursor.execute(f"DROP INDEX {index}")
+        return len(self._dropped_indexes)
+    
+    def rebuild_indexes(self) -> None:
+        for _, definition in self._dropped_indexes:
+            self.cursor.execute(definition)
+        self._dropped_indexes = []
+    
+    def load_rows(self, encoder: RowEncoder, rows: Iterable[Tuple[Any, ...]], method: str,
+                  batch_size: int) -> None:
+        if method == "copy":
+            self.cursor.copy_expert(f"COPY {encoder.table_name} ({encoder.columns_sql}) FROM STDIN",
+                                    CopyLineStream(map(encoder.copy_line, rows)))
+            return
+        adapt = parameter_adapter(encoder)
+        self._execute_values(self.cursor, f"INSERT INTO {encoder.table_name} ({encoder.columns_sql}) VALUES %s",
+                             map(adapt, rows), page_size=batch_size)
+    
+    def commit(self) -> None:
+        self.conn.commit()
+    
+    def rollback(self) -> None:
+        if self.conn:
+            self.conn.rollback()
+    
+    def close(self) -> None:
+        if self.conn:
+            self.conn.close()
+
+class SqliteTarget:
+    """Carga em SQLite (biblioteca padrão), usada como banco local de teste."""
+    
+    name = "sqlite"
+    
+    def __init__(self, database: str):
+        self.database = database
+        self.conn = None
+        self._dropped_indexes: List[Tuple[str, str]] = []
+    
+    def describe(self) -> str:
+        return f"sqlite:{self.database}"
+    
+    def connect(self) -> None:
+        # Transações controladas explicitamente (BEGIN/COMMIT)
+        self.conn = sqlite3.connect(self.database, isolation_level=None)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("BEGIN")
+    
+    def apply_schema(self, schema_sql: str) -> None:
+        # PRAGMA foreign_keys não muda dentro de transação; o schema é aplicado antes dela
+        self.conn.execute("ROLLBACK")
+        self.conn.execute("PRAGMA foreign_keys = OFF")
+        self.conn.executescript(sqlite_schema_script(schema_sql))
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("BEGIN")
+    
+    def truncate(self, tables: List[str]) -> None:
+        for table in reversed(tables):
+            self.conn.execute(f"DELETE FROM {table}")
+    
+    def defer_constraints(self, tables: List[str]) -> int:
+        """As FKs passam a ser verificadas apenas no COMMIT."""
+        self.conn.execute("PRAGMA defer_foreign_keys = ON")
+        return sum(len(self.conn.execute(f"PRAGMA foreign_key_list({table})").fetchall()) for table in tables)
+    
+    def restore_constraints(self) -> None:
+        pass
+    
+    def drop_indexes(self, tables: List[str]) -> int:
+        """Remove os índices criados com CREATE INDEX (os automáticos de PK/UNIQUE não têm sql)."""
+        placeholders = ", ".join("?" for _ in tables)
+        self._dropped_indexes = self.conn.execute(
+            f"SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL "
+            f"AND tbl_name IN ({placeholders})", tables).fetchall()
+        for index, _ in self._dropped_indexes:
+            self.conn.execute(f'DROP INDEX "{index}"')
+        return len(self._dropped_indexes)
+    
+    def rebuild_indexes(self) -> None:
+        for _, definition in self._dropped_indexes:
+            self.conn.execute(definition)
+        self._dropped_indexes = []
+    
+    def load_rows(self, encoder: RowEncoder, rows: Iterable[Tuple[Any, ...]], method: str,
+                  batch_size: int) -> None:
+        # SQLite não tem COPY: os dois métodos usam executemany em lotes
+        adapt = parameter_adapter(encoder)
+        placeholders = ", ".join("?" for _ in encoder.columns)
+        statement = f"INSERT INTO {encoder.table_name} ({encoder.columns_sql}) VALUES ({placeholders})"
+        for batch in batches(map(adapt, rows), batch_size):
+            self.conn.executemany(statement, batch)
+    
+    def commit(self) -> None:
+        self.conn.execute("COMMIT")
+    
+    def rollback(self) -> None:
+        if self.conn and self.conn.in_transaction:
+            self.conn.execute("ROLLBACK")
+    
+    def close(self) -> None:
+        if self.conn:
+            self.conn.close()
+
+def counted(rows: Iterable[Tuple[Any, ...]], counter: Dict[str, int]) -> Iterator[Tuple[Any, ...]]:
+    """Repassa as linhas contando quantas foram consumidas."""
+    for row in rows:
+        counter["rows"] += 1
+        yield row
+
+def load_table_rows(target, encoder: RowEncoder, rows: Iterable[Tuple[Any, ...]], method: str,
+                    batch_size: int) -> Optional[Dict[str, Any]]:
+    """Carrega as linhas de uma tabela e retorna as métricas (None se não houver linhas)."""
+    rows = iter(rows)
+    first_row = next(rows, None)
+    if first_row is None:
+        return None
+    
+    counter = {"rows": 0}
+    start = time.perf_counter()
+    target.load_rows(encoder, counted(chain([first_row], rows), counter), method, batch_size)
+    seconds = time.perf_counter() - start
+    return {"table": encoder.table_name, "rows": counter["rows"], "seconds": seconds}
+
+def print_throughput(results: List[Dict[str, Any]]) -> None:
+    """Imprime as métricas de carga por tabela."""
+    print("\n⏱️  CARGA POR TABELA:")
+    print("-" * 62)
+    print(f"{'Tabela':<20} | {'Linhas':>10} | {'Tempo (s)':>10} | {'Linhas/s':>12}")
+    print("-" * 62)
+    for result in results:
+        rate = result["rows"] / result["seconds"] if result["seconds"] > 0 else 0.0
+        print(f"{result['table']:<20} | {result['rows']:>10} | {result['seconds']:>10.3f} | {rate:>12,.0f}")
+    print("-" * 62)
+    total_rows = sum(result["rows"] for result in results)
+    total_seconds = sum(result["seconds"] for result in results)
+    total_rate = total_rows / total_seconds if total_seconds > 0 else 0.0
+    print(f"{'TOTAL':<20} | {total_rows:>10} | {total_seconds:>10.3f} | {total_rate:>12,.0f}")
+
+def load_seed_data(target, data_dir: Path, method: str = "copy", batch_size: int = DEFAULT_BATCH_SIZE,
+                   schema_file: Optional[Path] = None, truncate: bool = False,
+                   defer_constraints: bool = False, rebuild_indexes: bool = False,
+                   json_backend: str = "auto") -> bool:
+    """
+    Carrega todos os JSONs no destino em uma única transação.
+    Qualquer erro desfaz a carga inteira. A ordem de carga e as colunas vêm do
+    schema_file (ou do schema padrão, sem aplicá-lo, quando schema_file não é informado).
+    """
+    print("🚀 Iniciando carga direta dos JSONs...")
+    print(f"📁 Diretório de dados: {data_dir}")
+    print(f"🗄️  Destino: {target.describe()}")
+    if target.name == "sqlite":
+        print(f"🧾 Método: executemany em lotes de {batch_size} linhas (SQLite não tem COPY)")
+    else:
+        print(f"🧾 Método: {method}" + (f" (lotes de {batch_size} linhas)" if method == "insert" else ""))
+    print()
+    
+    schema = load_schema_model(schema_file or DEFAULT_SCHEMA_FILE)
+    tables = schema.load_plan()
+    # Registros usados também pela carga de outro arquivo (ex.: fraquezas embutidas em 09_pokemon.json)
+    related_sources = {name for names in RELATED_FILES.values() for name in names}
+    loaded: Dict[str, List[Dict[str, Any]]] = {}
+    results: List[Dict[str, Any]] = []
+    total_start = time.perf_counter()
+    
+    try:
+        target.connect()
+        
+        if schema_file:
+            print(f"📐 Aplicando schema: {schema_file}")
+            target.apply_schema(schema_file.read_text(encoding='utf-8'))
+        if truncate:
+            print("🧹 Limpando as tabelas antes da carga...")
+            target.truncate(tables)
+        if defer_constraints:
+            print(f"⏸️  Chaves estrangeiras adiadas até o fim da carga: {target.defer_constraints(tables)}")
+        if rebuild_indexes:
+            print(f"🗂️  Índices secundários removidos para a carga: {target.drop_indexes(tables)}")
+        
+        for file_name in ordered_data_files(schema):
+            table_name = FILE_TO_TABLE_MAPPING[file_name]
+            file_path = data_dir / file_name
+            print(f"📊 Carregando {file_name} -> tabela '{table_name}'...")
+            
+            if not file_path.exists():
+                raise RuntimeError(f"Arquivo {file_name} não encontrado")
+            records = load_json_file(file_path, json_backend)
+            if not records:
+                raise RuntimeError(f"Nenhum registro válido encontrado em {file_name}")
+            if file_name in related_sources:
+                loaded[file_name] = records
+            related = {name: loaded[name] if related_file_shared(name) else loaded.pop(name)
+                       for name in RELATED_FILES.get(file_name, []) if name in loaded}
+            
+            for encoder, rows in collect_table_rows(table_name, records, schema, related):
+                result = load_table_rows(target, encoder, rows, method, batch_size)
+                if result:
+                    results.append(result)
+                    print(f"✅ {result['table']}: {result['rows']} linhas em {result['seconds']:.3f}s")
+        
+        if rebuild_indexes:
+            print("🗂️  Recriando índices secundários...")
+            target.rebuild_indexes()
+        if defer_constraints:
+            print("▶️  Validando chaves estrangeiras...")
+            target.restore_constraints()
+        
+        target.commit()
+    except Exception as e:
+        print(f"❌ ERRO: Falha na carga, transação desfeita: {e}")
+        target.rollback()
+        return False
+    finally:
+        target.close()
+    
+    print_throughput(results)
+    print(f"\n✅ Carga concluída em {time.perf_counter() - total_start:.3f}s")
+    return True
+
+def parse_args() -> argparse.Namespace:
+    """Lê os argumentos de linha de comando."""
+    project_root = Path(__file__).parent.parent.parent  # Sobe para raiz do projeto
+    
+    parser = argparse.ArgumentParser(description="Carrega os JSONs da Pokédex diretamente no banco.")
+    parser.add_argument("data_dir", nargs="?", type=Path, default=project_root / "data" / "json",
+                        help="Diretório com os arquivos JSON (padrão: data/json)")
+    parser.add_argument("--target", choices=LOAD_TARGETS, default="postgres",
+                        help="Banco de destino (padrão: postgres)")
+    parser.add_argument("--host", default="localhost", help="Host do PostgreSQL (padrão: localhost)")
+    parser.add_argument("--port", type=int, default=5434, help="Porta do PostgreSQL (padrão: 5434)")
+    parser.add_argument("--database", default="pokedex_dev_db", help="Banco do PostgreSQL (padrão: pokedex_dev_db)")
+    parser.add_argument("--user", default="postgres", help="Usuário do PostgreSQL (padrão: postgres)")
+    parser.add_argument("--password", default="postgres", help="Senha do PostgreSQL (padrão: postgres)")
+    parser.add_argument("--sqlite-db", default=":memory:",
+                        help="Arquivo SQLite de destino (padrão: :memory:, banco temporário)")
+    parser.add_argument("--method", choices=LOAD_METHODS, default="copy",
+                        help="copy: COPY FROM STDIN (PostgreSQL); insert: INSERTs em lote")
+    parser.add_argument("--batch-size", type=positive_int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Linhas por lote no método insert (padrão: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--schema", type=Path, nargs="?", const=project_root / "database" / "schema" / "schema.sql",
+                        help="Aplica o schema antes da carga (padrão: database/schema/schema.sql)")
+    parser.add_argument("--truncate", action="store_true", help="Apaga os dados das tabelas antes da carga")
+    parser.add_argument("--defer-constraints", action="store_true",
+                        help="Verifica as chaves estrangeiras só ao final da carga")
+    parser.add_argument("--rebuild-indexes", action="store_true",
+                        help="Remove os índices secundários durante a carga e os recria ao final")
+    parser.add_argument("--json-backend", choices=JSON_BACKENDS, default="auto",
+                        help="Parser dos JSONs (ver generate_sql_from_json.py)")
+    return parser.parse_args()
+
+def main():
+    """Função principal."""
+    args = parse_args()
+    
+    if not args.data_dir.exists():
+        print(f"❌ ERRO: Diretório de dados não encontrado: {args.data_dir}")
+        sys.exit(1)
+    
+    if args.target == "sqlite":
+        target = SqliteTarget(args.sqlite_db)
+    else:
+        target = PostgresTarget(args.host, args.port, args.database, args.user, args.password)
+    
+    success = load_seed_data(target, args.data_dir, args.method, args.batch_size, args.schema,
+                             args.truncate, args.defer_constraints, args.rebuild_indexes, args.json_backend)
+    sys.exit(0 if success else 1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
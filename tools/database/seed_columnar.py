@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Motor colunar do gerador de seeds (generate_sql_from_json.py --engine columnar).
+Cada arquivo JSON é convertido em arrays por coluna e as transformações são feitas
+sobre colunas inteiras: filtragem das colunas do schema, extração de gender,
+explosão das listas de relacionamento (type_ids, egg_group_ids, abilities) e escape.
+As linhas explodidas passam pelo mesmo JoinTableBuilder do motor por linha
+(deduplicação e ordenação). Usa NumPy quando instalado (repetição dos IDs nas tabelas
+de relacionamento e conversão de colunas inteiras em texto); sem ele, o caminho em
+Python puro é usado. A saída é idêntica à do motor por linha (RowEncoder).
+"""
+
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:  # Dependência opcional
+    numpy = None
+
+from generate_sql_from_json import (
+    COLUMN_ESCAPERS,
+    GENDER_COLUMNS,
+    TYPE_NAME_TO_ID,
+    JoinTableBuilder,
+    build_evolution_edge_table,
+    build_pokemon_card_table,
+    build_weakness_table,
+    compile_row_encoder,
+    join_table_rows,
+    load_type_chart,
+)
+from seed_schema import SchemaModel
+from seed_type_chart import TypeChart
+
+# Maior inteiro convertido pelo NumPy (int64); colunas com valores maiores usam str()
+INT64_MAX = 2 ** 63 - 1
+
+@dataclass
+class ColumnBatch:
+    """Linhas de uma tabela como arrays por coluna (mesma ordem e tipos do RowEncoder)."""
+    table_name: str
+    columns: List[str]
+    kinds: List[str]
+    values: List[Sequence[Any]]
+    
+    def __len__(self) -> int:
+        return len(self.values[0]) if self.values else 0
+    
+    @property
+    def columns_sql(self) -> str:
+        return ", ".join(self.columns)
+
+def repeat_values(values: Sequence[Any], counts: List[int]) -> List[Any]:
+    """Repete cada valor counts[i] vezes (numpy.repeat quando disponível)."""
+    if numpy is not None and values:
+        array = numpy.empty(len(values), dtype=object)
+        array[:] = values
+        return numpy.repeat(array, counts).tolist()
+    return [value for value, count in zip(values, counts) for _ in range(count)]
+
+def ints_to_str(values: Sequence[Any]) -> Optional[List[str]]:
+    """Converte uma coluna só de inteiros em texto de uma vez; None se houver outros tipos."""
+    if not all(value.__class__ is int for value in values):
+        return None
+    if numpy is not None and values and -INT64_MAX <= min(values) and max(values) <= INT64_MAX:
+        return numpy.array(values, dtype=numpy.int64).astype(str).tolist()
+    return list(map(str, values))
+
+def escape_column(values: Sequence[Any], kind: str, output_format: str) -> List[str]:
+    """
+    Escapa uma coluna inteira. Colunas homogêneas (só inteiros, só textos) usam
+    conversões em lote; as demais aplicam o escaper do tipo a cada valor.
+    """
+    if kind == "number":
+        converted = ints_to_str(values)
+        if converted is not None:
+            return converted
+    elif kind == "text" and all(value.__class__ is str for value in values):
+        if output_format == "copy":
+            return [value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+                    for value in values]
+        return ["'" + value.replace("'", "''").replace("\n", "\\n") + "'" for value in values]
+    escaper = COLUMN_ESCAPERS[kind][1 if output_format == "copy" else 0]
+    return list(map(escaper, values))
+
+def extract_columns(table_name: str, records: List[Dict[str, Any]], columns: List[str]) -> List[List[Any]]:
+    """Arrays das colunas da tabela principal, lidos coluna a coluna dos registros."""
+    values = []
+    genders = None
+    for column in columns:
+        if table_name == "evolution_chains" and column == "chain_data":
+            values.append([record.get('chain') or None for record in records])
+        elif table_name == "pokemons" and column in GENDER_COLUMNS:
+            if genders is None:
+                genders = [record.get('gender') for record in records]
+            key = GENDER_COLUMNS[column]
+            values.append([gender.get(key) if gender.__class__ is dict else None for gender in genders])
+        else:
+            values.append([record.get(column) for record in records])
+    return values
+
+def explode(records: List[Dict[str, Any]], field: str, keep: Callable[[Any], bool] = None,
+            id_field: str = 'id') -> Tuple[List[Any], List[Any]]:
+    """
+    Explode uma lista de cada registro: retorna (ids dos registros repetidos, itens achatados).
+    keep filtra os itens (ex.: apenas objetos).
+    """
+    lists = [record.get(field) or [] for record in records]
+    if keep is not None:
+        lists = [[item for item in items if keep(item)] for items in lists]
+    ids = repeat_values([record.get(id_field) for record in records], list(map(len, lists)))
+    return ids, list(chain.from_iterable(lists))
+
+def is_dict(item: Any) -> bool:
+    return isinstance(item, dict)
+
+def builder_batch(builder: JoinTableBuilder) -> ColumnBatch:
+    """Linhas deduplicadas e ordenadas de uma tabela de relacionamento, transpostas em colunas."""
+    encoder, rows = join_table_rows(builder)
+    values = [list(column) for column in zip(*rows)] if rows else [[] for _ in encoder.columns]
+    return ColumnBatch(encoder.table_name, encoder.columns, encoder.kinds, values)
+
+def pokemon_join_batches(records: List[Dict[str, Any]], schema: Optional[SchemaModel] = None) -> List[ColumnBatch]:
+    """Tabelas de relacionamento de pokemons: listas explodidas em colunas e reunidas pelo JoinTableBuilder."""
+    types = JoinTableBuilder("pokemon_types", schema)
+    types.add_rows(zip(*explode(records, 'type_ids')))
+    
+    abilities = JoinTableBuilder("pokemon_abilities", schema)
+    ability_pokemon_ids, ability_items = explode(records, 'abilities', is_dict)
+    abilities.add_rows(zip(ability_pokemon_ids, [ability.get('ability_id') for ability in ability_items],
+                           [ability.get('is_hidden', False) for ability in ability_items]))
+    
+    egg_groups = JoinTableBuilder("pokemon_egg_groups", schema)
+    egg_groups.add_rows(zip(*explode(records, 'egg_group_ids')))
+    return [builder_batch(builder) for builder in (types, abilities, egg_groups)]
+
+def weakness_batch(records: List[Dict[str, Any]], pokemon_records: Optional[List[Dict[str, Any]]] = None,
+                   schema: Optional[SchemaModel] = None, chart: Optional[TypeChart] = None) -> ColumnBatch:
+    """
+    pokemon_weaknesses. Com a matriz de efetividade, as fraquezas são calculadas de uma vez
+    para todos os pokémons (build_weakness_table, produto de matrizes); sem ela, vêm das
+    fraquezas embutidas em 09_pokemon.json e dos nomes de tipos de 10_weaknesses.json
+    (nomes desconhecidos são descartados).
+    """
+    if chart is not None and pokemon_records is not None:
+        return builder_batch(build_weakness_table(records, pokemon_records, schema, chart))
+    builder = JoinTableBuilder("pokemon_weaknesses", schema)
+    if pokemon_records:
+        weakness_pokemon_ids, weaknesses = explode(pokemon_records, 'weaknesses', is_dict)
+        builder.add_rows(zip(weakness_pokemon_ids, [weakness.get('type_id') for weakness in weaknesses],
+                             [weakness.get('multiplier') for weakness in weaknesses]))
+    pokemon_ids, names = explode(records, 'weaknesses', id_field='pokemon_id')
+    type_ids = [TYPE_NAME_TO_ID.get(name) for name in names]
+    builder.add_rows((pokemon_id, type_id, None) for pokemon_id, type_id in zip(pokemon_ids, type_ids) if type_id)
+    return builder_batch(builder)
+
+def main_batch(table_name: str, records: List[Dict[str, Any]],
+               schema: Optional[SchemaModel] = None) -> ColumnBatch:
+    """Tabela principal de um arquivo, com as colunas e tipos escolhidos pelo compile_row_encoder."""
+    encoder = compile_row_encoder(table_name, records, schema)
+    return ColumnBatch(table_name, encoder.columns, encoder.kinds,
+                       extract_columns(table_name, records, encoder.columns))
+
+def escaped_rows(batch: ColumnBatch, output_format: str, separator: str) -> List[str]:
+    """Linhas da tabela já escapadas e unidas pelo separador (', ' no SQL, TAB no COPY)."""
+    escaped = [escape_column(values, kind, output_format) for values, kind in zip(batch.values, batch.kinds)]
+    return list(map(separator.join, zip(*escaped)))
+
+def copy_statements(batch: ColumnBatch) -> Iterator[str]:
+    """Bloco COPY ... FROM stdin da tabela (nada se não houver linhas)."""
+    if not len(batch):
+        return
+    yield f"COPY {batch.table_name} ({batch.columns_sql}) FROM stdin;"
+    yield from escaped_rows(batch, "copy", "\t")
+    yield "\\."
+
+def batched_insert_statements(batch: ColumnBatch, batch_size: int) -> Iterator[str]:
+    """INSERTs multi-linha com até batch_size linhas por comando."""
+    rows = iter(escaped_rows(batch, "insert", ", "))
+    while True:
+        chunk = list(islice(rows, batch_size))
+        if not chunk:
+            return
+        values_str = ",\n".join(["(" + row + ")" for row in chunk])
+        yield f"INSERT INTO {batch.table_name} ({batch.columns_sql}) VALUES\n{values_str};"
+
+def single_insert_lines(batch: ColumnBatch) -> List[str]:
+    """Um INSERT por linha."""
+    prefix = f"INSERT INTO {batch.table_name} ({batch.columns_sql}) VALUES ("
+    return [prefix + row + ");" for row in escaped_rows(batch, "insert", ", ")]
+
+def render_columnar_sql(table_name: str, records: List[Dict[str, Any]], output_format: str,
+                        batch_size: int = 1, schema: Optional[SchemaModel] = None,
+                        related: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Iterator[str]:
+    """
+    Equivalente colunar de render_table_sql: mesmos comandos, na mesma ordem.
+    Os registros são materializados em memória (o motor precisa de todas as linhas de cada coluna).
+    """
+    if not isinstance(records, list):
+        records = list(records)
+    if not records:
+        return
+    
+    if table_name == "pokemon_weaknesses":
+        pokemon_records = (related or {}).get("09_pokemon.json")
+        if pokemon_records is not None and not isinstance(pokemon_records, list):
+            pokemon_records = list(pokemon_records)
+        batches = [weakness_batch(records, pokemon_records, schema, load_type_chart(related))]
+    else:
+        batches = [main_batch(table_name, records, schema)]
+        if table_name == "pokemons":
+            batches += pokemon_join_batches(records, schema)
+            # Cadeias evolutivas são árvores: achatadas pelo mesmo percurso do motor por linha
+            edges = build_evolution_edge_table((related or {}).get("08_evolution_chains.json"), records, schema)
+            # Modelo de leitura: objetos JSON aninhados por linha, montado pelo mesmo código do motor por linha
+            cards = build_pokemon_card_table(records, related, schema)
+            batches.extend(builder_batch(builder) for builder in (edges, cards) if builder is not None)
+    
+    for batch in batches:
+        if output_format == "copy":
+            yield from copy_statements(batch)
+        elif batch_size > 1:
+            yield from batched_insert_statements(batch, batch_size)
+        else:
+            yield from single_insert_lines(batch)
\ No newline at end of file
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Leitura dos arquivos JSON de dados com backends intercambiáveis:
+- orjson: parser rápido, usado quando o pacote está instalado
+- json: biblioteca padrão (fallback)
+- stream: parser incremental que entrega os registros do array um a um,
+  sem materializar o arquivo inteiro em memória
+Erros de sintaxe são reportados como json.JSONDecodeError, com linha, coluna e posição
+relativas ao arquivo inteiro em todos os backends.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # Dependência opcional
+    orjson = None
+
+JSON_BACKENDS = ["auto", "orjson", "json", "stream"]
+
+# No modo auto, arquivos acima deste tamanho são lidos em streaming
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Tamanho dos blocos lidos pelo parser incremental
+STREAM_CHUNK_SIZE = 64 * 1024
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Caracteres que ainda podem continuar um número JSON (ex.: "1." + "5e10")
+NUMBER_TAIL = re.compile(r'[0-9eE.+\-]*')
+
+def resolve_backend(backend: str, file_path: Optional[Path] = None) -> str:
+    """
+    Resolve o backend efetivo. 'auto' usa orjson quando instalado (senão json)
+    e stream para arquivos maiores que STREAM_THRESHOLD_BYTES.
+    """
+    if backend == "auto":
+        if file_path is not None and file_path.stat().st_size > STREAM_THRESHOLD_BYTES:
+            return "stream"
+        return "orjson" if orjson is not None else "json"
+    if backend == "orjson" and orjson is None:
+        return "json"
+    return backend
+
+def shifted_decode_error(error: json.JSONDecodeError, offset: int, line: int,
+                         column: int) -> json.JSONDecodeError:
+    """Converte um erro relativo ao buffer corrente em um erro relativo ao arquivo."""
+    lineno = line + error.lineno - 1
+    colno = error.colno + (column - 1 if error.lineno == 1 else 0)
+    pos = offset + error.pos
+    shifted = json.JSONDecodeError(error.msg, error.doc, error.pos)
+    shifted.pos, shifted.lineno, shifted.colno = pos, lineno, colno
+    shifted.args = (f"{error.msg}: line {lineno} column {colno} (char {pos})",)
+    return shifted
+
+class JsonArrayReader:
+    """
+    Lê um array JSON de nível superior em blocos, decodificando um elemento por vez
+    com json.JSONDecoder.raw_decode. Só o elemento corrente e o bloco lido ficam em memória.
+    Se o valor de nível superior não for um array, ele é entregue como único registro.
+    """
+    
+    def __init__(self, file_path: Path, chunk_size: int = STREAM_CHUNK_SIZE):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.wrapped = False
+        self._file = None
+        self._buffer = ""
+        self._eof = False
+        # Posição (caractere, linha e coluna) do início do buffer no arquivo
+        self._offset = 0
+        self._line = 1
+        self._column = 1
+    
+    def _read_more(self) -> bool:
+        """Acrescenta um bloco ao buffer; retorna False no fim do arquivo."""
+        chunk = self._file.read(self.chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer += chunk
+        return True
+    
+    def _discard(self, index: int) -> int:
+        """Descarta o trecho já consumido do buffer e retorna o novo índice (0)."""
+        consumed = self._buffer[:index]
+        newlines = consumed.count("\n")
+        if newlines:
+            self._line += newlines
+            self._column = index - consumed.rfind("\n")
+        else:
+            self._column += index
+        self._offset += index
+        self._buffer = self._buffer[index:]
+        return 0
+    
+    def _error(self, message: str, index: int) -> json.JSONDecodeError:
+        return shifted_decode_error(json.JSONDecodeError(message, self._buffer, index),
+                                    self._offset, self._line, self._column)
+    
+    def _skip_whitespace(self, index: int) -> int:
+        """Avança sobre espaços, lendo mais blocos se necessário."""
+        while True:
+            index = WHITESPACE.match(self._buffer, index).end()
+            if index < len(self._buffer) or not self._read_more():
+                return index
+    
+    def _decode_value(self, index: int):
+        """Decodifica o valor que começa em index, lendo mais blocos enquanto ele estiver incompleto."""
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self._buffer, index)
+            except json.JSONDecodeError as e:
+                if self._read_more():
+                    continue
+                raise shifted_decode_error(e, self._offset, self._line, self._column) from None
+            # Um número no fim do buffer pode continuar no próximo bloco
+            if (not self._eof and value.__class__ in (int, float)
+                    and NUMBER_TAIL.match(self._buffer, end).end() == len(self._buffer)
+                    and self._read_more()):
+                continue
+            return value, end
+    
+    def __iter__(self) -> Iterator[Any]:
+        with open(self.file_path, 'r', encoding='utf-8') as self._file:
+            index = self._skip_whitespace(0)
+            if not self._buffer.startswith("[", index):
+                # Valor de nível superior que não é array: entregue como registro único
+                self.wrapped = True
+                value, end = self._decode_value(index)
+                if self._skip_whitespace(end) < len(self._buffer):
+                    raise self._error("Extra data", self._skip_whitespace(end))
+                yield value
+                return
+            
+            index = self._skip_whitespace(index + 1)
+            if self._buffer.startswith("]", index):
+                index += 1
+            else:
+                while True:
+                    value, index = self._decode_value(index)
+                    yield value
+                    if index > self.chunk_size:
+                        index = self._discard(index)
+                    index = self._skip_whitespace(index)
+                    if self._buffer.startswith(",", index):
+                        index = self._skip_whitespace(index + 1)
+                    elif self._buffer.startswith("]", index):
+                        index += 1
+                        break
+                    else:
+                        raise self._error("Expecting ',' delimiter", index)
+            
+            index = self._skip_whitespace(index)
+            if index < len(self._buffer):
+                raise self._error("Extra data", index)
+
+class JsonArrayFile:
+    """
+    Registros de um arquivo JSON lidos sob demanda: cada iteração relê o arquivo
+    em streaming. O arquivo é validado (e os registros contados) na criação,
+    então erros de sintaxe aparecem antes de qualquer SQL ser gerado.
+    """
+    
+    def __init__(self, file_path: Path):
+        self.file_path = file_path
+        reader = JsonArrayReader(file_path)
+        self._count = sum(1 for _ in reader)
+        self.wrapped = reader.wrapped
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __iter__(self) -> Iterator[Any]:
+        return iter(JsonArrayReader(self.file_path))
+
+def load_json_data(file_path: Path, backend: str = "auto"):
+    """
+    Lê um arquivo JSON com o backend escolhido.
+    Retorna o valor decodificado (orjson/json) ou um JsonArrayFile (stream).
+    """
+    backend = resolve_backend(backend, file_path)
+    if backend == "stream":
+        return JsonArrayFile(file_path)
+    if backend == "orjson":
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def load_json_records(file_path: Path, backend: str = "auto") -> List[Any]:
+    """
+    Registros de um arquivo JSON sempre como lista em memória (um valor que não é
+    array vira lista de um item). Erros de leitura e de sintaxe são propagados.
+    """
+    data = load_json_data(file_path, backend)
+    if isinstance(data, JsonArrayFile):
+        return list(data)
+    return data if isinstance(data, list) else [data]
\ No newline at end of file
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Instrumentação de desempenho para as ferramentas de banco de dados.
+Mede tempo de parede, tempo de CPU e (opcionalmente) alocações por tabela e por etapa,
+com tempos exclusivos: o tempo de uma etapa aninhada não é contado na etapa externa.
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+# Ordem de exibição das etapas conhecidas (etapas extras aparecem depois)
+STAGE_ORDER = ["parse", "extract", "escape", "assemble", "write"]
+
+class StageTimer:
+    """Acumula métricas por (tabela, etapa) usando uma pilha de etapas ativas."""
+    
+    def __init__(self, track_allocations: bool = False):
+        self.track_allocations = track_allocations
+        self.table = "-"
+        self.stats: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self._tables: List[str] = []
+        self._stack: List[Tuple[str, str]] = []
+        self._wall_mark = 0.0
+        self._cpu_mark = 0.0
+        self._alloc_mark = 0
+    
+    def start(self) -> None:
+        """Inicia a coleta (e o tracemalloc, se as alocações forem medidas)."""
+        if self.track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._wall_mark = time.perf_counter()
+        self._cpu_mark = time.process_time()
+    
+    def stop(self) -> None:
+        """Encerra a coleta."""
+        if self.track_allocations and tracemalloc.is_tracing():
+            tracemalloc.stop()
+    
+    def set_table(self, table_name: str) -> None:
+        """Define a tabela à qual as próximas etapas serão atribuídas."""
+        self.table = table_name
+        if table_name not in self._tables:
+            self._tables.append(table_name)
+    
+    def _entry(self, key: Tuple[str, str]) -> Dict[str, float]:
+        if key not in self.stats:
+            self.stats[key] = {"wall_seconds": 0.0, "cpu_seconds": 0.0, "peak_alloc_bytes": 0, "calls": 0}
+        return self.stats[key]
+    
+    def _charge(self) -> None:
+        """Atribui o intervalo desde a última marca à etapa no topo da pilha."""
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        if self._stack:
+            entry = self._entry(self._stack[-1])
+            entry["wall_seconds"] += wall - self._wall_mark
+            entry["cpu_seconds"] += cpu - self._cpu_mark
+            if self.track_allocations:
+                current, peak = tracemalloc.get_traced_memory()
+                entry["peak_alloc_bytes"] = max(entry["peak_alloc_bytes"], peak - self._alloc_mark)
+                tracemalloc.reset_peak()
+                self._alloc_mark = current
+        elif self.track_allocations:
+            self._alloc_mark = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self._wall_mark = wall
+        self._cpu_mark = cpu
+    
+    def enter(self, stage: str) -> None:
+        self._charge()
+        key = (self.table, stage)
+        self._entry(key)["calls"] += 1
+        self._stack.append(key)
+    
+    def exit(self) -> None:
+        self._charge()
+        self._stack.pop()
+    
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """Mede um bloco como uma etapa."""
+        self.enter(stage)
+        try:
+            yield
+        finally:
+            self.exit()
+    
+    def wrap(self, stage: str, func: Callable) -> Callable:
+        """Retorna func medida como a etapa `stage` a cada chamada."""
+        @wraps(func)
+        def timed(*args, **kwargs):
+            self.enter(stage)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.exit()
+        return timed
+    
+    @contextmanager
+    def patched(self, patches: List[Tuple[Any, str, str]]) -> Iterator["StageTimer"]:
+        """
+        Substitui temporariamente atributos (owner, atributo, etapa) por versões medidas.
+        Sem o timer ativo, o código instrumentado não tem nenhum custo extra.
+        """
+        originals = [(owner, attribute, getattr(owner, attribute)) for owner, attribute, _ in patches]
+        try:
+            for (owner, attribute, stage), (_, _, original) in zip(patches, originals):
+                setattr(owner, attribute, self.wrap(stage, original))
+            self.start()
+            yield self
+        finally:
+            self.stop()
+            for owner, attribute, original in originals:
+                setattr(owner, attribute, original)
+    
+    def _ordered_keys(self) -> List[Tuple[str, str]]:
+        def sort_key(key: Tuple[str, str]):
+            table, stage = key
+            table_index = self._tables.index(table) if table in self._tables else -1
+            stage_index = STAGE_ORDER.index(stage) if stage in STAGE_ORDER else len(STAGE_ORDER)
+            return table_index, stage_index, stage
+        return sorted(self.stats, key=sort_key)
+    
+    def totals_by_stage(self) -> Dict[str, Dict[str, float]]:
+        """Soma as métricas de todas as tabelas por etapa."""
+        totals: Dict[str, Dict[str, float]] = {}
+        for (_, stage), entry in self.stats.items():
+            total = totals.setdefault(stage, {"wall_seconds": 0.0, "cpu_seconds": 0.0,
+                                              "peak_alloc_bytes": 0, "calls": 0})
+            total["wall_seconds"] += entry["wall_seconds"]
+            total["cpu_seconds"] += entry["cpu_seconds"]
+            total["peak_alloc_bytes"] = max(total["peak_alloc_bytes"], entry["peak_alloc_bytes"])
+            total["calls"] += entry["calls"]
+        return dict(sorted(totals.items(), key=lambda item: (
+            STAGE_ORDER.index(item[0]) if item[0] in STAGE_ORDER else len(STAGE_ORDER), item[0])))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Representação serializável das métricas."""
+        tables: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for table, stage in self._ordered_keys():
+            tables.setdefault(table, {})[stage] = dict(self.stats[(table, stage)])
+        return {
+            "track_allocations": self.track_allocations,
+            "tables": tables,
+            "totals": self.totals_by_stage(),
+        }
+    
+    def dump_json(self, output_file: Path) -> None:
+        """Grava as métricas em JSON."""
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+    
+    def print_report(self) -> None:
+        """Imprime as métricas por tabela/etapa e os totais por etapa."""
+        if not self.stats:
+            print("\n⏱️  Nenhuma etapa medida (nada foi regenerado).")
+            return
+        
+        alloc_header = f" | {'Alloc pico (KB)':>15}" if self.track_allocations else ""
+        width = 78 + (18 if self.track_allocations else 0)
+        
+        def row(table: str, stage: str, entry: Dict[str, float]) -> str:
+            line = (f"{table:<20} | {stage:<9} | {entry['wall_seconds'] * 1000:>10.2f} | "
+                    f"{entry['cpu_seconds'] * 1000:>10.2f} | {int(entry['calls']):>10}")
+            if self.track_allocations:
+                line += f" | {entry['peak_alloc_bytes'] / 1024:>15.1f}"
+            return line
+        
+        print("\n⏱️  TEMPOS POR TABELA E ETAPA:")
+        print("-" * width)
+        print(f"{'Tabela':<20} | {'Etapa':<9} | {'Wall (ms)':>10} | {'CPU (ms)':>10} | {'Chamadas':>10}{alloc_header}")
+        print("-" * width)
+        for table, stage in self._ordered_keys():
+            print(row(table, stage, self.stats[(table, stage)]))
+        print("-" * width)
+        for stage, entry in self.totals_by_stage().items():
+            print(row("TOTAL", stage, entry))
+        print("-" * width)
+        if self.track_allocations:
+            print("   💡 Com --track-allocations os tempos incluem o overhead do tracemalloc")
+
+def run_with_cprofile(func: Callable[[], Any], output_file: Path, top: int = 20) -> Any:
+    """Executa func sob cProfile, grava o arquivo pstats e imprime as funções mais custosas."""
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(output_file))
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(top)
+        print(f"\n🔬 PERFIL cProfile ({top} funções por tempo acumulado):")
+        print(summary.getvalue().rstrip())
+        print(f"💾 Perfil salvo em: {output_file} (abra com: python3 -m pstats {output_file})")
\ No newline at end of file
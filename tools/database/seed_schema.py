@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Modelo das tabelas do schema.sql (colunas, tipos, colunas JSON, PKs e FKs),
+usado pelas ferramentas de seed no lugar de listas de campos mantidas à mão.
+O schema é lido uma vez e o modelo fica em cache em disco, indexado pelo
+SHA-256 do arquivo: enquanto o schema não muda, o parse não é refeito.
+"""
+
+import hashlib
+import heapq
+import json
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent  # Sobe para raiz do projeto
+
+DEFAULT_SCHEMA_FILE = PROJECT_ROOT / "database" / "schema" / "schema.sql"
+DEFAULT_CACHE_DIR = PROJECT_ROOT / "build" / "cache"
+
+# Versão do formato do modelo (mudanças no parser invalidam o cache)
+SCHEMA_MODEL_VERSION = 2
+
+# Tipos SQL -> tipo de escaper das ferramentas de seed (text, number, bool, json)
+TYPE_KINDS = {
+    "json": "json", "jsonb": "json",
+    "boolean": "bool", "bool": "bool",
+    "smallint": "number", "integer": "number", "int": "number", "bigint": "number",
+    "int2": "number", "int4": "number", "int8": "number",
+    "smallserial": "number", "serial": "number", "bigserial": "number",
+    "numeric": "number", "decimal": "number", "real": "number", "double": "number",
+    "float": "number", "float4": "number", "float8": "number",
+}
+
+SERIAL_TYPES = {"smallserial", "serial", "bigserial"}
+
+CREATE_TABLE = re.compile(
+    r"CREATE\s+(?:UNLOGGED\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?([\w.\"]+)\s*\(", re.IGNORECASE)
+
+# Restrição de tabela (palavra inteira: colunas como checksum ou unique_code não são restrições)
+TABLE_CONSTRAINT = re.compile(r"(PRIMARY\s+KEY|UNIQUE|FOREIGN\s+KEY|CHECK|EXCLUDE)\b", re.IGNORECASE)
+
+# Início das restrições de uma definição de coluna (o que vem antes é o tipo)
+COLUMN_CONSTRAINT = re.compile(
+    r"\b(?:PRIMARY\s+KEY|NOT\s+NULL|NULL|UNIQUE|DEFAULT|REFERENCES|CHECK|CONSTRAINT|GENERATED|COLLATE)\b",
+    re.IGNORECASE)
+
+REFERENCES = re.compile(r"REFERENCES\s+([\w.\"]+)\s*(?:\(([^)]*)\))?", re.IGNORECASE)
+
+@dataclass
+class Column:
+    name: str
+    sql_type: str
+    not_null: bool = False
+    has_default: bool = False
+    
+    @property
+    def kind(self) -> str:
+        """Tipo de escaper da coluna: text, number, bool ou json."""
+        return TYPE_KINDS.get(base_type(self.sql_type), "text")
+    
+    @property
+    def required(self) -> bool:
+        """Coluna que precisa de valor no INSERT (NOT NULL sem DEFAULT nem SERIAL)."""
+        return self.not_null and not self.has_default
+
+@dataclass
+class ForeignKey:
+    columns: List[str]
+    ref_table: str
+    ref_columns: List[str]
+
+@dataclass
+class Table:
+    name: str
+    columns: List[Column] = field(default_factory=list)
+    primary_key: List[str] = field(default_factory=list)
+    unique: List[List[str]] = field(default_factory=list)
+    foreign_keys: List[ForeignKey] = field(default_factory=list)
+    
+    @property
+    def column_names(self) -> List[str]:
+        return [column.name for column in self.columns]
+    
+    @property
+    def json_columns(self) -> List[str]:
+        return [column.name for column in self.columns if column.kind == "json"]
+    
+    def column(self, name: str) -> Optional[Column]:
+        for column in self.columns:
+            if column.name == name:
+                return column
+        return None
+    
+    @property
+    def dependencies(self) -> List[str]:
+        """Tabelas referenciadas pelas FKs (sem autorreferências), na ordem de declaração."""
+        return list(dict.fromkeys(fk.ref_table for fk in self.foreign_keys if fk.ref_table != self.name))
+
+@dataclass
+class SchemaModel:
+    source_sha256: str
+    tables: Dict[str, Table]
+    
+    def load_plan(self, table_names: Optional[List[str]] = None) -> List[str]:
+        """
+        Ordem de carga: ordenação topológica das tabelas pelas FKs (referenciadas primeiro).
+        Entre tabelas sem dependência pendente, vale a ordem de declaração no schema,
+        então o plano é determinístico. Levanta ValueError se houver ciclo.
+        """
+        names = [name for name in self.tables if table_names is None or name in table_names]
+        position = {name: index for index, name in enumerate(names)}
+        pending = {name: {dep for dep in self.tables[name].dependencies if dep in position} for name in names}
+        dependents: Dict[str, List[str]] = {name: [] for name in names}
+        for name, deps in pending.items():
+            for dep in deps:
+                dependents[dep].append(name)
+        
+        ready = [(position[name], name) for name, deps in pending.items() if not deps]
+        heapq.heapify(ready)
+        plan = []
+        while ready:
+            _, name = heapq.heappop(ready)
+            plan.append(name)
+            for dependent in dependents[name]:
+                pending[dependent].discard(name)
+                if not pending[dependent]:
+                    heapq.heappush(ready, (position[dependent], dependent))
+        
+        if len(plan) < len(names):
+            cycle = [name for name in names if name not in plan]
+            raise ValueError(f"Ciclo de chaves estrangeiras entre as tabelas: {', '.join(cycle)}")
+        return plan
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {"version": SCHEMA_MODEL_VERSION, "source_sha256": self.source_sha256,
+                "tables": [asdict(table) for table in self.tables.values()]}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SchemaModel":
+        tables = {}
+        for entry in data["tables"]:
+            tables[entry["name"]] = Table(
+                name=entry["name"],
+                columns=[Column(**column) for column in entry["columns"]],
+                primary_key=entry["primary_key"],
+                unique=entry["unique"],
+                foreign_keys=[ForeignKey(**fk) for fk in entry["foreign_keys"]],
+            )
+        return cls(data["source_sha256"], tables)
+
+def base_type(sql_type: str) -> str:
+    """Nome base de um tipo SQL, sem parâmetros: 'NUMERIC(5, 2)' -> 'numeric'."""
+    match = re.match(r"\s*([A-Za-z0-9_]+)", sql_type)
+    return match.group(1).lower() if match else ""
+
+def identifier(name: str) -> str:
+    """Nome sem aspas e sem prefixo de schema: 'public."Tabela"' -> 'Tabela'."""
+    return name.split(".")[-1].strip('"')
+
+def identifier_list(text: str) -> List[str]:
+    return [identifier(part.strip()) for part in text.split(",") if part.strip()]
+
+def strip_comments(sql: str) -> str:
+    sql = re.sub(r"/\*.*?\*/", " ", sql, flags=re.DOTALL)
+    return re.sub(r"--[^\n]*", "", sql)
+
+def closing_paren(text: str, start: int) -> int:
+    """Posição do ')' que fecha o '(' em text[start - 1]."""
+    depth = 1
+    for index in range(start, len(text)):
+        if text[index] == "(":
+            depth += 1
+        elif text[index] == ")":
+            depth -= 1
+            if depth == 0:
+                return index
+    raise ValueError("CREATE TABLE sem ')' de fechamento")
+
+def split_top_level(body: str) -> List[str]:
+    """Separa as definições de um CREATE TABLE pelas vírgulas fora de parênteses."""
+    parts, depth, start = [], 0, 0
+    for index, char in enumerate(body):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(body[start:index])
+            start = index + 1
+    parts.append(body[start:])
+    return [" ".join(part.split()) for part in parts if part.strip()]
+
+def parse_table_constraint(table: Table, definition: str) -> bool:
+    """Lê PRIMARY KEY/UNIQUE/FOREIGN KEY de tabela; retorna False se a definição é uma coluna."""
+    definition = re.sub(r"^CONSTRAINT\s+[\w\"]+\s+", "", definition, flags=re.IGNORECASE)
+    match = TABLE_CONSTRAINT.match(definition)
+    if match is None:
+        return False
+    keyword = " ".join(match.group(1).upper().split())
+    if keyword == "PRIMARY KEY":
+        table.primary_key = identifier_list(definition[definition.index("(") + 1:definition.index(")")])
+    elif keyword == "UNIQUE":
+        table.unique.append(identifier_list(definition[definition.index("(") + 1:definition.index(")")]))
+    elif keyword == "FOREIGN KEY":
+        columns = identifier_list(definition[definition.index("(") + 1:definition.index(")")])
+        reference = REFERENCES.search(definition)
+        table.foreign_keys.append(ForeignKey(columns, identifier(reference.group(1)),
+                                             identifier_list(reference.group(2) or "")))
+    return True
+
+def parse_column(table: Table, definition: str) -> None:
+    """Lê uma definição de coluna e as restrições declaradas junto dela."""
+    name, _, rest = definition.partition(" ")
+    constraint = COLUMN_CONSTRAINT.search(rest)
+    sql_type = (rest[:constraint.start()] if constraint else rest).strip()
+    constraints = rest[constraint.start():].upper() if constraint else ""
+    column = Column(
+        name=identifier(name),
+        sql_type=sql_type,
+        not_null="NOT NULL" in constraints or "PRIMARY KEY" in constraints,
+        has_default=("DEFAULT" in constraints or "GENERATED" in constraints
+                     or base_type(sql_type) in SERIAL_TYPES),
+    )
+    if base_type(sql_type) in SERIAL_TYPES:
+        column.not_null = True
+    table.columns.append(column)
+    
+    if "PRIMARY KEY" in constraints:
+        table.primary_key = [column.name]
+    elif re.search(r"\bUNIQUE\b", constraints):
+        table.unique.append([column.name])
+    reference = REFERENCES.search(rest)
+    if reference:
+        table.foreign_keys.append(ForeignKey([column.name], identifier(reference.group(1)),
+                                             identifier_list(reference.group(2) or "")))
+
+def parse_schema(sql: str, source_sha256: str = "") -> SchemaModel:
+    """Lê os CREATE TABLE de um script SQL e monta o modelo das tabelas."""
+    sql = strip_comments(sql)
+    tables: Dict[str, Table] = {}
+    for match in CREATE_TABLE.finditer(sql):
+        end = closing_paren(sql, match.end())
+        table = Table(identifier(match.group(1)))
+        for definition in split_top_level(sql[match.end():end]):
+            if not parse_table_constraint(table, definition):
+                parse_column(table, definition)
+        tables[table.name] = table
+    
+    for table in tables.values():
+        # Colunas de PK são NOT NULL mesmo quando a PK é declarada no fim da tabela
+        for column in table.columns:
+            if column.name in table.primary_key:
+                column.not_null = True
+        # FKs sem colunas explícitas referenciam a PK da tabela de destino
+        for fk in table.foreign_keys:
+            if not fk.ref_columns and fk.ref_table in tables:
+                fk.ref_columns = list(tables[fk.ref_table].primary_key)
+    return SchemaModel(source_sha256, tables)
+
+# Modelos já carregados neste processo: (arquivo, sha256) -> modelo
+_loaded_models: Dict[Tuple[str, str], SchemaModel] = {}
+
+def load_schema_model(schema_file: Path = DEFAULT_SCHEMA_FILE,
+                      cache_dir: Optional[Path] = DEFAULT_CACHE_DIR) -> SchemaModel:
+    """
+    Retorna o modelo do schema, lendo do cache em disco quando o SHA-256 do arquivo
+    já foi processado. Sem cache_dir, o schema é sempre lido (só a memória do processo é usada).
+    """
+    content = schema_file.read_bytes()
+    source_sha256 = hashlib.sha256(content).hexdigest()
+    key = (str(schema_file.resolve()), source_sha256)
+    if key in _loaded_models:
+        return _loaded_models[key]
+    
+    cache_file = cache_dir / f"schema-{source_sha256[:16]}-v{SCHEMA_MODEL_VERSION}.json" if cache_dir else None
+    model = None
+    if cache_file and cache_file.exists():
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == SCHEMA_MODEL_VERSION and data.get("source_sha256") == source_sha256:
+                model = SchemaModel.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            model = None
+    
+    if model is None:
+        model = parse_schema(content.decode('utf-8'), source_sha256)
+        if cache_file:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(model.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(temp_file, cache_file)
+            except OSError:
+                pass  # Sem cache em disco (ex.: diretório somente leitura); o modelo segue válido
+    
+    _loaded_models[key] = model
+    return model
\ No newline at end of file
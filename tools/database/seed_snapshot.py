@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Snapshot binário do dataset (data/json) já lido e normalizado, compartilhado pelas
+ferramentas de seed (gerador, validador dos JSONs...). Evita repetir o json.load e
+a normalização a cada comando encadeado no Makefile.
+
+Formato (um arquivo, aberto com mmap):
+- cabeçalho: MAGIC, tamanho e JSON com a versão, as fontes (SHA-256, tamanho e mtime de
+  cada JSON) e a posição de cada seção
+- records:<arquivo>: registros do arquivo em marshal, com strings repetidas internadas
+O snapshot é invalidado quando o hash de algum JSON muda (ou quando muda o Python).
+No diretório padrão (build/cache) ficam só os MAX_CACHED_SNAPSHOTS usados mais recentemente.
+"""
+
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from generate_sql_from_json import FILE_TO_TABLE_MAPPING, file_sha256
+from seed_json import load_json_records
+from seed_schema import PROJECT_ROOT
+
+SNAPSHOT_MAGIC = b"PKDXSNAP"
+SNAPSHOT_VERSION = 4
+DEFAULT_SNAPSHOT_DIR = PROJECT_ROOT / "build" / "cache"
+
+# Snapshots mantidos no diretório padrão (um por diretório de dados; os mais antigos são removidos)
+MAX_CACHED_SNAPSHOTS = 4
+
+def python_tag() -> str:
+    """O formato do marshal depende da versão do Python."""
+    return f"{sys.implementation.name}-{sys.version_info[0]}.{sys.version_info[1]}-marshal{marshal.version}"
+
+def snapshot_path_for(data_dir: Path, snapshot_dir: Path = DEFAULT_SNAPSHOT_DIR) -> Path:
+    """Um snapshot por diretório de dados."""
+    digest = hashlib.sha256(str(data_dir.resolve()).encode('utf-8')).hexdigest()[:12]
+    return snapshot_dir / f"dataset-{digest}.snapshot"
+
+def intern_strings(value: Any, pool: Dict[str, str]) -> Any:
+    """Substitui strings iguais por uma única instância (o marshal grava as repetições como referência)."""
+    if value.__class__ is str:
+        return pool.setdefault(value, value)
+    if value.__class__ is dict:
+        return {pool.setdefault(key, key) if key.__class__ is str else key: intern_strings(item, pool)
+                for key, item in value.items()}
+    if value.__class__ is list:
+        return [intern_strings(item, pool) for item in value]
+    return value
+
+def source_entry(file_path: Path) -> Dict[str, Any]:
+    stat = file_path.stat()
+    return {"sha256": file_sha256(file_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+def build_snapshot(data_dir: Path, snapshot_file: Path, json_backend: str = "auto") -> Path:
+    """
+    Lê os JSONs uma vez e grava o snapshot (de forma atômica).
+    Erros de leitura (ex.: JSON inválido) são propagados: nada é gravado.
+    """
+    sections: List[Tuple[str, bytes, Dict[str, Any]]] = []
+    sources: Dict[str, Dict[str, Any]] = {}
+    pool: Dict[str, str] = {}
+    
+    for file_name in FILE_TO_TABLE_MAPPING:
+        file_path = data_dir / file_name
+        if not file_path.exists():
+            continue
+        sources[file_name] = source_entry(file_path)
+        records = intern_strings(load_json_records(file_path, json_backend), pool)
+        sections.append((f"records:{file_name}", marshal.dumps(records), {"count": len(records)}))
+    
+    # Cabeçalho com as posições das seções, calculadas antes de escrever
+    index: Dict[str, Dict[str, Any]] = {}
+    header = {"version": SNAPSHOT_VERSION, "python": python_tag(),
+              "data_dir": str(data_dir.resolve()), "sources": sources, "sections": index}
+    header_bytes = b""
+    while True:  # As posições mudam o tamanho do cabeçalho; estabiliza em poucas passadas
+        offset = len(SNAPSHOT_MAGIC) + 8 + len(header_bytes)
+        for name, data, meta in sections:
+            index[name] = dict(meta, offset=offset, length=len(data))
+            offset += len(data)
+        new_header = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+        stable = len(new_header) == len(header_bytes)
+        header_bytes = new_header
+        if stable:
+            break
+    
+    snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = snapshot_file.with_name(f"{snapshot_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_file, 'wb') as f:
+            f.write(SNAPSHOT_MAGIC + struct.pack("<Q", len(header_bytes)) + header_bytes)
+            for _, data, _ in sections:
+                f.write(data)
+        os.replace(temp_file, snapshot_file)
+    finally:
+        temp_file.unlink(missing_ok=True)
+    return snapshot_file
+
+def touch_snapshot(snapshot_file: Path) -> None:
+    """Marca o snapshot como usado agora (o mtime ordena a limpeza do diretório)."""
+    try:
+        os.utime(snapshot_file)
+    except OSError:
+        pass
+
+def prune_snapshots(snapshot_dir: Path, keep: int = MAX_CACHED_SNAPSHOTS) -> None:
+    """Remove os snapshots do diretório além dos keep usados mais recentemente (mtime)."""
+    snapshots = []
+    for snapshot_file in snapshot_dir.glob("dataset-*.snapshot"):
+        try:
+            snapshots.append((snapshot_file.stat().st_mtime_ns, snapshot_file))
+        except OSError:
+            continue
+    for _, snapshot_file in sorted(snapshots, reverse=True)[keep:]:
+        snapshot_file.unlink(missing_ok=True)
+
+class DatasetSnapshot:
+    """
+    Snapshot aberto com mmap. Os registros de cada arquivo são decodificados só quando
+    pedidos (e mantidos).
+    """
+    
+    def __init__(self, snapshot_file: Path):
+        self.snapshot_file = snapshot_file
+        self._records: Dict[str, List[Dict[str, Any]]] = {}
+        self._file = open(snapshot_file, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        if bytes(self._view[:len(SNAPSHOT_MAGIC)]) != SNAPSHOT_MAGIC:
+            self.close()
+            raise ValueError(f"{snapshot_file} não é um snapshot do dataset")
+        header_start = len(SNAPSHOT_MAGIC) + 8
+        (header_length,) = struct.unpack("<Q", self._view[len(SNAPSHOT_MAGIC):header_start])
+        self.header = json.loads(bytes(self._view[header_start:header_start + header_length]))
+    
+    # Processos do pool recebem o caminho e reabrem o snapshot
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"snapshot_file": self.snapshot_file}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["snapshot_file"])
+    
+    def close(self) -> None:
+        self._records.clear()
+        try:
+            self._view.release()
+            self._mmap.close()
+        except BufferError:
+            pass  # Ainda há views em uso; o mmap é fechado quando elas forem liberadas
+        self._file.close()
+    
+    @property
+    def sources(self) -> Dict[str, Dict[str, Any]]:
+        return self.header["sources"]
+    
+    def is_compatible(self) -> bool:
+        """Gerado com a mesma versão do formato e do Python (o marshal depende dela)."""
+        return self.header.get("version") == SNAPSHOT_VERSION and self.header.get("python") == python_tag()
+    
+    def is_current(self, data_dir: Path) -> bool:
+        """Confere versão, Python e fontes (tamanho/mtime iguais dispensam recalcular o hash)."""
+        if not self.is_compatible():
+            return False
+        present = [file_name for file_name in FILE_TO_TABLE_MAPPING if (data_dir / file_name).exists()]
+        if sorted(present) != sorted(self.sources):
+            return False
+        for file_name, entry in self.sources.items():
+            stat = (data_dir / file_name).stat()
+            if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+                continue
+            if stat.st_size != entry["size"] or file_sha256(data_dir / file_name) != entry["sha256"]:
+                return False
+        return True
+    
+    def _section(self, name: str) -> Optional[memoryview]:
+        entry = self.header["sections"].get(name)
+        if entry is None:
+            return None
+        return self._view[entry["offset"]:entry["offset"] + entry["length"]]
+    
+    def records(self, file_name: str) -> Optional[List[Dict[str, Any]]]:
+        """Registros de um arquivo (None se o arquivo não existia ao gerar o snapshot)."""
+        if file_name not in self._records:
+            section = self._section(f"records:{file_name}")
+            if section is None:
+                return None
+            self._records[file_name] = marshal.loads(section)
+        return self._records[file_name]
+
+def open_snapshot(data_dir: Path, snapshot_file: Optional[Path] = None,
+                  json_backend: str = "auto") -> DatasetSnapshot:
+    """
+    Abre o snapshot do diretório de dados, (re)construindo-o se não existir ou estiver desatualizado.
+    No diretório padrão, o uso atualiza o mtime do snapshot e os menos usados são removidos.
+    """
+    cached = snapshot_file is None
+    snapshot_file = snapshot_file or snapshot_path_for(data_dir)
+    if snapshot_file.exists():
+        try:
+            snapshot = DatasetSnapshot(snapshot_file)
+            if snapshot.is_current(data_dir):
+                if cached:
+                    touch_snapshot(snapshot_file)
+                return snapshot
+            snapshot.close()
+        except (OSError, ValueError, KeyError):
+            pass
+    print(f"📦 Construindo snapshot do dataset: {snapshot_file}")
+    build_snapshot(data_dir, snapshot_file, json_backend)
+    if cached:
+        prune_snapshots(snapshot_file.parent)
+    return DatasetSnapshot(snapshot_file)
\ No newline at end of file
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tabela de efetividade de tipos (11_type_effectiveness.json) como matriz NxN sobre os tipos
+de 02_type.json, e o cálculo das fraquezas de todos os pokémons a partir de type_ids.
+
+Os multiplicadores são 0 ou potências de 2 (0.5, 2...): a matriz guarda os expoentes (log2)
+e as imunidades à parte. O multiplicador de um pokémon com vários tipos é 2 ** (soma dos
+expoentes), ou 0 se algum tipo for imune, então as fraquezas de todos os pokémons saem de
+um único produto de matrizes inteiras: (pokémons x tipos) @ (tipos x tipos atacantes).
+Usa NumPy quando instalado; sem ele, o mesmo cálculo é feito em Python puro.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import numpy
+except ImportError:  # Dependência opcional
+    numpy = None
+
+@dataclass
+class TypeChart:
+    """Matriz de efetividade: exponents[atacante][defensor] = log2(multiplicador), fora as imunidades."""
+    type_ids: List[Any]
+    names: Dict[str, Any]
+    exponents: List[List[int]]
+    immune: List[List[bool]]
+    
+    def __post_init__(self):
+        self.position = {type_id: index for index, type_id in enumerate(self.type_ids)}
+
+def multiplier_exponent(multiplier: Any) -> int:
+    """log2 de um multiplicador positivo; ValueError se não for potência de 2."""
+    if multiplier.__class__ not in (int, float) or multiplier <= 0:
+        raise ValueError(f"multiplicador inválido: {multiplier!r}")
+    exponent = math.log2(multiplier)
+    if not exponent.is_integer():
+        raise ValueError(f"multiplicador inválido: {multiplier!r} (use 0 ou potências de 2)")
+    return int(exponent)
+
+def build_type_chart(type_records: List[Dict[str, Any]],
+                     effectiveness_records: Iterable[Dict[str, Any]]) -> TypeChart:
+    """
+    Monta a matriz a partir dos tipos (ordem de 02_type.json) e dos multiplicadores diferentes
+    de 1. Tipos desconhecidos, pares repetidos e multiplicadores inválidos geram ValueError.
+    """
+    type_ids = [record.get('id') for record in type_records]
+    names = {record.get('name'): record.get('id') for record in type_records}
+    size = len(type_ids)
+    chart = TypeChart(type_ids, names, [[0] * size for _ in range(size)], [[False] * size for _ in range(size)])
+    
+    seen: Set[Tuple[Any, Any]] = set()
+    for record in effectiveness_records:
+        pair = (record.get('attacking_type_id'), record.get('defending_type_id'))
+        if pair in seen:
+            raise ValueError(f"par de tipos repetido: {pair[0]} -> {pair[1]}")
+        seen.add(pair)
+        attacking, defending = chart.position.get(pair[0]), chart.position.get(pair[1])
+        if attacking is None or defending is None:
+            raise ValueError(f"tipo inexistente em 02_type.json: {pair[0]} -> {pair[1]}")
+        multiplier = record.get('multiplier')
+        if multiplier == 0:
+            chart.immune[attacking][defending] = True
+        else:
+            try:
+                chart.exponents[attacking][defending] = multiplier_exponent(multiplier)
+            except ValueError as e:
+                raise ValueError(f"{pair[0]} -> {pair[1]}: {e}") from None
+    return chart
+
+def type_positions(chart: TypeChart, pokemon_records: List[Dict[str, Any]]) -> List[List[int]]:
+    """Posições na matriz dos tipos de cada pokémon (sem repetição; tipos desconhecidos são ignorados)."""
+    position = chart.position
+    return [
+        list(dict.fromkeys(position[type_id] for type_id in record.get('type_ids') or [] if type_id in position))
+        for record in pokemon_records
+    ]
+
+def compute_weaknesses(chart: TypeChart, pokemon_records: List[Dict[str, Any]]) -> List[Tuple[Any, Any, float]]:
+    """
+    (pokemon_id, tipo atacante, multiplicador) de cada fraqueza (multiplicador > 1),
+    ordenadas por pokémon e pela ordem dos tipos em 02_type.json.
+    """
+    pokemon_records = list(pokemon_records)
+    positions = type_positions(chart, pokemon_records)
+    pokemon_ids = [record.get('id') for record in pokemon_records]
+    type_ids = chart.type_ids
+    if not pokemon_records or not type_ids:
+        return []
+    
+    if numpy is not None:
+        incidence = numpy.zeros((len(pokemon_records), len(type_ids)), dtype=numpy.int64)
+        for row, columns in enumerate(positions):
+            incidence[row, columns] = 1
+        exponents = incidence @ numpy.array(chart.exponents, dtype=numpy.int64).T
+        immune = incidence @ numpy.array(chart.immune, dtype=numpy.int64).T
+        rows, columns = numpy.nonzero((exponents > 0) & (immune == 0))
+        return [(pokemon_ids[row], type_ids[column], float(2 ** int(exponent)))
+                for row, column, exponent in zip(rows.tolist(), columns.tolist(),
+                                                  exponents[rows, columns].tolist())]
+    
+    weaknesses = []
+    for pokemon_id, columns in zip(pokemon_ids, positions):
+        for attacking, type_id in enumerate(type_ids):
+            exponent_row = chart.exponents[attacking]
+            immune_row = chart.immune[attacking]
+            if any(immune_row[column] for column in columns):
+                continue
+            exponent = sum(exponent_row[column] for column in columns)
+            if exponent > 0:
+                weaknesses.append((pokemon_id, type_id, float(2 ** exponent)))
+    return weaknesses
+
+def weaknesses_by_pokemon(rows: Iterable[Tuple[Any, ...]]) -> Dict[Any, Set[Any]]:
+    indexed: Dict[Any, Set[Any]] = {}
+    for row in rows:
+        indexed.setdefault(row[0], set()).add(row[1])
+    return indexed
+
+def cross_check_weaknesses(chart: TypeChart, computed: List[Tuple[Any, ...]],
+                           weakness_records: Optional[List[Dict[str, Any]]] = None,
+                           pokemon_records: Optional[List[Dict[str, Any]]] = None
+                           ) -> Tuple[List[Tuple[Any, Set[Any], Set[Any]]], List[Tuple[Any, str]]]:
+    """
+    Compara as fraquezas calculadas com as dos JSONs (nomes de tipo de 10_weaknesses.json,
+    resolvidos pelos nomes de 02_type.json, e weaknesses[].type_id de 09_pokemon.json).
+    Retorna (pokemon_id, faltando nos JSONs, só nos JSONs) de cada pokémon divergente e os
+    nomes de tipo desconhecidos. Só pokémons de pokemon_records com fraquezas nos JSONs são comparados.
+    """
+    listed: Dict[Any, Set[Any]] = {}
+    unknown_names = []
+    for record in weakness_records or []:
+        pokemon_id = record.get('pokemon_id')
+        for name in record.get('weaknesses') or []:
+            type_id = chart.names.get(name)
+            if type_id is None:
+                unknown_names.append((pokemon_id, name))
+            else:
+                listed.setdefault(pokemon_id, set()).add(type_id)
+    for record in pokemon_records or []:
+        for weakness in record.get('weaknesses') or []:
+            if isinstance(weakness, dict) and weakness.get('type_id') is not None:
+                listed.setdefault(record.get('id'), set()).add(weakness['type_id'])
+    
+    calculated = weaknesses_by_pokemon(computed)
+    known_ids = {record.get('id') for record in pokemon_records or []}
+    mismatches = []
+    for pokemon_id, types in listed.items():
+        if pokemon_id not in known_ids:
+            continue  # Sem registro em 09_pokemon.json (a FK é verificada à parte)
+        expected = calculated.get(pokemon_id, set())
+        if types != expected:
+            mismatches.append((pokemon_id, expected - types, types - expected))
+    return mismatches, unknown_names
\ No newline at end of file
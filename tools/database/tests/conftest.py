@@ -0,0 +1,26 @@
+"""
+Configuração dos testes das ferramentas de seed (python3 -m pytest tools/database/tests).
+Os scripts de tools/database se importam pelo nome, como quando executados diretamente.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(TOOLS_DIR))
+
+from seed_schema import PROJECT_ROOT  # noqa: E402
+
+DATA_DIR = PROJECT_ROOT / "data" / "json"
+
+@pytest.fixture(scope="session")
+def data_dir() -> Path:
+    """Dataset real (data/json)."""
+    return DATA_DIR
+
+@pytest.fixture(autouse=True)
+def reproducible_output(monkeypatch):
+    """Data fixa no cabeçalho do SQL, para comparar saídas byte a byte."""
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1")
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""Funções comuns dos testes: replay de scripts SQL em SQLite e comparação do conteúdo das tabelas."""
+
+import sqlite3
+
+from load_seed_data import sqlite_schema_script
+from seed_schema import DEFAULT_SCHEMA_FILE
+
+# Colunas geradas pelo banco (SERIAL): não são estáveis entre cargas diferentes
+IGNORED_COLUMNS = {("pokemon_abilities", "id")}
+
+def replay_database(*scripts) -> sqlite3.Connection:
+    """Banco SQLite em memória com o schema.sql, após executar os scripts em ordem."""
+    connection = sqlite3.connect(":memory:", isolation_level=None)
+    connection.executescript(sqlite_schema_script(DEFAULT_SCHEMA_FILE.read_text(encoding="utf-8")))
+    connection.execute("PRAGMA foreign_keys = ON")
+    for script in scripts:
+        connection.executescript(script)
+    return connection
+
+def table_contents(connection):
+    """{tabela: linhas ordenadas}, sem as colunas de IGNORED_COLUMNS."""
+    tables = [row[0] for row in connection.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")]
+    contents = {}
+    for table in tables:
+        columns = [row[1] for row in connection.execute(f"PRAGMA table_info({table})")
+                   if (table, row[1]) not in IGNORED_COLUMNS]
+        rows = connection.execute(f"SELECT {', '.join(columns)} FROM {table}").fetchall()
+        contents[table] = sorted(rows, key=repr)
+    return contents
\ No newline at end of file
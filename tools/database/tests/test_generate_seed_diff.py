@@ -0,0 +1,77 @@
+"""SQL incremental: carga anterior + delta deve ser igual à carga completa da versão nova."""
+
+import json
+import shutil
+
+import pytest
+
+from generate_seed_diff import DatasetVersion, generate_seed_diff
+from generate_sql_from_json import generate_init_data_sql
+from sqlite_replay import replay_database, table_contents
+
+def edit_json(path, change):
+    records = json.loads(path.read_text(encoding="utf-8"))
+    records = change(records) or records
+    path.write_text(json.dumps(records, ensure_ascii=False, indent=2), encoding="utf-8")
+
+@pytest.fixture
+def versions(data_dir, tmp_path):
+    """Versão anterior (data/json) e nova, com alterações, renomeação, remoção e nova efetividade."""
+    old_dir = tmp_path / "old"
+    new_dir = tmp_path / "new"
+    shutil.copytree(data_dir, old_dir)
+    shutil.copytree(data_dir, new_dir)
+    
+    def change_stats(records):
+        records[0]["hp"] += 1
+        records[0]["total"] += 1
+    
+    def rename_ability(records):
+        records[0]["name"] += " (revisada)"
+    
+    def remove_last_pokemon(records):
+        return records[:-1]
+    
+    def change_effectiveness(records):
+        # Fogo (2) contra Grama (5): Bulbasaur deixa de ser fraco a Fogo
+        entry = next(record for record in records
+                     if (record["attacking_type_id"], record["defending_type_id"]) == (2, 5))
+        entry["multiplier"] = 0.5
+    
+    edit_json(new_dir / "07_stats.json", change_stats)
+    edit_json(new_dir / "05_ability.json", rename_ability)
+    edit_json(new_dir / "09_pokemon.json", remove_last_pokemon)
+    edit_json(new_dir / "11_type_effectiveness.json", change_effectiveness)
+    return old_dir, new_dir
+
+def full_sql(data_dir, output_file) -> str:
+    assert generate_init_data_sql(data_dir, output_file, force=True)
+    return output_file.read_text(encoding="utf-8")
+
+def test_delta_matches_full_reload(versions, tmp_path):
+    old_dir, new_dir = versions
+    old_sql = full_sql(old_dir, tmp_path / "old.sql")
+    new_sql = full_sql(new_dir, tmp_path / "new.sql")
+    delta_file = tmp_path / "delta.sql"
+    
+    assert generate_seed_diff(DatasetVersion(old_dir), DatasetVersion(new_dir), delta_file)
+    delta_sql = delta_file.read_text(encoding="utf-8")
+    
+    patched = replay_database(old_sql, delta_sql)
+    reloaded = replay_database(new_sql)
+    assert patched.execute("PRAGMA foreign_key_check").fetchall() == []
+    assert table_contents(patched) == table_contents(reloaded)
+    assert table_contents(patched) != table_contents(replay_database(old_sql))
+    
+    # Reaplicar o delta não altera o resultado
+    patched.executescript(delta_sql)
+    assert table_contents(patched) == table_contents(reloaded)
+
+def test_unchanged_versions_produce_empty_delta(data_dir, tmp_path):
+    delta_file = tmp_path / "delta.sql"
+    
+    assert generate_seed_diff(DatasetVersion(data_dir), DatasetVersion(data_dir), delta_file)
+    
+    old_sql = full_sql(data_dir, tmp_path / "old.sql")
+    patched = replay_database(old_sql, delta_file.read_text(encoding="utf-8"))
+    assert table_contents(patched) == table_contents(replay_database(old_sql))
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""Carga direta dos JSONs em SQLite, comparada com o replay do init-data.sql gerado."""
+
+import json
+import shutil
+
+import pytest
+
+from generate_sql_from_json import generate_init_data_sql
+from load_seed_data import SqliteTarget, load_seed_data
+from seed_schema import DEFAULT_SCHEMA_FILE
+from sqlite_replay import replay_database, table_contents
+
+class OpenSqliteTarget(SqliteTarget):
+    """SqliteTarget em :memory: que mantém a conexão aberta após a carga, para inspeção."""
+    
+    def __init__(self):
+        super().__init__(":memory:")
+    
+    def close(self) -> None:
+        pass
+
+def load(data_dir, **options):
+    target = OpenSqliteTarget()
+    success = load_seed_data(target, data_dir, schema_file=DEFAULT_SCHEMA_FILE, **options)
+    return success, target.conn
+
+@pytest.fixture(scope="module")
+def replayed_contents(data_dir, tmp_path_factory):
+    """Tabelas após executar o init-data.sql gerado do data/json."""
+    output_file = tmp_path_factory.mktemp("sql") / "init-data.sql"
+    assert generate_init_data_sql(data_dir, output_file, force=True)
+    return table_contents(replay_database(output_file.read_text(encoding="utf-8")))
+
+@pytest.mark.parametrize("options", [
+    {},
+    {"batch_size": 7},
+    {"defer_constraints": True},
+    {"rebuild_indexes": True},
+    {"defer_constraints": True, "rebuild_indexes": True, "truncate": True},
+])
+def test_load_matches_generated_sql(data_dir, replayed_contents, options):
+    success, connection = load(data_dir, **options)
+    
+    assert success
+    assert connection.execute("PRAGMA foreign_key_check").fetchall() == []
+    assert table_contents(connection) == replayed_contents
+
+def test_rebuild_indexes_restores_indexes(data_dir):
+    _, reference = load(data_dir)
+    success, connection = load(data_dir, rebuild_indexes=True)
+    query = "SELECT name, sql FROM sqlite_master WHERE type = 'index' ORDER BY name"
+    
+    assert success
+    assert connection.execute(query).fetchall() == reference.execute(query).fetchall()
+
+@pytest.mark.parametrize("defer_constraints", [False, True])
+def test_dangling_reference_rolls_back_everything(data_dir, tmp_path, defer_constraints):
+    dataset = tmp_path / "json"
+    shutil.copytree(data_dir, dataset)
+    pokemon_file = dataset / "09_pokemon.json"
+    records = json.loads(pokemon_file.read_text(encoding="utf-8"))
+    records[-1]["species_id"] = 999999
+    pokemon_file.write_text(json.dumps(records, ensure_ascii=False), encoding="utf-8")
+    
+    success, connection = load(dataset, defer_constraints=defer_constraints)
+    
+    # Nenhuma tabela fica com dados parciais, nem as carregadas antes de pokemons
+    assert not success
+    assert not connection.in_transaction
+    assert all(rows == [] for rows in table_contents(connection).values())
\ No newline at end of file
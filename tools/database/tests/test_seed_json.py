@@ -0,0 +1,62 @@
+"""Parser incremental (backend stream) comparado com json.loads."""
+
+import json
+
+import pytest
+
+from generate_sql_from_json import FILE_TO_TABLE_MAPPING
+from seed_json import JsonArrayReader, load_json_records
+
+# Blocos de 1 caractere cortam strings, escapes e números em todas as posições
+CHUNK_SIZES = [1, 7, 64 * 1024]
+
+DOCUMENTS = {
+    "empty": "[]",
+    "spaced": " \n[ \n1 , 2\t,3 ]\n ",
+    "numbers": "[0, -0, 1.5, -2.25e-3, 1E+10, 123456789012345678901234567890, 1.0]",
+    "strings": r'["a]b", "c,d", "aspas \" e barra \\", "é中", "pokémon", "😀", ""]',
+    "nested": '[{"a": [1, {"b": [[], {}]}], "c": null}, [true, false, null], {"]": "[", ",": ","}]',
+    "not_array": '{"id": 1, "name": "único"}',
+    "scalar": "42",
+}
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("name", sorted(DOCUMENTS))
+def test_stream_matches_json_loads(tmp_path, name, chunk_size):
+    text = DOCUMENTS[name]
+    path = tmp_path / f"{name}.json"
+    path.write_text(text, encoding="utf-8")
+    expected = json.loads(text)
+    
+    reader = JsonArrayReader(path, chunk_size)
+    records = list(reader)
+    
+    assert records == (expected if isinstance(expected, list) else [expected])
+    assert reader.wrapped == (not isinstance(expected, list))
+
+@pytest.mark.parametrize("file_name", sorted(FILE_TO_TABLE_MAPPING))
+def test_stream_matches_json_loads_on_dataset(data_dir, file_name):
+    path = data_dir / file_name
+    expected = json.loads(path.read_text(encoding="utf-8"))
+    
+    assert load_json_records(path, "stream") == expected
+    assert list(JsonArrayReader(path, 97)) == expected
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("text", [
+    '[{"a": 1},\n {"b": 2,}\n]',
+    '[1, 2,\n\n  {"x": tru}]',
+    '[1, 2',
+    '[1 2]',
+])
+def test_stream_errors_report_file_position(tmp_path, text, chunk_size):
+    path = tmp_path / "broken.json"
+    path.write_text(text, encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(text)
+    
+    with pytest.raises(json.JSONDecodeError) as error:
+        list(JsonArrayReader(path, chunk_size))
+    
+    assert (error.value.lineno, error.value.colno, error.value.pos) == \
+        (expected.value.lineno, expected.value.colno, expected.value.pos)
\ No newline at end of file
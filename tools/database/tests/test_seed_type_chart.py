@@ -0,0 +1,62 @@
+"""Fraquezas calculadas pela matriz de efetividade (02_type.json e 11_type_effectiveness.json)."""
+
+import itertools
+import json
+
+import pytest
+
+import seed_type_chart
+from seed_type_chart import build_type_chart, compute_weaknesses
+
+def load(data_dir, file_name):
+    return json.loads((data_dir / file_name).read_text(encoding="utf-8"))
+
+@pytest.fixture(scope="module")
+def type_records(data_dir):
+    return load(data_dir, "02_type.json")
+
+@pytest.fixture(scope="module")
+def chart(data_dir, type_records):
+    return build_type_chart(type_records, load(data_dir, "11_type_effectiveness.json"))
+
+def weaknesses_of(chart, *type_names):
+    """{nome do tipo atacante: multiplicador} de um pokémon com os tipos dados."""
+    names_by_id = {type_id: name for name, type_id in chart.names.items()}
+    pokemon = {"id": 1, "type_ids": [chart.names[name] for name in type_names]}
+    return {names_by_id[type_id]: multiplier for _, type_id, multiplier in compute_weaknesses(chart, [pokemon])}
+
+@pytest.mark.parametrize("type_names,expected", [
+    (("Grama", "Venenoso"), {"Fogo": 2.0, "Gelo": 2.0, "Voador": 2.0, "Psíquico": 2.0}),
+    # Terrestre não aparece: Voador é imune
+    (("Fogo", "Voador"), {"Água": 2.0, "Elétrico": 2.0, "Pedra": 4.0}),
+    (("Água", "Voador"), {"Elétrico": 4.0, "Pedra": 2.0}),
+    (("Fantasma", "Venenoso"), {"Terrestre": 2.0, "Psíquico": 2.0, "Fantasma": 2.0, "Sombrio": 2.0}),
+    (("Elétrico",), {"Terrestre": 2.0}),
+])
+def test_known_weaknesses(chart, type_names, expected):
+    assert weaknesses_of(chart, *type_names) == expected
+
+def test_numpy_matches_pure_python(chart, type_records, monkeypatch):
+    if seed_type_chart.numpy is None:
+        pytest.skip("numpy não instalado")
+    type_ids = [record["id"] for record in type_records]
+    pokemon_records = [
+        {"id": index, "type_ids": list(types)}
+        for index, types in enumerate(itertools.chain(
+            itertools.combinations(type_ids, 1), itertools.permutations(type_ids, 2)), start=1)
+    ]
+    
+    vectorized = compute_weaknesses(chart, pokemon_records)
+    monkeypatch.setattr(seed_type_chart, "numpy", None)
+    
+    assert compute_weaknesses(chart, pokemon_records) == vectorized
+
+@pytest.mark.parametrize("effectiveness,message", [
+    ([{"attacking_type_id": 2, "defending_type_id": 5, "multiplier": 2},
+      {"attacking_type_id": 2, "defending_type_id": 5, "multiplier": 0.5}], "repetido"),
+    ([{"attacking_type_id": 2, "defending_type_id": 99, "multiplier": 2}], "inexistente"),
+    ([{"attacking_type_id": 2, "defending_type_id": 5, "multiplier": 3}], "potências de 2"),
+])
+def test_invalid_effectiveness_raises(type_records, effectiveness, message):
+    with pytest.raises(ValueError, match=message):
+        build_type_chart(type_records, effectiveness)
\ No newline at end of file
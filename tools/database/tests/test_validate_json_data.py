@@ -0,0 +1,46 @@
+"""Validação offline dos JSONs: arquivos com conteúdo inesperado são reportados, sem traceback."""
+
+import shutil
+
+import pytest
+
+import seed_json
+import validate_json_data
+from seed_schema import DEFAULT_SCHEMA_FILE
+from validate_json_data import JsonDatasetValidator
+
+@pytest.fixture
+def dataset(data_dir, tmp_path):
+    """Cópia editável de data/json."""
+    target_dir = tmp_path / "json"
+    shutil.copytree(data_dir, target_dir)
+    return target_dir
+
+def validate(data_dir):
+    validator = JsonDatasetValidator(data_dir, DEFAULT_SCHEMA_FILE)
+    return validator.run_validation(), validator.errors
+
+def test_real_dataset_has_no_errors(data_dir):
+    assert validate(data_dir) == (True, [])
+
+@pytest.mark.parametrize("backend", ["json", "stream"])
+@pytest.mark.parametrize("content", ["42", '"texto"', "null", "[1, 2]"])
+def test_non_object_content_is_reported(dataset, monkeypatch, backend, content):
+    monkeypatch.setattr(validate_json_data, "load_json_data",
+                        lambda file_path: seed_json.load_json_data(file_path, backend))
+    (dataset / "04_generation.json").write_text(content, encoding="utf-8")
+    
+    success, errors = validate(dataset)
+    
+    # Só o arquivo é apontado: as referências a generations não são verificadas
+    assert not success
+    assert errors == ["❌ 04_generation.json: conteúdo não é um array de objetos"]
+
+def test_single_object_is_a_one_record_file(dataset):
+    (dataset / "01_region.json").write_text('{"id": 1, "name": "Kanto"}', encoding="utf-8")
+    
+    success, errors = validate(dataset)
+    
+    # As gerações das demais regiões deixam de ter referência, mas o arquivo é aceito
+    assert not success
+    assert errors and all("01_region.json" not in error for error in errors)
\ No newline at end of file
@@ -9,11 +9,50 @@ Este script conecta ao banco PostgreSQL e verifica:
 - Problemas potenciais
 """
 
+import argparse
+import json
+import math
 import psycopg2
+import psycopg2.pool
+from psycopg2 import sql
 import sys
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 from dataclasses import dataclass
 
+COUNT_MODES = ["exact", "estimate", "sampled"]
+
+# Modo sampled: percentual de páginas lidas com TABLESAMPLE SYSTEM
+DEFAULT_SAMPLE_PERCENT = 1.0
+
+# Modo sampled: tabelas com menos páginas que isto são contadas exatamente (a amostra seria ruído)
+SAMPLED_MIN_PAGES = 1000
+
+# Quantil normal do intervalo de confiança de 95% das contagens amostradas
+CONFIDENCE_Z = 1.96
+
+# Chaves de exemplo reportadas por relacionamento com registros órfãos
+ORPHAN_SAMPLE_SIZE = 5
+
+@dataclass
+class ForeignKey:
+    table: str
+    name: str
+    columns: List[str]
+    ref_table: str
+    ref_columns: List[str]
+
+    @property
+    def label(self) -> str:
+        return f"{self.table}({', '.join(self.columns)}) -> {self.ref_table}({', '.join(self.ref_columns)})"
+
+@dataclass
+class OrphanCheck:
+    relation: ForeignKey
+    orphan_count: int = 0
+    sample_keys: List[str] = None
+    error: str = None
+
 @dataclass
 class TableInfo:
     name: str
@@ -22,10 +61,16 @@ class TableInfo:
     columns: List[str] = None
     foreign_keys: List[str] = None
     has_data: bool = False
+    count_mode: str = "exact"      # Como row_count foi obtido: exact, estimate ou sampled
+    row_count_margin: int = 0      # Margem (±) de 95% de confiança das contagens amostradas
+    estimated_rows: int = 0        # Estatísticas do planner (pg_class.reltuples / n_live_tup)
+    pages: int = 0                 # pg_class.relpages
+    relations: List[ForeignKey] = None
 
 class DatabaseValidator:
     def __init__(self, host='localhost', port=5434, database='pokedex_dev_db', 
-                 user='postgres', password='postgres'):
+                 user='postgres', password='postgres', count_mode='exact',
+                 sample_percent=DEFAULT_SAMPLE_PERCENT, workers=1):
         self.connection_params = {
             'host': host,
             'port': port,
@@ -34,11 +79,16 @@ class DatabaseValidator:
             'password': password
         }
         self.conn = None
+        self.pool = None
+        self.workers = workers
+        self.count_mode = count_mode
+        self.sample_percent = sample_percent
         
         # Ordem esperada das tabelas baseada nas dependências
         self.expected_tables_order = [
             'regions',           # Base - sem dependências
             'types',             # Base - sem dependências  
+            'type_effectiveness', # Depende de: types
             'egg_groups',        # Base - sem dependências
             'generations',       # Depende de: regions
             'abilities',         # Base - sem dependências
@@ -49,13 +99,16 @@ class DatabaseValidator:
             'pokemon_types',     # Depende de: pokemons, types
             'pokemon_abilities', # Depende de: pokemons, abilities
             'pokemon_egg_groups', # Depende de: pokemons, egg_groups
-            'pokemon_weaknesses'  # Depende de: pokemons, types
+            'pokemon_weaknesses', # Depende de: pokemons, types
+            'evolution_edges',    # Depende de: evolution_chains, pokemons
+            'pokemon_cards'       # Depende de: pokemons (modelo de leitura)
         ]
         
         # Contadores esperados mínimos (baseado nos JSONs)
         self.expected_min_counts = {
             'regions': 10,
             'types': 18,
+            'type_effectiveness': 100,   # Multiplicadores diferentes de 1 entre os 18 tipos
             'egg_groups': 15,
             'generations': 10,
             'abilities': 300,
@@ -67,6 +120,8 @@ class DatabaseValidator:
             'pokemon_abilities': 25,     # Pokémons tem pelo menos 1 habilidade
             'pokemon_egg_groups': 25,    # Pokémons tem pelo menos 1 grupo de ovo
             'pokemon_weaknesses': 20,    # Dados de fraquezas dos tipos
+            'evolution_edges': 10,       # Arestas das cadeias evolutivas
+            'pokemon_cards': 25,         # Uma linha por pokémon
         }
 
     def connect(self) -> bool:
@@ -78,6 +133,10 @@ class DatabaseValidator:
             print(f"   User: {self.connection_params['user']}")
             
             self.conn = psycopg2.connect(**self.connection_params)
+            if self.workers > 1:
+                # Conexões extras para as verificações por tabela em paralelo
+                self.pool = psycopg2.pool.ThreadedConnectionPool(1, self.workers, **self.connection_params)
+                print(f"   Conexões paralelas: {self.workers}")
             print("✅ Conexão estabelecida com sucesso!")
             return True
         except psycopg2.Error as e:
@@ -89,85 +148,272 @@ class DatabaseValidator:
 
     def disconnect(self):
         """Desconecta do banco de dados."""
+        if self.pool:
+            self.pool.closeall()
+            self.pool = None
         if self.conn:
             self.conn.close()
             print("🔌 Conexão fechada.")
 
-    def get_all_tables(self) -> List[str]:
-        """Retorna lista de todas as tabelas no banco."""
+    def get_catalog(self) -> Dict[str, TableInfo]:
+        """
+        Lê existência, colunas e chaves estrangeiras de todas as tabelas do schema
+        public em uma única consulta ao pg_catalog (sem contagem de registros).
+        """
         try:
             with self.conn.cursor() as cursor:
                 cursor.execute("""
-                    SELECT table_name 
-                    FROM information_schema.tables 
-                    WHERE table_schema = 'public' 
-                    AND table_type = 'BASE TABLE'
-                    ORDER BY table_name;
+                    SELECT
+                        c.relname,
+                        ARRAY(
+                            SELECT a.attname
+                            FROM pg_attribute a
+                            WHERE a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+                            ORDER BY a.attnum
+                        ) AS columns,
+                        COALESCE((
+                            SELECT json_agg(json_build_object(
+                                'name', con.conname,
+                                'columns', ARRAY(
+                                    SELECT la.attname
+                                    FROM unnest(con.conkey) WITH ORDINALITY AS k(attnum, position)
+                                    JOIN pg_attribute la ON la.attrelid = con.conrelid AND la.attnum = k.attnum
+                                    ORDER BY k.position
+                                ),
+                                'ref_table', rt.relname,
+                                'ref_columns', ARRAY(
+                                    SELECT ra.attname
+                                    FROM unnest(con.confkey) WITH ORDINALITY AS k(attnum, position)
+                                    JOIN pg_attribute ra ON ra.attrelid = con.confrelid AND ra.attnum = k.attnum
+                                    ORDER BY k.position
+                                )
+                            ) ORDER BY con.conname)
+                            FROM pg_constraint con
+                            JOIN pg_class rt ON rt.oid = con.confrelid
+                            WHERE con.conrelid = c.oid AND con.contype = 'f'
+                        ), '[]'::json)::text AS relations,
+                        CASE WHEN c.reltuples > 0 THEN c.reltuples::bigint
+                             ELSE pg_stat_get_live_tuples(c.oid) END AS estimated_rows,
+                        c.relpages
+                    FROM pg_class c
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    WHERE n.nspname = 'public'
+                    AND c.relkind IN ('r', 'p')
+                    ORDER BY c.relname;
                 """)
-                return [row[0] for row in cursor.fetchall()]
+                catalog = {}
+                for name, columns, relations, estimated_rows, pages in cursor.fetchall():
+                    relations = [ForeignKey(table=name, **relation) for relation in json.loads(relations)]
+                    foreign_keys = sorted({
+                        f"{column} -> {relation.ref_table}.{ref_column}"
+                        for relation in relations
+                        for column, ref_column in zip(relation.columns, relation.ref_columns)
+                    })
+                    catalog[name] = TableInfo(name=name, exists=True, columns=list(columns),
+                                              foreign_keys=foreign_keys, relations=relations,
+                                              estimated_rows=int(estimated_rows), pages=pages)
+                return catalog
         except psycopg2.Error as e:
-            print(f"❌ ERRO: Falha ao obter lista de tabelas: {e}")
-            return []
+            print(f"❌ ERRO: Falha ao ler o catálogo do banco: {e}")
+            return {}
 
-    def get_table_info(self, table_name: str) -> TableInfo:
-        """Retorna informações detalhadas sobre uma tabela."""
-        info = TableInfo(name=table_name)
+    def count_rows(self, table_names: List[str], conn=None) -> Dict[str, int]:
+        """Conta os registros de várias tabelas em um único comando (UNION ALL)."""
+        if not table_names:
+            return {}
         
+        query = sql.SQL(" UNION ALL ").join(
+            sql.SQL("SELECT {}, COUNT(*) FROM {}").format(sql.Literal(name), sql.Identifier(name))
+            for name in table_names
+        )
         try:
-            with self.conn.cursor() as cursor:
-                # Verifica se a tabela existe
-                cursor.execute("""
-                    SELECT COUNT(*) 
-                    FROM information_schema.tables 
-                    WHERE table_schema = 'public' 
-                    AND table_name = %s;
-                """, (table_name,))
-                
-                info.exists = cursor.fetchone()[0] > 0
-                
-                if not info.exists:
-                    return info
-                
-                # Conta registros na tabela
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name};")
-                info.row_count = cursor.fetchone()[0]
-                info.has_data = info.row_count > 0
-                
-                # Obtém colunas da tabela
-                cursor.execute("""
-                    SELECT column_name 
-                    FROM information_schema.columns 
-                    WHERE table_schema = 'public' 
-                    AND table_name = %s
-                    ORDER BY ordinal_position;
-                """, (table_name,))
-                info.columns = [row[0] for row in cursor.fetchall()]
-                
-                # Obtém chaves estrangeiras
-                cursor.execute("""
-                    SELECT DISTINCT
-                        tc.constraint_name,
-                        kcu.column_name,
-                        ccu.table_name AS foreign_table_name,
-                        ccu.column_name AS foreign_column_name
-                    FROM information_schema.table_constraints AS tc
-                    JOIN information_schema.key_column_usage AS kcu
-                        ON tc.constraint_name = kcu.constraint_name
-                        AND tc.table_schema = kcu.table_schema
-                    JOIN information_schema.constraint_column_usage AS ccu
-                        ON ccu.constraint_name = tc.constraint_name
-                        AND ccu.table_schema = tc.table_schema
-                    WHERE tc.constraint_type = 'FOREIGN KEY'
-                        AND tc.table_name = %s;
-                """, (table_name,))
-                
-                fks = cursor.fetchall()
-                info.foreign_keys = [f"{row[1]} -> {row[2]}.{row[3]}" for row in fks]
-                
+            with (conn or self.conn).cursor() as cursor:
+                cursor.execute(query)
+                return dict(cursor.fetchall())
         except psycopg2.Error as e:
-            print(f"❌ ERRO: Falha ao obter informações da tabela {table_name}: {e}")
-            
-        return info
+            print(f"❌ ERRO: Falha ao contar registros das tabelas: {e}")
+            return {}
+
+    def sample_rows(self, table_names: List[str], conn=None) -> Dict[str, int]:
+        """Conta as linhas de uma amostra de páginas (TABLESAMPLE SYSTEM) de cada tabela."""
+        if not table_names:
+            return {}
+        
+        query = sql.SQL(" UNION ALL ").join(
+            sql.SQL("SELECT {}, COUNT(*) FROM {} TABLESAMPLE SYSTEM ({})").format(
+                sql.Literal(name), sql.Identifier(name), sql.Literal(self.sample_percent))
+            for name in table_names
+        )
+        try:
+            with (conn or self.conn).cursor() as cursor:
+                cursor.execute(query)
+                return dict(cursor.fetchall())
+        except psycopg2.Error as e:
+            print(f"❌ ERRO: Falha ao amostrar registros das tabelas: {e}")
+            return {}
+
+    def tables_with_rows(self, table_names: List[str], conn=None) -> Dict[str, bool]:
+        """Verifica se as tabelas têm ao menos uma linha (EXISTS, sem varrer a tabela)."""
+        if not table_names:
+            return {}
+        
+        query = sql.SQL(" UNION ALL ").join(
+            sql.SQL("SELECT {}, EXISTS (SELECT 1 FROM {})").format(sql.Literal(name), sql.Identifier(name))
+            for name in table_names
+        )
+        try:
+            with (conn or self.conn).cursor() as cursor:
+                cursor.execute(query)
+                return dict(cursor.fetchall())
+        except psycopg2.Error as e:
+            print(f"❌ ERRO: Falha ao verificar dados das tabelas: {e}")
+            return {}
+
+    def find_orphans(self, relations: List[ForeignKey], conn=None) -> Dict[str, OrphanCheck]:
+        """
+        Conta, com um anti-join por relacionamento, as linhas cuja FK não encontra a linha referenciada
+        (linhas com alguma coluna da FK nula são ignoradas, como no MATCH SIMPLE do PostgreSQL).
+        Só as contagens e até ORPHAN_SAMPLE_SIZE chaves de exemplo voltam para o Python.
+        """
+        if not relations:
+            return {}
+        
+        selects = []
+        for relation in relations:
+            child = sql.Identifier(relation.table)
+            columns = [sql.SQL("c.{}").format(sql.Identifier(column)) for column in relation.columns]
+            orphan_filter = sql.SQL("{not_null} AND NOT EXISTS (SELECT 1 FROM {parent} p WHERE {match})").format(
+                not_null=sql.SQL(" AND ").join(sql.SQL("{} IS NOT NULL").format(column) for column in columns),
+                parent=sql.Identifier(relation.ref_table),
+                match=sql.SQL(" AND ").join(
+                    sql.SQL("p.{} = {}").format(sql.Identifier(ref_column), column)
+                    for ref_column, column in zip(relation.ref_columns, columns)
+                ),
+            )
+            key = sql.SQL("concat_ws(', ', {})").format(sql.SQL(", ").join(columns))
+            selects.append(sql.SQL(
+                "SELECT {label}, "
+                "(SELECT COUNT(*) FROM {child} c WHERE {orphan_filter}), "
+                "ARRAY(SELECT DISTINCT key FROM "
+                "(SELECT {key} AS key FROM {child} c WHERE {orphan_filter} LIMIT {scan_limit}) orphan_keys "
+                "LIMIT {sample_size})"
+            ).format(label=sql.Literal(relation.label), child=child, orphan_filter=orphan_filter, key=key,
+                     scan_limit=sql.Literal(ORPHAN_SAMPLE_SIZE * 20), sample_size=sql.Literal(ORPHAN_SAMPLE_SIZE)))
+        
+        by_label = {relation.label: relation for relation in relations}
+        try:
+            with (conn or self.conn).cursor() as cursor:
+                cursor.execute(sql.SQL(" UNION ALL ").join(selects))
+                return {
+                    label: OrphanCheck(relation=by_label[label], orphan_count=orphan_count,
+                                       sample_keys=list(sample_keys))
+                    for label, orphan_count, sample_keys in cursor.fetchall()
+                }
+        except psycopg2.Error as e:
+            print(f"❌ ERRO: Falha ao verificar registros órfãos: {e}")
+            return {relation.label: OrphanCheck(relation=relation, error=str(e).strip()) for relation in relations}
+
+    def check_referential_integrity(self, tables_info: Dict[str, TableInfo]) -> List[OrphanCheck]:
+        """
+        Verifica todos os relacionamentos (FKs do catálogo) entre as tabelas esperadas existentes,
+        na ordem das tabelas. Com --workers, cada relacionamento roda em uma conexão do pool.
+        """
+        relations = {
+            relation.label: relation
+            for table_name in self.expected_tables_order
+            if tables_info[table_name].exists
+            for relation in tables_info[table_name].relations or []
+            if relation.ref_table in tables_info and tables_info[relation.ref_table].exists
+        }
+        results = self.run_per_table(
+            lambda labels, conn=None: self.find_orphans([relations[label] for label in labels], conn),
+            list(relations),
+        )
+        return [results[label] for label in relations if label in results]
+
+    def run_per_table(self, check: Callable[..., Dict[str, object]], table_names: List[str]) -> Dict[str, object]:
+        """
+        Executa uma verificação check(table_names, conn) que retorna {tabela: resultado}.
+        Sem pool, roda uma vez para todas as tabelas (um único comando);
+        com --workers, roda uma tabela por tarefa, cada uma com uma conexão do pool.
+        """
+        if not table_names:
+            return {}
+        if self.pool is None:
+            return check(table_names)
+        
+        def run_one(table_name: str) -> Dict[str, object]:
+            conn = self.pool.getconn()
+            try:
+                return check([table_name], conn)
+            finally:
+                conn.rollback()
+                self.pool.putconn(conn)
+        
+        results: Dict[str, object] = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for result in executor.map(run_one, table_names):
+                results.update(result)
+        return results
+
+    def apply_row_counts(self, tables_info: Dict[str, TableInfo]) -> None:
+        """
+        Preenche row_count/has_data conforme o modo de contagem:
+        - exact: COUNT(*) de cada tabela
+        - estimate: estatísticas do planner (reltuples / n_live_tup), sem ler as tabelas
+        - sampled: COUNT(*) sobre TABLESAMPLE SYSTEM extrapolado, com margem de 95% de confiança;
+          tabelas pequenas (< SAMPLED_MIN_PAGES páginas) são contadas exatamente
+        Nos modos aproximados, uma contagem zero é confirmada com EXISTS antes de a tabela ser dada como vazia.
+        """
+        existing = [info for info in tables_info.values() if info.exists]
+        
+        if self.count_mode == "estimate":
+            exact, sampled = [], []
+            for info in existing:
+                info.count_mode = "estimate"
+                info.row_count = info.estimated_rows
+        elif self.count_mode == "sampled":
+            exact = [info for info in existing if info.pages < SAMPLED_MIN_PAGES]
+            sampled = [info for info in existing if info.pages >= SAMPLED_MIN_PAGES]
+        else:
+            exact, sampled = existing, []
+        
+        counts = self.run_per_table(self.count_rows, [info.name for info in exact])
+        for info in exact:
+            info.row_count = counts.get(info.name, 0)
+        
+        fraction = self.sample_percent / 100
+        sample_counts = self.run_per_table(self.sample_rows, [info.name for info in sampled])
+        for info in sampled:
+            sample_count = sample_counts.get(info.name, 0)
+            info.count_mode = "sampled"
+            info.row_count = round(sample_count / fraction)
+            # Aproximação binomial: Var(amostra) ≈ n·(1 - f), extrapolada por 1/f
+            info.row_count_margin = math.ceil(CONFIDENCE_Z * math.sqrt(max(sample_count, 1) * (1 - fraction)) / fraction)
+        
+        for info in existing:
+            info.has_data = info.row_count > 0
+        
+        unconfirmed = [info.name for info in existing if info.count_mode != "exact" and not info.has_data]
+        for name, has_rows in self.run_per_table(self.tables_with_rows, unconfirmed).items():
+            tables_info[name].has_data = has_rows
+
+    def get_tables_info(self, table_names: List[str],
+                        catalog: Optional[Dict[str, TableInfo]] = None) -> Dict[str, TableInfo]:
+        """
+        Retorna informações detalhadas sobre várias tabelas com duas consultas:
+        uma ao catálogo (ou o catálogo já lido) e uma com as contagens de todas as tabelas existentes
+        (no modo de contagem configurado).
+        """
+        if catalog is None:
+            catalog = self.get_catalog()
+        tables_info = {name: catalog.get(name, TableInfo(name=name)) for name in table_names}
+        self.apply_row_counts(tables_info)
+        return tables_info
+
+    def get_table_info(self, table_name: str) -> TableInfo:
+        """Retorna informações detalhadas sobre uma tabela."""
+        return self.get_tables_info([table_name])[table_name]
 
     def validate_table_dependencies(self, tables_info: Dict[str, TableInfo]) -> List[str]:
         """Valida se as dependências entre tabelas estão corretas."""
@@ -176,12 +422,15 @@ class DatabaseValidator:
         # Verifica se tabelas base têm dados antes das dependentes
         dependencies = {
             'generations': ['regions'],
+            'type_effectiveness': ['types'],
             'species': ['generations'],  
             'pokemons': ['stats', 'generations', 'species', 'regions', 'evolution_chains'],
             'pokemon_types': ['pokemons', 'types'],
             'pokemon_abilities': ['pokemons', 'abilities'],
             'pokemon_egg_groups': ['pokemons', 'egg_groups'],
-            'pokemon_weaknesses': ['pokemons']
+            'pokemon_weaknesses': ['pokemons'],
+            'evolution_edges': ['evolution_chains', 'pokemons'],
+            'pokemon_cards': ['pokemons']
         }
         
         for table, deps in dependencies.items():
@@ -208,24 +457,29 @@ class DatabaseValidator:
                 continue
                 
             # Verifica se tem pelo menos o mínimo esperado
+            # (em contagens amostradas, só quando nem o limite superior do intervalo atinge o mínimo)
             if table_name in self.expected_min_counts:
                 min_expected = self.expected_min_counts[table_name]
-                if info.row_count < min_expected:
-                    issues.append(f"⚠️  AVISO: Tabela {table_name} tem apenas {info.row_count} registros (esperado pelo menos {min_expected})")
+                if info.row_count + info.row_count_margin < min_expected:
+                    issues.append(f"⚠️  AVISO: Tabela {table_name} tem apenas {format_row_count(info)} (esperado pelo menos {min_expected})")
         
         return issues
 
     def run_validation(self) -> bool:
         """Executa a validação completa do banco."""
         print("🚀 Iniciando validação do banco de dados...")
+        if self.count_mode != "exact":
+            print(f"🔢 Modo de contagem: {self.count_mode}" +
+                  (f" ({self.sample_percent}% das páginas)" if self.count_mode == "sampled" else ""))
         print("=" * 60)
         
         if not self.connect():
             return False
         
         try:
-            # Obtém todas as tabelas do banco
-            existing_tables = self.get_all_tables()
+            # Lê o catálogo uma única vez (existência, colunas e FKs de todas as tabelas)
+            catalog = self.get_catalog()
+            existing_tables = sorted(catalog)
             print(f"📊 Tabelas encontradas no banco: {len(existing_tables)}")
             
             if existing_tables:
@@ -236,18 +490,17 @@ class DatabaseValidator:
             
             print("\n" + "=" * 60)
             
-            # Coleta informações de todas as tabelas esperadas
-            tables_info = {}
+            # Coleta informações de todas as tabelas esperadas (contagens em um único comando)
+            tables_info = self.get_tables_info(self.expected_tables_order, catalog)
             
             print("📋 Analisando tabelas esperadas:")
             print("-" * 40)
             
             for table_name in self.expected_tables_order:
-                info = self.get_table_info(table_name)
-                tables_info[table_name] = info
+                info = tables_info[table_name]
                 
                 status = "✅" if info.exists and info.has_data else "❌" if not info.exists else "⚠️ "
-                data_status = f"{info.row_count} registros" if info.exists else "N/A"
+                data_status = format_row_count(info) if info.exists else "N/A"
                 
                 print(f"{status} {table_name:<20} | {data_status:<15} | Existe: {info.exists}")
             
@@ -256,6 +509,29 @@ class DatabaseValidator:
             if extra_tables:
                 print(f"\n📋 Tabelas extras encontradas (não esperadas): {', '.join(extra_tables)}")
             
+            print("\n" + "=" * 60)
+            print("🔗 INTEGRIDADE REFERENCIAL (registros órfãos):")
+            print("-" * 40)
+            
+            orphan_checks = self.check_referential_integrity(tables_info)
+            integrity_issues = []
+            for check in orphan_checks:
+                if check.error:
+                    print(f"❌ {check.relation.label}: falha na verificação")
+                    integrity_issues.append(f"❌ Não foi possível verificar {check.relation.label}: {check.error}")
+                elif check.orphan_count:
+                    examples = ", ".join(f"({key})" for key in check.sample_keys)
+                    print(f"❌ {check.relation.label}: {check.orphan_count} órfão(s), ex.: {examples}")
+                    integrity_issues.append(
+                        f"❌ {check.relation.table} tem {check.orphan_count} registro(s) órfão(s) em "
+                        f"{', '.join(check.relation.columns)} sem correspondência em {check.relation.ref_table} "
+                        f"(ex.: {examples})"
+                    )
+                else:
+                    print(f"✅ {check.relation.label}")
+            if not orphan_checks:
+                print("⚠️  Nenhum relacionamento encontrado entre as tabelas esperadas")
+            
             print("\n" + "=" * 60)
             print("🔍 DIAGNÓSTICO DE PROBLEMAS:")
             print("-" * 40)
@@ -264,13 +540,14 @@ class DatabaseValidator:
             data_issues = self.analyze_data_issues(tables_info)
             dependency_issues = self.validate_table_dependencies(tables_info)
             
-            all_issues = data_issues + dependency_issues
+            all_issues = data_issues + dependency_issues + integrity_issues
             
             if not all_issues:
                 print("✅ PERFEITO: Nenhum problema encontrado!")
                 print("   ✓ Todas as tabelas existem")
                 print("   ✓ Todas as tabelas possuem dados")
                 print("   ✓ Dependências estão corretas")
+                print("   ✓ Nenhum registro órfão")
             else:
                 print(f"⚠️  {len(all_issues)} problema(s) encontrado(s):")
                 for issue in all_issues:
@@ -288,7 +565,8 @@ class DatabaseValidator:
             print(f"📋 Tabelas esperadas: {total_tables}")
             print(f"✅ Tabelas existentes: {existing_count}")
             print(f"📊 Tabelas com dados: {with_data_count}")
-            print(f"📈 Total de registros: {total_records}")
+            approximate = any(info.count_mode != "exact" for info in tables_info.values())
+            print(f"📈 Total de registros: {'~' if approximate else ''}{total_records}")
             print(f"⚠️  Problemas encontrados: {len(all_issues)}")
             
             success_rate = (with_data_count / total_tables) * 100
@@ -299,12 +577,40 @@ class DatabaseValidator:
         finally:
             self.disconnect()
 
+def format_row_count(info: TableInfo) -> str:
+    """Contagem de registros indicando quando é aproximada."""
+    if info.count_mode == "estimate":
+        return f"~{info.row_count} registros"
+    if info.count_mode == "sampled":
+        return f"{info.row_count} ±{info.row_count_margin} registros"
+    return f"{info.row_count} registros"
+
+def parse_args() -> argparse.Namespace:
+    """Lê os argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(description="Valida a estrutura e os dados do banco da Pokédex.")
+    parser.add_argument("--count-mode", choices=COUNT_MODES, default="exact",
+                        help="exact: COUNT(*) (padrão); estimate: estatísticas do planner, sem ler as tabelas; "
+                             "sampled: TABLESAMPLE com margem de 95%% de confiança")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Conexões paralelas para as verificações por tabela (padrão: 1, serial)")
+    parser.add_argument("--sample-percent", type=float, default=DEFAULT_SAMPLE_PERCENT,
+                        help=f"Percentual de páginas amostradas no modo sampled (padrão: {DEFAULT_SAMPLE_PERCENT})")
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers deve ser >= 1")
+    if not 0 < args.sample_percent <= 100:
+        parser.error("--sample-percent deve estar entre 0 (exclusivo) e 100")
+    return args
+
 def main():
     """Função principal."""
+    args = parse_args()
+    
     print("🗃️  VALIDADOR DE BANCO DE DADOS - POKÉDEX BFF")
     print("=" * 60)
     
-    validator = DatabaseValidator()
+    validator = DatabaseValidator(count_mode=args.count_mode, sample_percent=args.sample_percent,
+                                  workers=args.workers)
     success = validator.run_validation()
     
     print("\n" + "=" * 60)
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Validação offline dos JSONs de dados (data/json), antes da geração do SQL.
+Carrega os arquivos, monta os índices de IDs de cada um em uma passada e verifica:
+- Chaves primárias duplicadas (repetições nas tabelas de relacionamento geradas são avisos: o gerador as descarta)
+- Referências entre arquivos (species_id, ability_id, type_ids, fraquezas por nome de tipo...)
+- A tabela de efetividade de tipos e as fraquezas dos JSONs contra as calculadas a partir dela
+- Colunas obrigatórias (NOT NULL) sem valor e campos dos JSONs sem coluna no schema.sql
+Tudo em memória, sem banco: roda em milissegundos antes de cada generate-data.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from generate_sql_from_json import (
+    FILE_TO_TABLE_MAPPING,
+    TYPE_NAME_TO_ID,
+    compile_row_encoder,
+)
+from seed_json import JsonArrayFile, load_json_data
+from seed_schema import DEFAULT_SCHEMA_FILE, SchemaModel, load_schema_model
+from seed_type_chart import build_type_chart, compute_weaknesses, cross_check_weaknesses
+
+# Listas de referências nos registros de pokémon: (campo, subcampo do item, tabela de relacionamento, tabela referenciada)
+LIST_REFERENCES = [
+    ("type_ids", None, "pokemon_types", "types"),
+    ("abilities", "ability_id", "pokemon_abilities", "abilities"),
+    ("egg_group_ids", None, "pokemon_egg_groups", "egg_groups"),
+    ("weaknesses", "type_id", "pokemon_weaknesses", "types"),
+]
+
+# Campos dos JSONs que o gerador converte em outras colunas ou tabelas
+CONSUMED_FIELDS = {
+    "pokemons": {"gender", "type_ids", "abilities", "egg_group_ids", "weaknesses"},
+    "evolution_chains": {"chain"},
+    "pokemon_weaknesses": {"id", "pokemon_name", "weaknesses"},
+}
+
+# Máximo de exemplos listados por problema
+MAX_EXAMPLES = 5
+
+def iter_chain_pokemon_ids(node: Any) -> Iterator[Any]:
+    """IDs de pokémon de uma cadeia evolutiva (nós 'pokemon' aninhados em 'evolutions_to')."""
+    if not isinstance(node, dict):
+        return
+    pokemon = node.get('pokemon')
+    if isinstance(pokemon, dict) and 'id' in pokemon:
+        yield pokemon['id']
+    for child in node.get('evolutions_to') or []:
+        yield from iter_chain_pokemon_ids(child)
+
+def format_examples(examples: List[str], total: int) -> str:
+    text = ", ".join(examples[:MAX_EXAMPLES])
+    return text + (f", ... (+{total - MAX_EXAMPLES})" if total > MAX_EXAMPLES else "")
+
+class JsonDatasetValidator:
+    def __init__(self, data_dir: Path, schema_file: Path, snapshot: Optional["DatasetSnapshot"] = None):
+        self.data_dir = data_dir
+        self.schema_file = schema_file
+        self.snapshot = snapshot
+        self.schema: Optional[SchemaModel] = None
+        self.records: Dict[str, List[Dict[str, Any]]] = {}
+        self.ids: Dict[str, Set[Any]] = {}
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+    
+    def load_files(self) -> bool:
+        """
+        Carrega os arquivos (ou os registros do snapshot) e indexa os IDs de cada tabela
+        (uma passada por arquivo). Retorna False se algum arquivo não pôde ser lido.
+        """
+        loaded = True
+        for file_name, table_name in FILE_TO_TABLE_MAPPING.items():
+            table = self.schema.tables.get(table_name) if self.schema else None
+            # Tabelas com chave composta (ex.: type_effectiveness) não têm 'id' nos registros
+            requires_id = table is None or table.primary_key == ['id']
+            file_path = self.data_dir / file_name
+            if not file_path.exists():
+                self.errors.append(f"❌ Arquivo {file_name} não encontrado")
+                loaded = False
+                continue
+            try:
+                data = self.snapshot.records(file_name) if self.snapshot else None
+                if data is None:
+                    data = load_json_data(file_path)
+            except ValueError as e:
+                self.errors.append(f"❌ {file_name}: JSON inválido: {e}")
+                loaded = False
+                continue
+            if isinstance(data, JsonArrayFile):
+                data = list(data)
+            elif isinstance(data, dict):
+                data = [data]
+            # No streaming e no snapshot, um valor solto (ex.: um número) chega como lista de um item
+            if not isinstance(data, list) or (data and not any(isinstance(record, dict) for record in data)):
+                self.errors.append(f"❌ {file_name}: conteúdo não é um array de objetos")
+                loaded = False
+                continue
+            
+            ids: Set[Any] = set()
+            duplicates: List[str] = []
+            for position, record in enumerate(data):
+                if not isinstance(record, dict):
+                    self.errors.append(f"❌ {file_name}: item {position} não é um objeto")
+                    continue
+                record_id = record.get('id')
+                if record_id is None:
+                    if requires_id:
+                        self.errors.append(f"❌ {file_name}: item {position} sem 'id'")
+                elif record_id in ids:
+                    duplicates.append(str(record_id))
+                else:
+                    ids.add(record_id)
+            
+            if duplicates:
+                self.errors.append(f"❌ {table_name}: {len(duplicates)} ID(s) duplicado(s) em {file_name} "
+                                   f"(ex.: {format_examples(duplicates, len(duplicates))})")
+            self.records[table_name] = [record for record in data if isinstance(record, dict)]
+            self.ids[table_name] = ids
+        return loaded
+    
+    def single_column_references(self) -> List[Tuple[str, str, str]]:
+        """(tabela, coluna, tabela referenciada) das FKs de uma coluna entre tabelas com arquivo JSON."""
+        return [
+            (table_name, fk.columns[0], fk.ref_table)
+            for table_name in FILE_TO_TABLE_MAPPING.values()
+            if table_name in self.schema.tables
+            for fk in self.schema.tables[table_name].foreign_keys
+            if len(fk.columns) == 1
+        ]
+    
+    def check_references(self) -> None:
+        """Verifica as FKs do schema entre os arquivos (campo -> id de outra tabela)."""
+        for table_name, field, ref_table in self.single_column_references():
+            if table_name not in self.records or ref_table not in self.ids:
+                continue
+            ref_ids = self.ids[ref_table]
+            missing = [
+                f"{record.get('id', record.get('pokemon_id', f'registro {index}'))} -> {record[field]}"
+                for index, record in enumerate(self.records[table_name])
+                if record.get(field) is not None and record[field] not in ref_ids
+            ]
+            if missing:
+                self.errors.append(f"❌ {table_name}.{field}: {len(missing)} referência(s) sem correspondência "
+                                   f"em {ref_table} (ex.: {format_examples(missing, len(missing))})")
+    
+    def check_pokemon_relationships(self) -> None:
+        """Verifica as listas de relacionamento dos pokémons e as chaves das tabelas geradas a partir delas."""
+        pokemons = self.records.get("pokemons", [])
+        for field, item_key, join_table, ref_table in LIST_REFERENCES:
+            ref_ids = self.ids.get(ref_table, set())
+            missing: List[str] = []
+            duplicates: List[str] = []
+            keys: Set[Tuple[Any, Any]] = set()
+            for record in pokemons:
+                for item in record.get(field) or []:
+                    value = item.get(item_key) if item_key and isinstance(item, dict) else item
+                    if value is None:
+                        continue
+                    if value not in ref_ids:
+                        missing.append(f"{record.get('id')} -> {value}")
+                    # pokemon_abilities tem id próprio: o par (pokemon_id, ability_id) pode se repetir
+                    key = (record.get('id'), value)
+                    if key in keys and join_table != "pokemon_abilities":
+                        duplicates.append(f"{key[0]}/{key[1]}")
+                    keys.add(key)
+            if missing:
+                self.errors.append(f"❌ pokemons.{field}: {len(missing)} referência(s) sem correspondência "
+                                   f"em {ref_table} (ex.: {format_examples(missing, len(missing))})")
+            if duplicates:
+                self.warnings.append(f"⚠️  {join_table}: {len(duplicates)} chave(s) repetida(s) em pokemons.{field}, "
+                                     f"descartada(s) pelo gerador (ex.: {format_examples(duplicates, len(duplicates))})")
+    
+    def check_type_chart(self) -> bool:
+        """
+        Monta a matriz de efetividade (11_type_effectiveness.json sobre os tipos de 02_type.json)
+        e compara as fraquezas calculadas dos type_ids com as dos JSONs. O gerador grava as
+        calculadas: divergências são avisos. Retorna False se não há tabela de efetividade.
+        """
+        if "type_effectiveness" not in self.records:
+            return False
+        types = self.records.get("types", [])
+        try:
+            chart = build_type_chart(types, self.records["type_effectiveness"])
+        except ValueError as e:
+            self.errors.append(f"❌ type_effectiveness: {e}")
+            return True
+        
+        pokemons = self.records.get("pokemons", [])
+        computed = compute_weaknesses(chart, pokemons)
+        mismatches, unknown_names = cross_check_weaknesses(chart, computed, self.records.get("pokemon_weaknesses"),
+                                                           pokemons)
+        names = {record.get('id'): record.get('name') for record in types}
+        
+        def type_names(type_ids) -> str:
+            return ", ".join(str(names.get(type_id, type_id)) for type_id in sorted(type_ids, key=str))
+        
+        if mismatches:
+            details = [
+                f"{pokemon_id} ({' '.join(part for part in [f'+{type_names(missing)}' if missing else '', f'-{type_names(extra)}' if extra else ''] if part)})"
+                for pokemon_id, missing, extra in mismatches
+            ]
+            self.warnings.append(f"⚠️  pokemon_weaknesses: {len(mismatches)} pokémon(s) com fraquezas nos JSONs diferentes "
+                                 f"das calculadas pela tabela de efetividade, que são as gravadas pelo gerador "
+                                 f"(+ calculada e ausente nos JSONs, - só nos JSONs; "
+                                 f"ex.: {format_examples(details, len(details))})")
+        if unknown_names:
+            unknown = [f"{pokemon_id} -> '{name}'" for pokemon_id, name in unknown_names]
+            self.warnings.append(f"⚠️  10_weaknesses.json: {len(unknown)} nome(s) de tipo fora de 02_type.json "
+                                 f"(ex.: {format_examples(unknown, len(unknown))})")
+        return True
+    
+    def check_weaknesses(self) -> None:
+        """
+        Sem tabela de efetividade, verifica os nomes de tipos de 10_weaknesses.json
+        (mapeados por TYPE_NAME_TO_ID; nomes desconhecidos são descartados pelo gerador).
+        """
+        type_ids = self.ids.get("types", set())
+        unmapped_ids = sorted(type_id for type_id in TYPE_NAME_TO_ID.values() if type_id not in type_ids)
+        if type_ids and unmapped_ids:
+            self.errors.append(f"❌ TYPE_NAME_TO_ID aponta para tipos inexistentes em 02_type.json: {unmapped_ids}")
+        
+        type_names = {record.get('name'): record.get('id') for record in self.records.get("types", [])}
+        unlisted = [name for name in TYPE_NAME_TO_ID if type_names and name not in type_names]
+        if unlisted:
+            self.warnings.append(f"⚠️  TYPE_NAME_TO_ID usa nomes ausentes em 02_type.json: {', '.join(unlisted)} "
+                                 f"(02_type.json: {', '.join(str(n) for n in type_names if n not in TYPE_NAME_TO_ID)})")
+        unknown: List[str] = []
+        duplicates: List[str] = []
+        keys: Set[Tuple[Any, Any]] = set()
+        for record in self.records.get("pokemon_weaknesses", []):
+            pokemon_id = record.get('pokemon_id')
+            for name in record.get('weaknesses', []):
+                type_id = TYPE_NAME_TO_ID.get(name)
+                if type_id is None:
+                    unknown.append(f"{pokemon_id} -> '{name}'")
+                    continue
+                if type_names and type_names.get(name) not in (None, type_id):
+                    self.errors.append(f"❌ TYPE_NAME_TO_ID['{name}'] = {type_id}, mas 02_type.json usa id {type_names[name]}")
+                if (pokemon_id, type_id) in keys:
+                    duplicates.append(f"{pokemon_id}/{type_id}")
+                keys.add((pokemon_id, type_id))
+        if unknown:
+            self.errors.append(f"❌ pokemon_weaknesses: {len(unknown)} nome(s) de tipo fora de TYPE_NAME_TO_ID, "
+                               f"seriam descartados (ex.: {format_examples(unknown, len(unknown))})")
+        if duplicates:
+            self.warnings.append(f"⚠️  pokemon_weaknesses: {len(duplicates)} chave(s) (pokemon_id, type_id) repetida(s), "
+                                 f"descartada(s) pelo gerador (ex.: {format_examples(duplicates, len(duplicates))})")
+    
+    def check_evolution_chains(self) -> None:
+        """Verifica os pokémons citados nas cadeias evolutivas (JSONB, sem FK no banco: apenas aviso)."""
+        pokemon_ids = self.ids.get("pokemons", set())
+        missing = [
+            f"cadeia {record.get('id')} -> {pokemon_id}"
+            for record in self.records.get("evolution_chains", [])
+            for pokemon_id in iter_chain_pokemon_ids(record.get('chain'))
+            if pokemon_id not in pokemon_ids
+        ]
+        if missing:
+            self.warnings.append(f"⚠️  evolution_chains: {len(missing)} pokémon(s) citado(s) nas cadeias sem registro "
+                                 f"em 09_pokemon.json (ex.: {format_examples(missing, len(missing))})")
+    
+    def check_columns(self) -> None:
+        """
+        Compara os registros com as colunas do schema.sql: colunas NOT NULL sem valor são erro
+        (o INSERT falharia) e campos sem coluna correspondente são aviso (o gerador os ignora).
+        """
+        for file_name, table_name in FILE_TO_TABLE_MAPPING.items():
+            table = self.schema.tables.get(table_name)
+            if table is None:
+                self.errors.append(f"❌ Tabela {table_name} ({file_name}) não existe no schema.sql")
+                continue
+            records = self.records.get(table_name)
+            if not records:
+                continue
+            
+            if table_name != "pokemon_weaknesses":
+                encoder = compile_row_encoder(table_name, records, self.schema)
+                for column in table.columns:
+                    if not column.required:
+                        continue
+                    if column.name not in encoder.columns:
+                        self.errors.append(f"❌ {table_name}.{column.name}: coluna NOT NULL ausente em {file_name}")
+                        continue
+                    position = encoder.columns.index(column.name)
+                    missing = [str(record.get('id')) for record in records if encoder.extract(record)[position] is None]
+                    if missing:
+                        self.errors.append(f"❌ {table_name}.{column.name}: {len(missing)} registro(s) sem valor "
+                                           f"na coluna NOT NULL (ex.: {format_examples(missing, len(missing))})")
+            
+            known = set(table.column_names) | CONSUMED_FIELDS.get(table_name, set())
+            ignored = list(dict.fromkeys(field for record in records for field in record if field not in known))
+            if ignored:
+                self.warnings.append(f"⚠️  {file_name}: campo(s) sem coluna em {table_name}, ignorado(s) pelo gerador: "
+                                     f"{', '.join(ignored)}")
+    
+    def run_validation(self) -> bool:
+        """Executa todas as verificações e imprime o relatório."""
+        print("🚀 Validando JSONs de dados...")
+        print(f"📁 Diretório de dados: {self.data_dir}")
+        print(f"📐 Schema: {self.schema_file}")
+        if self.snapshot:
+            print(f"📦 Snapshot do dataset: {self.snapshot.snapshot_file}")
+        print("=" * 60)
+        
+        start = time.perf_counter()
+        if not self.schema_file.exists():
+            self.errors.append(f"❌ Schema não encontrado: {self.schema_file}")
+        else:
+            self.schema = load_schema_model(self.schema_file)
+        if self.load_files() and self.schema:
+            self.check_references()
+            self.check_pokemon_relationships()
+            if not self.check_type_chart():
+                self.check_weaknesses()
+            self.check_evolution_chains()
+            self.check_columns()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        
+        total_records = sum(len(records) for records in self.records.values())
+        print(f"📊 {total_records} registros em {len(self.records)} arquivos")
+        
+        if not self.errors and not self.warnings:
+            print("✅ PERFEITO: Nenhum problema encontrado!")
+        for issue in self.errors + self.warnings:
+            print(f"   {issue}")
+        
+        print("=" * 60)
+        print(f"❌ Erros: {len(self.errors)}")
+        print(f"⚠️  Avisos: {len(self.warnings)}")
+        print(f"⏱️  Tempo: {elapsed_ms:.1f} ms")
+        return not self.errors
+
+def parse_args() -> argparse.Namespace:
+    """Lê os argumentos de linha de comando."""
+    project_root = Path(__file__).parent.parent.parent  # Sobe para raiz do projeto
+    
+    parser = argparse.ArgumentParser(description="Valida os JSONs da Pokédex antes da geração do SQL.")
+    parser.add_argument("data_dir", nargs="?", type=Path, default=project_root / "data" / "json",
+                        help="Diretório com os arquivos JSON (padrão: data/json)")
+    parser.add_argument("--schema", type=Path, default=DEFAULT_SCHEMA_FILE,
+                        help="Schema com as colunas e FKs verificadas (padrão: database/schema/schema.sql)")
+    parser.add_argument("--snapshot", action="store_true",
+                        help="Lê os dados do snapshot binário do dataset (build/cache), reconstruído "
+                             "automaticamente quando algum JSON muda")
+    parser.add_argument("--strict", action="store_true", help="Avisos também fazem a validação falhar")
+    return parser.parse_args()
+
+def main():
+    """Função principal."""
+    args = parse_args()
+    
+    if not args.data_dir.exists():
+        print(f"❌ ERRO: Diretório de dados não encontrado: {args.data_dir}")
+        sys.exit(1)
+    
+    snapshot = None
+    if args.snapshot:
+        from seed_snapshot import open_snapshot
+        try:
+            snapshot = open_snapshot(args.data_dir)
+        except Exception as e:
+            # Ex.: JSON inválido; a validação lê os arquivos e aponta o problema
+            print(f"⚠️  AVISO: Snapshot indisponível ({e}); lendo os JSONs diretamente")
+    
+    validator = JsonDatasetValidator(args.data_dir, args.schema, snapshot)
+    success = validator.run_validation()
+    if snapshot:
+        snapshot.close()
+    if args.strict and validator.warnings:
+        success = False
+    
+    sys.exit(0 if success else 1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file